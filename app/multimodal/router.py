@@ -6,7 +6,7 @@ based on their media type (document, image, video).
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from ..config import AutomotiveClaimsSettings
 from . import MEDIA_TYPE_DOCUMENT, MEDIA_TYPE_IMAGE, MEDIA_TYPE_VIDEO
@@ -44,6 +44,16 @@ class RoutingResult:
     detection_confidence: float
 
 
+# MediaType is a str enum, so members and their string values hash alike and
+# both find the member here with one dict lookup
+_MEDIA_TYPES = {member.value: member for member in MediaType}
+
+
+def _as_media_type(media_type: Union[MediaType, str]) -> Optional[MediaType]:
+    """Map a media type string (or MediaType) to its member, or None if unrecognised."""
+    return _MEDIA_TYPES.get(media_type)
+
+
 class AnalyzerRouter:
     """
     Routes files to appropriate Azure Content Understanding analyzers.
@@ -83,14 +93,14 @@ class AnalyzerRouter:
     
     def get_analyzer_id(
         self,
-        media_type: str,
+        media_type: Union[MediaType, str],
         use_fallback: bool = False,
     ) -> str:
         """
         Get the analyzer ID for a given media type.
         
         Args:
-            media_type: The media type ("document", "image", "video")
+            media_type: The MediaType (or its string value "document", "image", "video")
             use_fallback: Force use of prebuilt fallback analyzers
             
         Returns:
@@ -99,19 +109,20 @@ class AnalyzerRouter:
         Raises:
             UnsupportedMediaTypeError: If media type is not supported
         """
+        member = _as_media_type(media_type)
         settings = self.settings
         
-        if media_type == MEDIA_TYPE_DOCUMENT:
+        if member is MediaType.DOCUMENT:
             if use_fallback or not settings.doc_analyzer:
                 return FALLBACK_DOC_ANALYZER
             return settings.doc_analyzer
         
-        if media_type == MEDIA_TYPE_IMAGE:
+        if member is MediaType.IMAGE:
             if use_fallback or not settings.image_analyzer:
                 return FALLBACK_IMAGE_ANALYZER
             return settings.image_analyzer
         
-        if media_type == MEDIA_TYPE_VIDEO:
+        if member is MediaType.VIDEO:
             if use_fallback or not settings.video_analyzer:
                 return FALLBACK_VIDEO_ANALYZER
             return settings.video_analyzer
@@ -124,31 +135,34 @@ class AnalyzerRouter:
     def validate_file_size(
         self,
         file_bytes: bytes,
-        media_type: str,
+        media_type: Union[MediaType, str],
     ) -> None:
         """
         Validate that a file is within size limits.
         
         Args:
             file_bytes: The file content
-            media_type: The detected media type
+            media_type: The detected MediaType (or its string value)
             
+        Unrecognised media types have no size limit.
+        
         Raises:
             FileSizeError: If file exceeds size limit for its type
         """
+        media_type = _as_media_type(media_type)
         file_size_bytes = len(file_bytes)
         file_size_mb = file_size_bytes / (1024 * 1024)
         
         settings = self.settings
         
-        if media_type == MEDIA_TYPE_IMAGE:
+        if media_type is MediaType.IMAGE:
             max_size_mb = settings.image_max_size_mb or DEFAULT_IMAGE_MAX_SIZE_MB
             if file_size_mb > max_size_mb:
                 raise FileSizeError(
                     f"Image file size ({file_size_mb:.1f} MB) exceeds limit of {max_size_mb} MB"
                 )
         
-        if media_type == MEDIA_TYPE_VIDEO:
+        if media_type is MediaType.VIDEO:
             max_size_mb = DEFAULT_VIDEO_MAX_SIZE_MB  # Video size limit not configurable
             if file_size_mb > max_size_mb:
                 raise FileSizeError(
@@ -196,7 +210,7 @@ class AnalyzerRouter:
                 "Supported formats: PDF, DOCX, JPEG, PNG, MP4, MOV, etc."
             )
         
-        media_type = detection.media_type.value
+        media_type = detection.media_type
         
         # Validate file size
         if validate_size:
@@ -208,15 +222,16 @@ class AnalyzerRouter:
         # Determine if using custom analyzer
         settings = self.settings
         is_custom = False
-        if media_type == MEDIA_TYPE_DOCUMENT:
+        if media_type is MediaType.DOCUMENT:
             is_custom = analyzer_id == settings.doc_analyzer
-        elif media_type == MEDIA_TYPE_IMAGE:
+        elif media_type is MediaType.IMAGE:
             is_custom = analyzer_id == settings.image_analyzer
-        elif media_type == MEDIA_TYPE_VIDEO:
+        elif media_type is MediaType.VIDEO:
             is_custom = analyzer_id == settings.video_analyzer
         
+        # External consumers get the plain string value
         return RoutingResult(
-            media_type=media_type,
+            media_type=media_type.value,
             analyzer_id=analyzer_id,
             is_custom_analyzer=is_custom,
             file_size_bytes=len(file_bytes),
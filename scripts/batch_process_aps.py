@@ -6,7 +6,8 @@ Processes APS (Attending Physician Statement) documents through the WorkbenchIQ
 using large document processing mode. Designed for robustness, idempotency, and human review.
 
 Features:
-- Sequential processing to avoid overwhelming Azure OpenAI
+- Sequential processing by default to avoid overwhelming Azure OpenAI
+  (use --max-workers to process several documents concurrently)
 - Idempotent: resumes from where it stopped on restart
 - Generates consolidated CSV for human review
 - Includes risk analysis for each application
@@ -15,6 +16,7 @@ Usage:
     python scripts/batch_process_aps.py --help
     python scripts/batch_process_aps.py --dry-run
     python scripts/batch_process_aps.py
+    python scripts/batch_process_aps.py --max-workers 4
     python scripts/batch_process_aps.py --cleanup  # Remove all created applications
     python scripts/batch_process_aps.py --reset    # Clear progress and start fresh
 """
@@ -22,16 +24,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
 import csv
+import io
 import json
 import os
+import random
+import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # =============================================================================
 # Configuration
@@ -40,9 +50,17 @@ import requests
 DEFAULT_API_URL = "http://localhost:8000"
 DEFAULT_SOURCE_FOLDER = "underwriting-aps-docs"
 DEFAULT_OUTPUT_FOLDER = "batch-review-output"
-DEFAULT_POLL_INTERVAL = 10  # seconds
+DEFAULT_POLL_INTERVAL = 15  # seconds (max delay between status polls)
+INITIAL_POLL_DELAY = 1.0  # seconds (first poll delay, grows up to the max)
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.2  # +/- 20% randomization of each poll delay
 DEFAULT_TIMEOUT = 1800  # 30 minutes
+DEFAULT_MAX_WORKERS = 1  # documents processed concurrently
+HTTP_RETRY_TOTAL = 3  # retries for transient gateway errors and dropped connections
+HTTP_RETRY_BACKOFF = 0.3  # seconds, doubled on each retry
+CLEANUP_WORKERS = 8  # threads used to delete applications and output folders
 PROGRESS_TRACKER_FILENAME = "progress_tracker.csv"
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
 
 # Status values for progress tracking
 STATUS_PENDING = "pending"
@@ -52,13 +70,41 @@ STATUS_RUNNING_RISK = "running_risk"
 STATUS_COMPLETED = "completed"
 STATUS_ERROR = "error"
 
+ALL_STATUSES = (
+    STATUS_PENDING,
+    STATUS_UPLOADED,
+    STATUS_PROCESSING,
+    STATUS_RUNNING_RISK,
+    STATUS_COMPLETED,
+    STATUS_ERROR,
+)
+# Statuses of documents that still have work left
+UNFINISHED_STATUSES = (
+    STATUS_PENDING,
+    STATUS_UPLOADED,
+    STATUS_PROCESSING,
+    STATUS_RUNNING_RISK,
+)
+
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# INFO messages are dropped before any formatting when quiet (--quiet)
+_info_enabled = True
+
+
+def set_quiet(quiet: bool) -> None:
+    """Suppress INFO log messages (warnings, errors and successes still print)."""
+    global _info_enabled
+    _info_enabled = not quiet
+
+
 def log(message: str, level: str = "INFO") -> None:
     """Print a timestamped log message."""
+    if level == "INFO" and not _info_enabled:
+        return
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] [{level}] {message}")
 
@@ -80,7 +126,15 @@ def log_success(message: str) -> None:
 # =============================================================================
 
 class ProgressTracker:
-    """Manages the progress tracking CSV for idempotent processing."""
+    """
+    Manages the progress tracking CSV for idempotent processing.
+    
+    All reads and writes are guarded by a re-entrant lock so the tracker can
+    be shared between worker threads. Updates are written to disk immediately
+    unless ``save=False`` is passed, in which case they are persisted by the
+    next save or an explicit ``flush()``. Per-status counts are maintained as
+    records change so ``get_summary()`` does not scan every record.
+    """
     
     FIELDNAMES = [
         "document_filename",
@@ -91,9 +145,20 @@ class ProgressTracker:
         "error_message",
     ]
     
+    # Positional indexes into a record row (aligned with FIELDNAMES)
+    _IDX_FILENAME = 0
+    _IDX_APP_ID = 1
+    _IDX_STATUS = 2
+    _IDX_STARTED_AT = 3
+    _IDX_COMPLETED_AT = 4
+    _IDX_ERROR = 5
+    
     def __init__(self, output_folder: Path):
         self.filepath = output_folder / PROGRESS_TRACKER_FILENAME
-        self.records: Dict[str, Dict[str, str]] = {}
+        self.records: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._counts: Dict[str, int] = dict.fromkeys(ALL_STATUSES, 0)
         self._load()
     
     def _load(self) -> None:
@@ -101,40 +166,64 @@ class ProgressTracker:
         if not self.filepath.exists():
             return
         
+        width = len(self.FIELDNAMES)
         with open(self.filepath, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
             for row in reader:
-                self.records[row["document_filename"]] = dict(row)
+                if not row:
+                    continue
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                self.records[row[self._IDX_FILENAME]] = row
+        
+        self._recount()
         
         log(f"Loaded {len(self.records)} records from progress tracker")
     
+    def _recount(self) -> None:
+        """Rebuild the per-status counts from the records."""
+        counts = dict.fromkeys(ALL_STATUSES, 0)
+        idx = self._IDX_STATUS
+        for record in self.records.values():
+            status = record[idx]
+            if status in counts:
+                counts[status] += 1
+        self._counts = counts
+    
     def _save(self) -> None:
         """Save progress to CSV."""
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-            writer.writeheader()
-            for record in self.records.values():
-                writer.writerow(record)
+        with self._lock, open(self.filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.FIELDNAMES)
+            writer.writerows(self.records.values())
+            self._dirty = False
+    
+    def flush(self) -> None:
+        """Persist any updates made with ``save=False``."""
+        with self._lock:
+            if self._dirty:
+                self._save()
     
     def get_status(self, filename: str) -> Optional[str]:
         """Get the status of a document."""
-        record = self.records.get(filename)
-        return record["status"] if record else None
+        with self._lock:
+            record = self.records.get(filename)
+            return record[self._IDX_STATUS] if record else None
     
     def get_application_id(self, filename: str) -> Optional[str]:
         """Get the application ID for a document."""
-        record = self.records.get(filename)
-        return record.get("application_id") if record else None
+        with self._lock:
+            record = self.records.get(filename)
+            return record[self._IDX_APP_ID] if record else None
     
     def get_all_application_ids(self) -> List[str]:
         """Get all application IDs from the tracker."""
-        return [
-            r["application_id"] 
-            for r in self.records.values() 
-            if r.get("application_id")
-        ]
+        idx = self._IDX_APP_ID
+        with self._lock:
+            return [r[idx] for r in self.records.values() if r[idx]]
     
     def update(
         self,
@@ -142,43 +231,52 @@ class ProgressTracker:
         status: str,
         application_id: Optional[str] = None,
         error_message: Optional[str] = None,
+        save: bool = True,
     ) -> None:
         """Update the status of a document."""
         now = datetime.now().isoformat()
         
-        if filename not in self.records:
-            self.records[filename] = {
-                "document_filename": filename,
-                "application_id": "",
-                "status": STATUS_PENDING,
-                "started_at": "",
-                "completed_at": "",
-                "error_message": "",
-            }
-        
-        record = self.records[filename]
-        record["status"] = status
-        
-        if application_id:
-            record["application_id"] = application_id
-        
-        if status == STATUS_UPLOADED:
-            record["started_at"] = now
-        
-        if status == STATUS_COMPLETED:
-            record["completed_at"] = now
-            record["error_message"] = ""
-        
-        if status == STATUS_ERROR:
-            record["error_message"] = error_message or "Unknown error"
-        
-        self._save()
+        with self._lock:
+            counts = self._counts
+            record = self.records.get(filename)
+            if record is None:
+                record = [filename, "", STATUS_PENDING, "", "", ""]
+                self.records[filename] = record
+            else:
+                previous = record[self._IDX_STATUS]
+                if previous in counts:
+                    counts[previous] -= 1
+            
+            record[self._IDX_STATUS] = status
+            if status in counts:
+                counts[status] += 1
+            
+            if application_id:
+                record[self._IDX_APP_ID] = application_id
+            
+            if status == STATUS_UPLOADED:
+                record[self._IDX_STARTED_AT] = now
+            
+            if status == STATUS_COMPLETED:
+                record[self._IDX_COMPLETED_AT] = now
+                record[self._IDX_ERROR] = ""
+            
+            if status == STATUS_ERROR:
+                record[self._IDX_ERROR] = error_message or "Unknown error"
+            
+            if save:
+                self._save()
+            else:
+                self._dirty = True
     
     def clear(self) -> None:
         """Clear all progress records."""
-        self.records = {}
-        if self.filepath.exists():
-            self.filepath.unlink()
+        with self._lock:
+            self.records = {}
+            self._dirty = False
+            self._counts = dict.fromkeys(ALL_STATUSES, 0)
+            if self.filepath.exists():
+                self.filepath.unlink()
         log("Progress tracker cleared")
     
     def delete_if_all_complete(self) -> bool:
@@ -186,33 +284,24 @@ class ProgressTracker:
         if not self.records:
             return False
         
-        all_complete = all(
-            r["status"] == STATUS_COMPLETED 
-            for r in self.records.values()
-        )
-        
-        if all_complete and self.filepath.exists():
-            self.filepath.unlink()
-            log_success("All documents completed - progress tracker removed")
-            return True
+        idx = self._IDX_STATUS
+        with self._lock:
+            all_complete = all(
+                r[idx] == STATUS_COMPLETED 
+                for r in self.records.values()
+            )
+            
+            if all_complete and self.filepath.exists():
+                self.filepath.unlink()
+                log_success("All documents completed - progress tracker removed")
+                return True
         
         return False
     
     def get_summary(self) -> Dict[str, int]:
         """Get a summary of document statuses."""
-        summary = {
-            STATUS_PENDING: 0,
-            STATUS_UPLOADED: 0,
-            STATUS_PROCESSING: 0,
-            STATUS_RUNNING_RISK: 0,
-            STATUS_COMPLETED: 0,
-            STATUS_ERROR: 0,
-        }
-        for record in self.records.values():
-            status = record["status"]
-            if status in summary:
-                summary[status] += 1
-        return summary
+        with self._lock:
+            return dict(self._counts)
 
 
 # =============================================================================
@@ -220,11 +309,31 @@ class ProgressTracker:
 # =============================================================================
 
 class WorkbenchAPIClient:
-    """Client for interacting with the WorkbenchIQ API."""
+    """
+    Client for interacting with the WorkbenchIQ API.
+    
+    A single keep-alive session is shared by all worker threads; its connection
+    pool is sized to the number of workers so concurrent requests reuse
+    connections. Idempotent requests (GET/DELETE) are retried with backoff on
+    502/503/504 and connection errors; POSTs are never retried.
+    """
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, pool_size: int = 10):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        retry = Retry(
+            total=HTTP_RETRY_TOTAL,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,  # Let callers see the final response
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def health_check(self) -> bool:
         """Check if the API is reachable."""
@@ -286,154 +395,244 @@ class WorkbenchAPIClient:
             return resp.status_code in (200, 204, 404)
         except requests.RequestException:
             return False
+    
+    def delete_applications(
+        self,
+        app_ids: List[str],
+        max_workers: int = CLEANUP_WORKERS,
+    ) -> Dict[str, bool]:
+        """Delete several applications concurrently. Returns success per ID."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.delete_application, app_ids)
+            return dict(zip(app_ids, results))
 
 
 # =============================================================================
 # CSV Export
 # =============================================================================
 
+# Review CSV columns; the last four are filled in by the human reviewer
+REVIEW_CSV_FIELDNAMES = (
+    "category",
+    "section", 
+    "subsection",
+    "value",
+    "confidence",
+    "source_page",
+    "source_file",
+    "risk_level",
+    "underwriting_action",
+    "policy_citations",
+    "accuracy_rating",
+    "issues_found",
+    "corrections",
+    "reviewer_notes",
+)
+
+# Long LLM summaries and risk findings are truncated to this many characters
+MAX_REVIEW_VALUE_LENGTH = 2000
+
+# Per-section row templates: each row is its populated leading columns plus
+# one of these precomputed empty tails, so rows are built in a single concat.
+_EXTRACTED_ROW_TAIL = ("",) * 7  # risk_level .. reviewer_notes
+_LLM_ROW_TAIL = ("",) * 5  # policy_citations .. reviewer_notes
+_RISK_ROW_TAIL = ("",) * 4  # accuracy_rating .. reviewer_notes
+_RISK_TEXT_ROW_TAIL = ("",) * 10  # confidence .. reviewer_notes
+
+# Document output folders already created in this run (skips repeat mkdir calls)
+_KNOWN_DIRS: set[Path] = set()
+
+# Risk analysis key aliases, in order of preference
+_RISK_SUMMARY_KEYS = ("summary", "finding")
+_RISK_LEVEL_KEYS = ("risk_level", "risk")
+_RISK_ACTION_KEYS = ("recommendation", "action")
+_RISK_POLICY_KEYS = ("policy_citations", "policies")
+
+
+def _first_value(data: Dict[str, Any], keys: Tuple[str, ...], default: Any = "") -> Any:
+    """Return the first non-empty value among keys, stopping at the first hit."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+def _iter_extracted_rows(app_data: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """Yield review rows for Content Understanding extracted fields."""
+    extracted_fields = app_data.get("extracted_fields") or {}
+    for field_key, field_data in extracted_fields.items():
+        if type(field_data) is dict or isinstance(field_data, dict):
+            yield (
+                "extracted_field",
+                "",
+                field_data.get("field_name", field_key),
+                str(field_data.get("value", "")),
+                field_data.get("confidence", ""),
+                field_data.get("page_number", ""),
+                field_data.get("source_file", ""),
+            ) + _EXTRACTED_ROW_TAIL
+
+
+def _iter_llm_rows(app_data: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """Yield review rows for LLM section outputs."""
+    max_len = MAX_REVIEW_VALUE_LENGTH
+    dict_type = dict  # Local binding for the loops below
+    llm_outputs = app_data.get("llm_outputs") or {}
+    
+    # Flatten section -> subsection into one stream of dict subsections
+    subsections = (
+        (section_name, subsection_name, subsection_data)
+        for section_name, section_data in llm_outputs.items()
+        if type(section_data) is dict_type or isinstance(section_data, dict_type)
+        for subsection_name, subsection_data in section_data.items()
+        if type(subsection_data) is dict_type or isinstance(subsection_data, dict_type)
+    )
+    
+    for section_name, subsection_name, subsection_data in subsections:
+        parsed = subsection_data.get("parsed", {})
+        if type(parsed) is dict_type or isinstance(parsed, dict_type):
+            summary = parsed.get("summary", "")
+            risk = parsed.get("risk_assessment", "")
+            action = parsed.get("underwriting_action", "")
+        else:
+            summary = str(parsed) if parsed else subsection_data.get("raw", "")
+            risk = ""
+            action = ""
+        
+        yield (
+            "llm_output",
+            section_name,
+            subsection_name,
+            summary[:max_len] if summary else "",  # Truncate long summaries
+            "", "", "",
+            risk,
+            action,
+        ) + _LLM_ROW_TAIL
+
+
+def _iter_risk_rows(app_data: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """Yield review rows for the policy risk analysis."""
+    risk_analysis = app_data.get("risk_analysis") or {}
+    
+    # Handle different risk analysis structures
+    if not (type(risk_analysis) is dict or isinstance(risk_analysis, dict)):
+        return
+    
+    max_len = MAX_REVIEW_VALUE_LENGTH
+    
+    # Try to extract from nested structure
+    for section_name, section_data in risk_analysis.items():
+        if type(section_data) is dict or isinstance(section_data, dict):
+            # Could be a nested section or a direct finding
+            summary = _first_value(section_data, _RISK_SUMMARY_KEYS)
+            risk_level = _first_value(section_data, _RISK_LEVEL_KEYS)
+            action = _first_value(section_data, _RISK_ACTION_KEYS)
+            policies = _first_value(section_data, _RISK_POLICY_KEYS, [])
+            
+            if isinstance(policies, list):
+                policies = ", ".join(str(p) for p in policies)
+            
+            yield (
+                "risk_analysis",
+                section_name,
+                "",
+                str(summary)[:max_len] if summary else "",
+                "", "", "",
+                risk_level,
+                action,
+                policies,
+            ) + _RISK_ROW_TAIL
+        elif isinstance(section_data, str):
+            yield (
+                "risk_analysis",
+                section_name,
+                "",
+                section_data[:max_len],
+            ) + _RISK_TEXT_ROW_TAIL
+
+
+def _write_rows_fast(f, writer, rows: Iterable[Tuple[Any, ...]]) -> None:
+    """
+    Write rows by joining them directly, skipping the csv module's quoting.
+    
+    A row is joined as-is only when the result needs no quoting (no quote or
+    newline characters and no commas inside values); any other row goes
+    through the regular csv writer. The output is identical either way.
+    """
+    separators = len(REVIEW_CSV_FIELDNAMES) - 1
+    lines: List[str] = []
+    append = lines.append  # Local binding for the per-row loop
+    write = f.write
+    for row in rows:
+        line = ",".join(["" if v is None else str(v) for v in row])
+        needs_quoting = (
+            line.count(",") != separators
+            or '"' in line
+            or "\n" in line
+            or "\r" in line
+        )
+        if not needs_quoting:
+            append(line)
+        else:
+            if lines:
+                write("\r\n".join(lines) + "\r\n")
+                lines.clear()
+            writer.writerow(row)
+    if lines:
+        write("\r\n".join(lines) + "\r\n")
+
+
+def _document_stem(document_name: str) -> str:
+    """Path(document_name).stem for a bare file name, without building a Path."""
+    dot = document_name.rfind(".")
+    # Like Path.stem, a leading or trailing dot is part of the name, not a suffix
+    return document_name[:dot] if 0 < dot < len(document_name) - 1 else document_name
+
+
 def export_review_csv(
     app_data: Dict[str, Any],
     output_folder: Path,
     document_name: str,
+    fast_csv: bool = False,
 ) -> Path:
-    """Export a consolidated review CSV for human annotation."""
+    """
+    Export a consolidated review CSV for human annotation.
+    
+    Rows are streamed from per-section generators straight into the CSV
+    writer rather than collected in memory first. Each row is a tuple in
+    REVIEW_CSV_FIELDNAMES order. With fast_csv, rows that need no quoting
+    are joined and written in bulk (see _write_rows_fast).
+    """
     
     # Create output directory named after the document (without extension)
-    doc_folder = output_folder / Path(document_name).stem
-    doc_folder.mkdir(parents=True, exist_ok=True)
+    doc_folder = output_folder / _document_stem(document_name)
+    if doc_folder not in _KNOWN_DIRS:
+        doc_folder.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(doc_folder)
     
     csv_path = doc_folder / "review_output.csv"
     
-    fieldnames = [
-        "category",
-        "section", 
-        "subsection",
-        "value",
-        "confidence",
-        "source_page",
-        "source_file",
-        "risk_level",
-        "underwriting_action",
-        "policy_citations",
-        "accuracy_rating",
-        "issues_found",
-        "corrections",
-        "reviewer_notes",
-    ]
-    
-    rows: List[Dict[str, Any]] = []
-    
-    # 1. Extracted Fields
-    extracted_fields = app_data.get("extracted_fields") or {}
-    for field_key, field_data in extracted_fields.items():
-        if isinstance(field_data, dict):
-            rows.append({
-                "category": "extracted_field",
-                "section": "",
-                "subsection": field_data.get("field_name", field_key),
-                "value": str(field_data.get("value", "")),
-                "confidence": field_data.get("confidence", ""),
-                "source_page": field_data.get("page_number", ""),
-                "source_file": field_data.get("source_file", ""),
-                "risk_level": "",
-                "underwriting_action": "",
-                "policy_citations": "",
-                "accuracy_rating": "",
-                "issues_found": "",
-                "corrections": "",
-                "reviewer_notes": "",
-            })
-    
-    # 2. LLM Outputs
-    llm_outputs = app_data.get("llm_outputs") or {}
-    for section_name, section_data in llm_outputs.items():
-        if isinstance(section_data, dict):
-            for subsection_name, subsection_data in section_data.items():
-                if isinstance(subsection_data, dict):
-                    parsed = subsection_data.get("parsed", {})
-                    if isinstance(parsed, dict):
-                        summary = parsed.get("summary", "")
-                        risk = parsed.get("risk_assessment", "")
-                        action = parsed.get("underwriting_action", "")
-                    else:
-                        summary = str(parsed) if parsed else subsection_data.get("raw", "")
-                        risk = ""
-                        action = ""
-                    
-                    rows.append({
-                        "category": "llm_output",
-                        "section": section_name,
-                        "subsection": subsection_name,
-                        "value": summary[:2000] if summary else "",  # Truncate long summaries
-                        "confidence": "",
-                        "source_page": "",
-                        "source_file": "",
-                        "risk_level": risk,
-                        "underwriting_action": action,
-                        "policy_citations": "",
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
-    
-    # 3. Risk Analysis
-    risk_analysis = app_data.get("risk_analysis") or {}
-    
-    # Handle different risk analysis structures
-    if isinstance(risk_analysis, dict):
-        # Try to extract from nested structure
-        for section_name, section_data in risk_analysis.items():
-            if isinstance(section_data, dict):
-                # Could be a nested section or a direct finding
-                summary = section_data.get("summary", section_data.get("finding", ""))
-                risk_level = section_data.get("risk_level", section_data.get("risk", ""))
-                action = section_data.get("recommendation", section_data.get("action", ""))
-                policies = section_data.get("policy_citations", section_data.get("policies", []))
-                
-                if isinstance(policies, list):
-                    policies = ", ".join(str(p) for p in policies)
-                
-                rows.append({
-                    "category": "risk_analysis",
-                    "section": section_name,
-                    "subsection": "",
-                    "value": str(summary)[:2000] if summary else "",
-                    "confidence": "",
-                    "source_page": "",
-                    "source_file": "",
-                    "risk_level": risk_level,
-                    "underwriting_action": action,
-                    "policy_citations": policies,
-                    "accuracy_rating": "",
-                    "issues_found": "",
-                    "corrections": "",
-                    "reviewer_notes": "",
-                })
-            elif isinstance(section_data, str):
-                rows.append({
-                    "category": "risk_analysis",
-                    "section": section_name,
-                    "subsection": "",
-                    "value": section_data[:2000],
-                    "confidence": "",
-                    "source_page": "",
-                    "source_file": "",
-                    "risk_level": "",
-                    "underwriting_action": "",
-                    "policy_citations": "",
-                    "accuracy_rating": "",
-                    "issues_found": "",
-                    "corrections": "",
-                    "reviewer_notes": "",
-                })
-    
-    # Write CSV
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Write CSV: 1. Extracted Fields, 2. LLM Outputs, 3. Risk Analysis
+    # Unbuffered binary file behind one large BufferedWriter; the text layer
+    # only encodes, so rows are flushed to disk in CSV_WRITE_BUFFER_SIZE blocks
+    with open(csv_path, "wb", buffering=0) as raw, io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=CSV_WRITE_BUFFER_SIZE),
+        encoding="utf-8",
+        newline="",
+        write_through=False,
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(REVIEW_CSV_FIELDNAMES)
+        for rows in (
+            _iter_extracted_rows(app_data),
+            _iter_llm_rows(app_data),
+            _iter_risk_rows(app_data),
+        ):
+            if fast_csv:
+                _write_rows_fast(f, writer, rows)
+            else:
+                writer.writerows(rows)
     
     return csv_path
 
@@ -443,10 +642,15 @@ def export_review_csv(
 # =============================================================================
 
 def discover_documents(source_folder: Path) -> List[Path]:
-    """Find all PDF files in the source folder."""
-    pdfs = sorted(source_folder.glob("*.pdf"))
-    # Filter out any non-APS files (like PowerPoint files)
-    return [p for p in pdfs if p.suffix.lower() == ".pdf"]
+    """Find all PDF files in the source folder (extension match is case-insensitive)."""
+    # scandir reuses the directory entry type, avoiding a stat per file
+    with os.scandir(source_folder) as entries:
+        pdfs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        ]
+    return sorted(pdfs)
 
 
 def wait_for_processing(
@@ -454,17 +658,26 @@ def wait_for_processing(
     app_id: str,
     poll_interval: int,
     timeout: int,
-) -> Tuple[bool, Optional[str]]:
+) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
     """
     Poll until processing is complete.
-    Returns (success, error_message).
+    
+    Polls quickly at first and grows the delay by POLL_BACKOFF_FACTOR after
+    each poll, capped at poll_interval, so short jobs are detected promptly
+    and long jobs are not polled needlessly. The delay is jittered and resets
+    whenever the reported status changes. The timeout is a wall-clock guard.
+    
+    Returns (success, error_message, app_data), where app_data is the final
+    application response on success so callers need not fetch it again.
     """
     start_time = time.time()
+    delay = min(INITIAL_POLL_DELAY, poll_interval)
+    last_status: Optional[str] = None
     
     while True:
         elapsed = time.time() - start_time
         if elapsed > timeout:
-            return False, f"Timeout after {timeout} seconds"
+            return False, f"Timeout after {timeout} seconds", None
         
         try:
             app_data = client.get_application(app_id)
@@ -472,17 +685,24 @@ def wait_for_processing(
             error = app_data.get("processing_error")
             
             if error:
-                return False, f"Processing error: {error}"
+                return False, f"Processing error: {error}", None
             
             if status is None:
                 # Processing complete
-                return True, None
+                return True, None, app_data
             
-            log(f"  Status: {status} (elapsed: {int(elapsed)}s)")
-            time.sleep(poll_interval)
+            if status != last_status:
+                # Progress is being made - poll quickly again
+                delay = min(INITIAL_POLL_DELAY, poll_interval)
+                last_status = status
+            
+            if _info_enabled:
+                log(f"  Status: {status} (elapsed: {int(elapsed)}s)")
+            time.sleep(delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER))
+            delay = min(delay * POLL_BACKOFF_FACTOR, poll_interval)
             
         except requests.RequestException as e:
-            return False, f"API error while polling: {e}"
+            return False, f"API error while polling: {e}", None
 
 
 def process_single_document(
@@ -492,24 +712,29 @@ def process_single_document(
     output_folder: Path,
     poll_interval: int,
     timeout: int,
+    fast_csv: bool = False,
 ) -> bool:
     """
     Process a single document through the full pipeline.
     Returns True if successful.
     """
     filename = pdf_path.name
-    current_status = tracker.get_status(filename)
+    # Read the tracker once; the local status follows each transition below
+    status = tracker.get_status(filename)
     app_id = tracker.get_application_id(filename)
+    # Latest application response, reused for the CSV export when available
+    app_data: Optional[Dict[str, Any]] = None
     
     log(f"Processing: {filename}")
     
     # Step 1: Upload if needed
-    if current_status in (None, STATUS_PENDING):
+    if status in (None, STATUS_PENDING):
         log("  Uploading...")
         try:
             result = client.create_application(pdf_path)
             app_id = result["id"]
-            tracker.update(filename, STATUS_UPLOADED, application_id=app_id)
+            status = STATUS_UPLOADED
+            tracker.update(filename, status, application_id=app_id)
             log(f"  Created application: {app_id}")
         except requests.RequestException as e:
             log_error(f"  Upload failed: {e}")
@@ -517,32 +742,38 @@ def process_single_document(
             return False
     
     # Step 2: Start processing if needed
-    if tracker.get_status(filename) == STATUS_UPLOADED:
+    if status == STATUS_UPLOADED:
         log("  Starting extraction and analysis...")
         try:
             client.start_processing(app_id)
-            tracker.update(filename, STATUS_PROCESSING, application_id=app_id)
+            status = STATUS_PROCESSING
+            tracker.update(filename, status, application_id=app_id)
         except requests.RequestException as e:
             log_error(f"  Failed to start processing: {e}")
             tracker.update(filename, STATUS_ERROR, application_id=app_id, error_message=str(e))
             return False
     
     # Step 3: Wait for processing to complete
-    if tracker.get_status(filename) == STATUS_PROCESSING:
+    if status == STATUS_PROCESSING:
         log("  Waiting for extraction and analysis...")
-        success, error = wait_for_processing(client, app_id, poll_interval, timeout)
+        success, error, app_data = wait_for_processing(client, app_id, poll_interval, timeout)
         if not success:
             log_error(f"  Processing failed: {error}")
             tracker.update(filename, STATUS_ERROR, application_id=app_id, error_message=error)
             return False
-        tracker.update(filename, STATUS_RUNNING_RISK, application_id=app_id)
+        status = STATUS_RUNNING_RISK
+        tracker.update(filename, status, application_id=app_id)
     
     # Step 4: Run risk analysis
-    if tracker.get_status(filename) == STATUS_RUNNING_RISK:
+    if status == STATUS_RUNNING_RISK:
         log("  Running risk analysis...")
         try:
-            client.run_risk_analysis(app_id)
+            result = client.run_risk_analysis(app_id)
             log("  Risk analysis complete")
+            if app_data is not None and "risk_analysis" in result:
+                app_data["risk_analysis"] = result["risk_analysis"]
+            else:
+                app_data = None
         except requests.RequestException as e:
             # Log but don't fail - risk analysis is optional
             log_warning(f"  Risk analysis failed (continuing): {e}")
@@ -550,8 +781,9 @@ def process_single_document(
     # Step 5: Export CSV
     log("  Exporting review CSV...")
     try:
-        app_data = client.get_application(app_id)
-        csv_path = export_review_csv(app_data, output_folder, filename)
+        if app_data is None:
+            app_data = client.get_application(app_id)
+        csv_path = export_review_csv(app_data, output_folder, filename, fast_csv=fast_csv)
         log(f"  Exported: {csv_path}")
     except Exception as e:
         log_error(f"  CSV export failed: {e}")
@@ -564,6 +796,20 @@ def process_single_document(
     return True
 
 
+def remove_output_folders(output_folder: Path) -> None:
+    """Remove the per-document output folders, deleting them in parallel."""
+    if not output_folder.exists():
+        return
+    
+    folders = [item for item in output_folder.iterdir() if item.is_dir()]
+    for folder in folders:
+        log(f"  Removing output folder: {folder.name}")
+    
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        list(executor.map(shutil.rmtree, folders))
+    _KNOWN_DIRS.clear()
+
+
 def cleanup_applications(
     client: WorkbenchAPIClient,
     tracker: ProgressTracker,
@@ -577,24 +823,19 @@ def cleanup_applications(
     else:
         log(f"Cleaning up {len(app_ids)} applications...")
         
-        for app_id in app_ids:
-            if app_id:
-                log(f"  Deleting application: {app_id}")
-                if client.delete_application(app_id):
-                    log(f"    Deleted: {app_id}")
-                else:
-                    log_warning(f"    Failed to delete: {app_id}")
+        results = client.delete_applications(app_ids)
+        for app_id, deleted in results.items():
+            if deleted:
+                log(f"  Deleted application: {app_id}")
+            else:
+                log_warning(f"  Failed to delete application: {app_id}")
     
     # Clear the progress tracker
     tracker.clear()
     
     # Remove output folders
     if output_folder.exists():
-        import shutil
-        for item in output_folder.iterdir():
-            if item.is_dir():
-                log(f"  Removing output folder: {item.name}")
-                shutil.rmtree(item)
+        remove_output_folders(output_folder)
         
         # Remove progress tracker if it exists
         progress_file = output_folder / PROGRESS_TRACKER_FILENAME
@@ -611,13 +852,17 @@ def run_batch_processing(
     poll_interval: int,
     timeout: int,
     dry_run: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    fast_csv: bool = False,
 ) -> int:
     """
     Run the batch processing pipeline.
     Returns exit code (0 for success, 1 for errors).
     """
+    max_workers = max(1, max_workers)
+    
     # Initialize client
-    client = WorkbenchAPIClient(api_url)
+    client = WorkbenchAPIClient(api_url, pool_size=max(10, max_workers))
     
     # Check backend connectivity
     log(f"Checking backend connectivity: {api_url}")
@@ -636,17 +881,20 @@ def run_batch_processing(
     # Initialize progress tracker
     output_folder.mkdir(parents=True, exist_ok=True)
     tracker = ProgressTracker(output_folder)
+    atexit.register(tracker.flush)
     
-    # Initialize records for any new documents
+    # Initialize records for any new documents (saved once below)
     for doc in documents:
         if tracker.get_status(doc.name) is None:
-            tracker.update(doc.name, STATUS_PENDING)
+            tracker.update(doc.name, STATUS_PENDING, save=False)
+    tracker.flush()
     
     # Show summary
     summary = tracker.get_summary()
+    pending_count = sum(summary[status] for status in UNFINISHED_STATUSES)
     log(f"Status: {summary[STATUS_COMPLETED]} completed, "
         f"{summary[STATUS_ERROR]} errors, "
-        f"{summary[STATUS_PENDING] + summary[STATUS_UPLOADED] + summary[STATUS_PROCESSING] + summary[STATUS_RUNNING_RISK]} pending")
+        f"{pending_count} pending")
     
     if dry_run:
         log("DRY RUN - Documents that would be processed:")
@@ -656,25 +904,58 @@ def run_batch_processing(
                 print(f"  [{status or 'new'}] {doc.name}")
         return 0
     
-    # Process documents sequentially
+    # Process documents (sequentially unless max_workers > 1)
     success_count = 0
     error_count = 0
     skipped_count = 0
     
+    pending: List[Path] = []
     for doc in documents:
-        status = tracker.get_status(doc.name)
-        
-        if status == STATUS_COMPLETED:
+        if tracker.get_status(doc.name) == STATUS_COMPLETED:
             log(f"Skipping (already completed): {doc.name}")
             skipped_count += 1
-            continue
-        
-        if process_single_document(
-            client, doc, tracker, output_folder, poll_interval, timeout
-        ):
-            success_count += 1
         else:
-            error_count += 1
+            pending.append(doc)
+    
+    if max_workers == 1:
+        for doc in pending:
+            if process_single_document(
+                client, doc, tracker, output_folder, poll_interval, timeout, fast_csv
+            ):
+                success_count += 1
+            else:
+                error_count += 1
+    elif pending:
+        log(f"Processing {len(pending)} documents with {max_workers} workers")
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(
+                    process_single_document,
+                    client, doc, tracker, output_folder, poll_interval, timeout, fast_csv,
+                ): doc
+                for doc in pending
+            }
+            for future in as_completed(futures):
+                doc = futures[future]
+                try:
+                    succeeded = future.result()
+                except Exception as e:
+                    log_error(f"Unexpected error processing {doc.name}: {e}")
+                    tracker.update(doc.name, STATUS_ERROR, error_message=str(e))
+                    succeeded = False
+                
+                if succeeded:
+                    success_count += 1
+                else:
+                    error_count += 1
+        except KeyboardInterrupt:
+            # Drop documents that have not started; the tracker keeps them
+            # pending so the next run resumes them
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
     
     # Final summary
     log("=" * 60)
@@ -702,6 +983,7 @@ def main():
 Examples:
   python scripts/batch_process_aps.py --dry-run
   python scripts/batch_process_aps.py
+  python scripts/batch_process_aps.py --max-workers 4
   python scripts/batch_process_aps.py --cleanup
   python scripts/batch_process_aps.py --reset
         """,
@@ -726,7 +1008,7 @@ Examples:
         "--poll-interval",
         type=int,
         default=DEFAULT_POLL_INTERVAL,
-        help=f"Seconds between status polls (default: {DEFAULT_POLL_INTERVAL})",
+        help=f"Max seconds between status polls (default: {DEFAULT_POLL_INTERVAL})",
     )
     parser.add_argument(
         "--timeout",
@@ -734,6 +1016,22 @@ Examples:
         default=DEFAULT_TIMEOUT,
         help=f"Max seconds to wait per document (default: {DEFAULT_TIMEOUT})",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Documents to process concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--fast-csv",
+        action="store_true",
+        help="Write review CSV rows that need no quoting without the csv module",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print warnings, errors and completions",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -751,6 +1049,7 @@ Examples:
     )
     
     args = parser.parse_args()
+    set_quiet(args.quiet)
     
     # Resolve paths relative to the project root
     script_dir = Path(__file__).parent
@@ -771,12 +1070,7 @@ Examples:
             tracker.clear()
             
             # Still try to remove output folders
-            if output_folder.exists():
-                import shutil
-                for item in output_folder.iterdir():
-                    if item.is_dir():
-                        log(f"  Removing output folder: {item.name}")
-                        shutil.rmtree(item)
+            remove_output_folders(output_folder)
             log_success("Local cleanup complete")
         else:
             tracker = ProgressTracker(output_folder)
@@ -805,6 +1099,8 @@ Examples:
         poll_interval=args.poll_interval,
         timeout=args.timeout,
         dry_run=args.dry_run,
+        max_workers=args.max_workers,
+        fast_csv=args.fast_csv,
     )
 
 
@@ -12,6 +12,7 @@ Environment:
     Requires AZURE_OPENAI_* and POSTGRES_* environment variables
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -21,14 +22,18 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.config import load_settings
-from app.rag.unified_indexer import UnifiedPolicyIndexer, PERSONA_CONFIG
 from app.utils import setup_logging
 
+# app.rag.unified_indexer pulls in the database pool and embedding clients;
+# it is imported inside each code path so --help and argument errors stay fast.
+
 logger = setup_logging()
 
 
 def main():
     """Index mortgage underwriting policies."""
+    from app.rag.unified_indexer import UnifiedPolicyIndexer, PERSONA_CONFIG
+    
     persona = "mortgage_underwriting"
     
     logger.info(f"Starting indexing for persona: {persona}")
@@ -71,6 +76,8 @@ def main():
 
 async def main_async():
     """Async version of indexing."""
+    from app.rag.unified_indexer import UnifiedPolicyIndexer
+    
     persona = "mortgage_underwriting"
     
     logger.info(f"Starting async indexing for persona: {persona}")
@@ -92,8 +99,6 @@ async def main_async():
 
 
 if __name__ == "__main__":
-    import argparse
-    
     parser = argparse.ArgumentParser(
         description="Index mortgage underwriting policies"
     )
@@ -112,6 +117,8 @@ if __name__ == "__main__":
     args = parser.parse_args()
     
     if args.dry_run:
+        from app.rag.unified_indexer import PERSONA_CONFIG
+        
         logger.info("Dry run - validating configuration")
         config = PERSONA_CONFIG.get("mortgage_underwriting", {})
         policy_path = project_root / config.get("policies_path", "")
@@ -19,19 +19,35 @@ Usage:
 """
 
 import argparse
+import base64
+import functools
+import hashlib
+import itertools
 import json
+import mmap
 import os
+import queue
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from azure.storage.blob import BlobServiceClient, ContainerClient
-    from azure.core.exceptions import AzureError
+    from azure.storage.blob import (
+        BlobBlock, BlobClient, BlobServiceClient, ContainerClient, ContentSettings,
+        ExponentialRetry,
+    )
+    from azure.core.exceptions import AzureError, HttpResponseError
+    from azure.core.pipeline.transport import RequestsTransport
+    import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("ERROR: azure-storage-blob package is not installed.")
     print("Install it with: uv pip install azure-storage-blob")
@@ -41,6 +57,61 @@ except ImportError:
 # Configuration
 CONTAINER_NAME = os.environ.get("AZURE_STORAGE_CONTAINER_NAME", "workbenchiq-data")
 DATA_ROOT = Path(__file__).parent.parent / "data"
+DEFAULT_PARALLELISM = 16  # concurrent blob uploads
+MIGRATION_PREFIXES = ("applications/", "conversations/")  # blob prefixes this tool writes
+
+# Upload tuning. Small files go through many workers on one connection each;
+# large files go through a few workers that each upload blocks in parallel.
+# The first three can be overridden on the command line.
+MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024  # files up to this size are sent as one PUT
+MAX_BLOCK_SIZE = 8 * 1024 * 1024  # block size for chunked and staged uploads
+PARALLEL_BLOCKS_CONCURRENCY = 8  # parallel block uploads per chunked file
+LARGE_FILE_WORKERS = 4  # concurrent chunked uploads (files over the single-PUT size)
+CONNECTION_TIMEOUT = 60  # seconds to establish a connection
+READ_TIMEOUT = 120  # seconds to wait for a response
+
+# Retry tuning. The SDK retries each request with jittered backoff; files that
+# still hit a throttling/server error are requeued behind the rest of the batch.
+RETRY_TOTAL = 8  # SDK retries per request
+RETRY_INITIAL_BACKOFF = 1  # seconds before the first SDK retry
+RETRY_INCREMENT_BASE = 2  # exponential backoff base
+RETRY_JITTER = 2  # +/- seconds of random jitter per SDK retry
+MAX_FILE_ATTEMPTS = 3  # upload attempts per file before it counts as failed
+RETRYABLE_STATUS_CODES = (500, 503)  # server errors worth requeueing a file for
+STAGED_UPLOAD_THRESHOLD = 256 * 1024 * 1024  # files this big are staged block by block
+HASH_CHUNK_SIZE = 4 * 1024 * 1024  # bytes hashed per MD5 update
+COPY_POLL_INTERVAL = 1.0  # seconds between server-side copy status checks
+PROGRESS_FLUSH_EVERY = 100  # per-file log lines buffered between stdout writes
+MAX_RECORDED_ERRORS = 1000  # error messages kept in memory; older ones are dropped
+LIST_PAGE_SIZE = 5000  # blob names per listing page (service maximum)
+
+# Readahead hints for queued uploads (POSIX only; a no-op elsewhere)
+_PREFETCH_SUPPORTED = hasattr(os, "posix_fadvise")
+
+# Local paths only need separator translation on Windows
+_SEP_TR = str.maketrans(os.sep, "/") if os.sep != "/" else None
+
+# Upload outcomes reported by _upload_one
+UPLOAD_OK = "uploaded"
+UPLOAD_SKIPPED = "skipped"
+UPLOAD_FAILED = "failed"
+UPLOAD_RETRY = "retry"  # transient failure; _run_uploads requeues the file
+
+
+_KB = 1024
+_MB = 1024 ** 2
+_GB = 1024 ** 3
+
+
+def _fmt_size(num_bytes: int) -> str:
+    """Human-readable file size for log lines."""
+    if num_bytes < _KB:
+        return f"{num_bytes:,} bytes"
+    if num_bytes < _MB:
+        return f"{num_bytes / _KB:.1f} KB"
+    if num_bytes < _GB:
+        return f"{num_bytes / _MB:.1f} MB"
+    return f"{num_bytes / _GB:.2f} GB"
 
 
 def get_connection_string() -> str:
@@ -62,9 +133,17 @@ class MigrationStats:
         self.files_skipped = 0
         self.files_failed = 0
         self.bytes_transferred = 0
-        self.errors: list[str] = []
+        self.errors: deque[str] = deque(maxlen=MAX_RECORDED_ERRORS)
+        self.errors_dropped = 0
+    
+    def add_error(self, message: str) -> None:
+        """Record an error, dropping the oldest once MAX_RECORDED_ERRORS are kept."""
+        if len(self.errors) == self.errors.maxlen:
+            self.errors_dropped += 1
+        self.errors.append(message)
     
     def summary(self) -> str:
+        dropped = f"Errors dropped:   {self.errors_dropped}\n" if self.errors_dropped else ""
         return (
             f"\n{'='*60}\n"
             f"Migration Summary\n"
@@ -73,15 +152,46 @@ class MigrationStats:
             f"Files uploaded:   {self.files_uploaded}\n"
             f"Files skipped:    {self.files_skipped}\n"
             f"Files failed:     {self.files_failed}\n"
-            f"Bytes transferred: {self.bytes_transferred:,} ({self.bytes_transferred / (1024*1024):.2f} MB)\n"
+            f"Bytes transferred: {self.bytes_transferred:,} "
+            f"({self.bytes_transferred / (1024*1024):.2f} MB)\n"
+            f"{dropped}"
             f"{'='*60}"
         )
 
 
+def _azure_profile_path() -> Path:
+    """Location of the Azure CLI profile (honours AZURE_CONFIG_DIR)."""
+    config_dir = os.environ.get("AZURE_CONFIG_DIR")
+    return (Path(config_dir) if config_dir else Path.home() / ".azure") / "azureProfile.json"
+
+
 def check_azure_login() -> bool:
-    """Check if user is logged into Azure CLI."""
+    """
+    Check if user is logged into Azure CLI.
+    
+    Reads the CLI's azureProfile.json directly, which avoids starting the CLI
+    (seconds on Windows). Falls back to `az account show` if the profile is
+    missing or unreadable.
+    """
     print("\n🔐 Checking Azure CLI login status...")
     
+    profile_path = _azure_profile_path()
+    if profile_path.exists():
+        try:
+            # The CLI writes this file with a UTF-8 BOM
+            profile = json.loads(profile_path.read_text(encoding="utf-8-sig"))
+            default_subs = [sub for sub in profile.get("subscriptions", []) if sub.get("isDefault")]
+            if default_subs:
+                account_info = default_subs[0]
+                print(f"   ✅ Logged in as: {account_info.get('user', {}).get('name', 'Unknown')}")
+                print(f"   ✅ Subscription: {account_info.get('name', 'Unknown')}")
+                return True
+            print("   ❌ Not logged into Azure CLI")
+            print("   Run 'az login' to authenticate")
+            return False
+        except (OSError, ValueError):
+            pass  # Fall back to asking the CLI
+    
     try:
         # Try to find az.cmd on Windows or az on other platforms
         az_cmd = "az.cmd" if sys.platform == "win32" else "az"
@@ -114,22 +224,65 @@ def check_azure_login() -> bool:
         return True
 
 
-def test_blob_connection(connection_string: str, container_name: str) -> Optional[ContainerClient]:
-    """Test connection to Azure Blob Storage and ensure container exists."""
+def connection_pool_size(
+    parallelism: int,
+    max_concurrency_per_file: int = PARALLEL_BLOCKS_CONCURRENCY,
+) -> int:
+    """Connections needed for migrate()'s two upload pools to reuse keep-alive sockets."""
+    return parallelism + min(parallelism, LARGE_FILE_WORKERS) * max_concurrency_per_file
+
+
+def test_blob_connection(
+    connection_string: str,
+    container_name: str,
+    pool_size: int = DEFAULT_PARALLELISM,
+    verbose: bool = False,
+    max_single_put_size: int = MAX_SINGLE_PUT_SIZE,
+    max_block_size: int = MAX_BLOCK_SIZE,
+) -> Optional[ContainerClient]:
+    """
+    Test connection to Azure Blob Storage and ensure container exists.
+    
+    The client gets its own requests session with pool_size connections, so
+    parallel uploads reuse connections instead of opening new TLS sockets.
+    The container check alone proves the account is reachable; the account
+    SKU is only fetched (an extra round trip) when verbose is set.
+    """
     print("\n🔗 Testing Azure Blob Storage connection...")
     
     try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        # Blob Storage serves HTTP/1.1, so each in-flight request needs its own
+        # keep-alive connection; size the pool to the peak number of requests
+        # rather than relying on a multiplexing (HTTP/2) transport.
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=False)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        blob_service_client = BlobServiceClient.from_connection_string(
+            connection_string,
+            transport=RequestsTransport(session=session),
+            retry_policy=ExponentialRetry(
+                initial_backoff=RETRY_INITIAL_BACKOFF,
+                increment_base=RETRY_INCREMENT_BASE,
+                retry_total=RETRY_TOTAL,
+                random_jitter_range=RETRY_JITTER,
+            ),
+            connection_timeout=CONNECTION_TIMEOUT,
+            read_timeout=READ_TIMEOUT,
+            max_single_put_size=max_single_put_size,
+            max_block_size=max_block_size,
+        )
         
-        # Get account info
-        account_info = blob_service_client.get_account_information()
+        # Get or create container; the existence check doubles as the connectivity test
+        container_client = blob_service_client.get_container_client(container_name)
+        container_exists = container_client.exists()
         print(f"   ✅ Connected to storage account")
-        print(f"   ✅ SKU: {account_info.get('sku_name', 'Unknown')}")
         
-        # Get or create container
-        container_client = blob_service_client.get_container_client(container_name)
+        if verbose:
+            account_info = blob_service_client.get_account_information()
+            print(f"   ✅ SKU: {account_info.get('sku_name', 'Unknown')}")
         
-        if not container_client.exists():
+        if not container_exists:
             print(f"   📦 Container '{container_name}' does not exist. Creating...")
             container_client.create_container()
             print(f"   ✅ Container '{container_name}' created")
@@ -146,37 +299,63 @@ def test_blob_connection(connection_string: str, container_name: str) -> Optiona
         return None
 
 
-def collect_files(data_root: Path) -> list[tuple[Path, str]]:
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every file under root (except .gitkeep) using os.scandir."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and entry.name != ".gitkeep":
+                    yield entry
+
+
+def collect_files(data_root: Path) -> list[tuple[str, str, int]]:
     """
     Collect all files to migrate with their blob paths.
     
-    Returns list of tuples: (local_path, blob_path)
+    Returns list of tuples: (local_path, blob_path, file_size)
     """
     files_to_migrate = []
+    root_prefix_len = len(str(data_root)) + 1
     
-    # Migrate applications
-    applications_dir = data_root / "applications"
-    if applications_dir.exists():
-        for file_path in applications_dir.rglob("*"):
-            if file_path.is_file() and file_path.name != ".gitkeep":
-                # Construct blob path: applications/{app_id}/...
-                relative_path = file_path.relative_to(data_root)
-                blob_path = str(relative_path).replace("\\", "/")
-                files_to_migrate.append((file_path, blob_path))
-    
-    # Migrate conversations
-    conversations_dir = data_root / "conversations"
-    if conversations_dir.exists():
-        for file_path in conversations_dir.rglob("*"):
-            if file_path.is_file() and file_path.name != ".gitkeep":
-                # Construct blob path: conversations/{app_id}/...
-                relative_path = file_path.relative_to(data_root)
-                blob_path = str(relative_path).replace("\\", "/")
-                files_to_migrate.append((file_path, blob_path))
+    # Migrate applications/{app_id}/... and conversations/{app_id}/...
+    for prefix in MIGRATION_PREFIXES:
+        source_dir = data_root / prefix.rstrip("/")
+        if not source_dir.is_dir():
+            continue
+        for entry in _walk_files(str(source_dir)):
+            blob_path = entry.path[root_prefix_len:]
+            if _SEP_TR is not None:
+                blob_path = blob_path.translate(_SEP_TR)
+            files_to_migrate.append((entry.path, blob_path, entry.stat().st_size))
     
     return files_to_migrate
 
 
+def collect_source_blobs(
+    source_client: ContainerClient,
+) -> tuple[list[tuple[str, str, int]], dict[str, Optional[bytes]]]:
+    """
+    Collect the blobs to copy from a source container.
+    
+    Returns (files, source_md5s): files are tuples of (source_url, blob_path,
+    size) in the same shape as collect_files; source_md5s maps blob_path to
+    the source blob's content_md5.
+    """
+    files = []
+    source_md5s: dict[str, Optional[bytes]] = {}
+    for prefix in MIGRATION_PREFIXES:
+        for blob in source_client.list_blobs(name_starts_with=prefix):
+            if blob.name.rsplit("/", 1)[-1] == ".gitkeep":
+                continue
+            content_md5 = blob.content_settings.content_md5
+            source_md5s[blob.name] = bytes(content_md5) if content_md5 else None
+            files.append((source_client.get_blob_client(blob.name).url, blob.name, blob.size))
+    return files, source_md5s
+
+
 def dry_run(data_root: Path) -> MigrationStats:
     """Perform a dry run - list all files that would be migrated."""
     print("\n🧪 DRY RUN MODE - No files will be uploaded")
@@ -190,9 +369,8 @@ def dry_run(data_root: Path) -> MigrationStats:
     print(f"\nFiles to be migrated:\n")
     
     current_prefix = ""
-    for local_path, blob_path in files_to_migrate:
+    for _, blob_path, file_size in files_to_migrate:
         stats.files_found += 1
-        file_size = local_path.stat().st_size
         stats.bytes_transferred += file_size
         
         # Print section headers
@@ -202,8 +380,7 @@ def dry_run(data_root: Path) -> MigrationStats:
             print(f"\n  [{prefix.upper()}]")
         
         # Print file info
-        size_str = f"{file_size:,} bytes" if file_size < 1024 else f"{file_size/1024:.1f} KB"
-        print(f"    📄 {blob_path} ({size_str})")
+        print(f"    📄 {blob_path} ({_fmt_size(file_size)})")
     
     if stats.files_found == 0:
         print("  (No files found to migrate)")
@@ -214,60 +391,458 @@ def dry_run(data_root: Path) -> MigrationStats:
     return stats
 
 
-def migrate(container_client: ContainerClient, data_root: Path, skip_existing: bool = True) -> MigrationStats:
-    """Perform the actual migration to Azure Blob Storage."""
+def list_existing_blobs(
+    container_client: ContainerClient,
+) -> dict[str, tuple[int, Optional[bytes]]]:
+    """
+    List all blobs under the migration prefixes.
+    
+    Returns {blob_name: (size, content_md5)}; content_md5 is None when the
+    service has no MD5 for the blob.
+    """
+    existing: dict[str, tuple[int, Optional[bytes]]] = {}
+    for prefix in MIGRATION_PREFIXES:
+        for blob in container_client.list_blobs(name_starts_with=prefix):
+            content_md5 = blob.content_settings.content_md5
+            existing[blob.name] = (blob.size, bytes(content_md5) if content_md5 else None)
+    return existing
+
+
+def _file_md5(local_path: str) -> bytes:
+    """
+    MD5 digest of a local file, in the form Blob Storage reports content_md5.
+    
+    The file is memory-mapped and hashed in slices without copying; hashlib
+    releases the GIL on large updates, so hashing overlaps other uploads.
+    """
+    md5 = hashlib.md5()
+    with open(local_path, "rb") as file_data:
+        if os.fstat(file_data.fileno()).st_size == 0:
+            return md5.digest()  # mmap cannot map an empty file
+        with mmap.mmap(file_data.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                    md5.update(view[offset:offset + HASH_CHUNK_SIZE])
+    return md5.digest()
+
+
+def interleave_by_app(files: list[tuple[str, str, int]]) -> list[tuple[str, str, int]]:
+    """
+    Reorder files round-robin across their {prefix}/{app_id} folders.
+    
+    Blob Storage throttles per partition, and blob names sharing a prefix tend
+    to land on the same one. Taking one file per app in turn keeps the
+    in-flight uploads spread over many prefixes instead of bursting into one.
+    """
+    buckets: dict[str, list[tuple[str, str, int]]] = {}
+    for file_info in files:
+        app_key = "/".join(file_info[1].split("/", 2)[:2])
+        buckets.setdefault(app_key, []).append(file_info)
+    
+    rotation = deque(iter(bucket) for bucket in buckets.values())
+    interleaved = []
+    while rotation:
+        bucket = rotation.popleft()
+        file_info = next(bucket, None)
+        if file_info is not None:
+            interleaved.append(file_info)
+            rotation.append(bucket)
+    return interleaved
+
+
+def _stage_blocks(
+    blob_client: BlobClient,
+    local_path: str,
+    file_size: int,
+    max_concurrency: int,
+    content_settings: Optional[ContentSettings] = None,
+    block_size: int = MAX_BLOCK_SIZE,
+) -> None:
+    """
+    Upload a file as explicitly staged blocks, then commit the block list.
+    
+    Each block is read from disk only when its upload starts, so at most
+    max_concurrency blocks of block_size are held in memory per file.
+    """
+    offsets = range(0, file_size, block_size)
+    read_lock = threading.Lock()
+    
+    with open(local_path, "rb") as file_data:
+        def stage(index: int, offset: int) -> str:
+            # Seek + read share one handle, so reads are serialized
+            with read_lock:
+                file_data.seek(offset)
+                chunk = file_data.read(block_size)
+            block_id = base64.b64encode(f"{index:08d}".encode()).decode()
+            blob_client.stage_block(block_id, chunk, length=len(chunk))
+            return block_id
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            block_ids = list(executor.map(stage, range(len(offsets)), offsets))
+    
+    blob_client.commit_block_list(
+        [BlobBlock(block_id=block_id) for block_id in block_ids],
+        content_settings=content_settings,
+    )
+
+
+def _prefetch(local_path: str, length: int) -> None:
+    """Ask the OS to start reading a queued file into the page cache."""
+    try:
+        fd = os.open(local_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint; the upload reports real errors
+
+
+def _upload_one(
+    container_client: ContainerClient,
+    local_path: str,
+    blob_path: str,
+    file_size: int,
+    existing_blobs: dict[str, tuple[int, Optional[bytes]]],
+    max_concurrency_per_file: int = PARALLEL_BLOCKS_CONCURRENCY,
+    single_put_size: int = MAX_SINGLE_PUT_SIZE,
+    block_size: int = MAX_BLOCK_SIZE,
+) -> tuple[str, str, int, Optional[str]]:
+    """
+    Upload a single file. Safe to call from worker threads.
+    
+    Files already in existing_blobs with the same size and MD5 are skipped;
+    pass an empty dict to overwrite everything. Blobs without a stored MD5
+    (chunked uploads, other tools) are uploaded again, which also stores the
+    MD5 for the next run. single_put_size must match the client's
+    max_single_put_size.
+    
+    Returns (blob_path, status, file_size, error_message).
+    """
+    try:
+        blob_client = container_client.get_blob_client(blob_path)
+        
+        # Skip blobs whose content already matches the local file. The file is
+        # hashed at most once: the digest is reused for the upload below.
+        local_md5 = None
+        remote = existing_blobs.get(blob_path)
+        if remote is not None and remote[0] == file_size and remote[1] is not None:
+            local_md5 = _file_md5(local_path)
+            if remote[1] == local_md5:
+                return blob_path, UPLOAD_SKIPPED, file_size, None
+        
+        # Store the MD5 with the blob so the next run can compare against it
+        if local_md5 is None:
+            local_md5 = _file_md5(local_path)
+        content_settings = ContentSettings(content_md5=bytearray(local_md5))
+        
+        # Upload the file. With an explicit length at or under the client's
+        # max_single_put_size, the SDK sends one Put Blob (no block list commit),
+        # which covers the JSON files this app writes. Bigger files are chunked
+        # and push their blocks over several connections.
+        if file_size > STAGED_UPLOAD_THRESHOLD:
+            _stage_blocks(
+                blob_client, local_path, file_size, max_concurrency_per_file,
+                content_settings, block_size,
+            )
+        else:
+            max_concurrency = 1 if file_size <= single_put_size else max_concurrency_per_file
+            with open(local_path, "rb") as file_data:
+                blob_client.upload_blob(
+                    file_data, length=file_size, overwrite=True, max_concurrency=max_concurrency,
+                    content_settings=content_settings,
+                )
+        
+        return blob_path, UPLOAD_OK, file_size, None
+        
+    except HttpResponseError as e:
+        status = UPLOAD_RETRY if e.status_code in RETRYABLE_STATUS_CODES else UPLOAD_FAILED
+        return blob_path, status, file_size, f"Failed to upload {blob_path}: {e}"
+    except AzureError as e:
+        return blob_path, UPLOAD_FAILED, file_size, f"Failed to upload {blob_path}: {e}"
+    except Exception as e:
+        return blob_path, UPLOAD_FAILED, file_size, f"Error uploading {blob_path}: {e}"
+
+
+def _copy_one(
+    container_client: ContainerClient,
+    source_url: str,
+    blob_path: str,
+    file_size: int,
+    existing_blobs: dict[str, tuple[int, Optional[bytes]]],
+    source_md5s: Optional[dict[str, Optional[bytes]]] = None,
+) -> tuple[str, str, int, Optional[str]]:
+    """
+    Copy a single blob server-side from source_url. Safe to call from worker threads.
+    
+    Skips blobs already in existing_blobs with the same size and MD5 (looked
+    up in source_md5s, as returned by collect_source_blobs); a blob is copied
+    again when either side has no MD5. Then starts the copy and polls until
+    Blob Storage reports it finished. Returns
+    the same (blob_path, status, file_size, error_message) as _upload_one.
+    """
+    try:
+        remote = existing_blobs.get(blob_path)
+        source_md5 = (source_md5s or {}).get(blob_path)
+        if (
+            remote is not None and remote[0] == file_size
+            and remote[1] is not None and remote[1] == source_md5
+        ):
+            return blob_path, UPLOAD_SKIPPED, file_size, None
+        
+        blob_client = container_client.get_blob_client(blob_path)
+        copy_status = blob_client.start_copy_from_url(source_url)["copy_status"]
+        while copy_status == "pending":
+            time.sleep(COPY_POLL_INTERVAL)
+            copy = blob_client.get_blob_properties().copy
+            copy_status = copy.status
+            if copy_status not in ("pending", "success"):
+                return blob_path, UPLOAD_FAILED, file_size, (
+                    f"Copy of {blob_path} ended as {copy_status}: {copy.status_description}"
+                )
+        
+        if copy_status != "success":
+            error = f"Copy of {blob_path} ended as {copy_status}"
+            return blob_path, UPLOAD_FAILED, file_size, error
+        return blob_path, UPLOAD_OK, file_size, None
+        
+    except HttpResponseError as e:
+        status = UPLOAD_RETRY if e.status_code in RETRYABLE_STATUS_CODES else UPLOAD_FAILED
+        return blob_path, status, file_size, f"Failed to copy {blob_path}: {e}"
+    except AzureError as e:
+        return blob_path, UPLOAD_FAILED, file_size, f"Failed to copy {blob_path}: {e}"
+    except Exception as e:
+        return blob_path, UPLOAD_FAILED, file_size, f"Error copying {blob_path}: {e}"
+
+
+def _run_uploads(
+    container_client: ContainerClient,
+    files: list[tuple[str, str, int]],
+    existing_blobs: dict[str, tuple[int, Optional[bytes]]],
+    workers: int,
+    transfer: Callable[..., tuple[str, str, int, Optional[str]]] = _upload_one,
+    prefetch: bool = True,
+) -> Iterator[tuple[str, str, int, Optional[str]]]:
+    """
+    Transfer files on a thread pool, yielding results as they finish.
+    
+    transfer is _upload_one (the default) or a partial of _copy_one. With
+    prefetch, a single background thread issues readahead hints for each
+    local file as it enters the window, so its first bytes are being read
+    from disk while earlier uploads are still sending.
+    
+    At most 2 x workers uploads are queued at a time, so memory stays bounded
+    however many files are being migrated. Files that fail with a retryable
+    server error are requeued, up to MAX_FILE_ATTEMPTS attempts each.
+    """
+    workers = max(1, workers)
+    max_in_flight = workers * 2
+    pending_files = iter(files)
+    retry_queue: deque[tuple[str, str, int]] = deque()
+    attempts: dict[str, int] = {}
+    in_flight: dict = {}  # future -> (local_path, blob_path, file_size)
+    prefetcher = ThreadPoolExecutor(max_workers=1) if prefetch and _PREFETCH_SUPPORTED else None
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # Top up the submission window (requeued files first), then wait
+                # for any upload to finish
+                while len(in_flight) < max_in_flight:
+                    file_info = retry_queue.popleft() if retry_queue else next(pending_files, None)
+                    if file_info is None:
+                        break
+                    if prefetcher is not None:
+                        prefetcher.submit(
+                            _prefetch, file_info[0], min(file_info[2], MAX_SINGLE_PUT_SIZE),
+                        )
+                    in_flight[executor.submit(
+                        transfer, container_client, *file_info, existing_blobs,
+                    )] = file_info
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_info = in_flight.pop(future)
+                    blob_path, status, file_size, error = future.result()
+                    if status == UPLOAD_RETRY:
+                        attempts[blob_path] = attempts.get(blob_path, 1) + 1
+                        if attempts[blob_path] <= MAX_FILE_ATTEMPTS:
+                            retry_queue.append(file_info)
+                            continue
+                        status = UPLOAD_FAILED
+                    yield blob_path, status, file_size, error
+    finally:
+        if prefetcher is not None:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+
+def _merge_results(
+    *sources: Iterator[tuple[str, str, int, Optional[str]]],
+) -> Iterator[tuple[str, str, int, Optional[str]]]:
+    """
+    Drain each result iterator on its own thread, yielding results as any of
+    them produces one, so the upload pools behind them run at the same time.
+    
+    An exception raised by a source is re-raised here.
+    """
+    results: queue.Queue = queue.Queue()
+    finished = object()
+    
+    def drain(source: Iterator[tuple[str, str, int, Optional[str]]]) -> None:
+        try:
+            for result in source:
+                results.put(result)
+        except BaseException as e:
+            results.put((finished, e))
+            return
+        results.put((finished, None))
+    
+    for source in sources:
+        threading.Thread(target=drain, args=(source,), daemon=True).start()
+    
+    remaining = len(sources)
+    while remaining:
+        result = results.get()
+        if result[0] is finished:
+            remaining -= 1
+            if result[1] is not None:
+                raise result[1]
+            continue
+        yield result
+
+
+def migrate(
+    container_client: ContainerClient,
+    data_root: Path,
+    skip_existing: bool = True,
+    parallelism: int = DEFAULT_PARALLELISM,
+    source_url: Optional[str] = None,
+    max_concurrency_per_file: int = PARALLEL_BLOCKS_CONCURRENCY,
+    single_put_size: int = MAX_SINGLE_PUT_SIZE,
+    block_size: int = MAX_BLOCK_SIZE,
+) -> MigrationStats:
+    """
+    Perform the actual migration to Azure Blob Storage.
+    
+    Files sent as a single PUT are uploaded concurrently by a pool of
+    `parallelism` threads, one connection each. Files over single_put_size or
+    STAGED_UPLOAD_THRESHOLD are chunked or staged, and go through a smaller pool
+    at the same time, each pushing its blocks over several connections. All
+    workers share one ContainerClient (and so one HTTP connection pool).
+    
+    If source_url (a container URL, with a SAS if needed) is given, blobs are
+    copied server-side from that container instead of uploaded from data_root.
+    
+    max_concurrency_per_file, single_put_size and block_size tune chunked
+    uploads; the last two must match the settings the client was built with.
+    """
     print("\n🚀 MIGRATION MODE - Uploading files to Azure Blob Storage")
     print("="*60)
     
     stats = MigrationStats()
-    files_to_migrate = collect_files(data_root)
-    
-    print(f"\n📁 Source directory: {data_root}")
+    if source_url:
+        source_client = ContainerClient.from_container_url(source_url)
+        files_to_migrate, source_md5s = collect_source_blobs(source_client)
+        print(f"\n📁 Source container: {source_client.url.split('?', 1)[0]} (server-side copy)")
+    else:
+        files_to_migrate = collect_files(data_root)
+        print(f"\n📁 Source directory: {data_root}")
     print(f"📦 Target container: {CONTAINER_NAME}")
     print(f"📊 Total files to process: {len(files_to_migrate)}")
+    print(f"🧵 Parallel uploads: {parallelism}")
+    
+    # One listing per prefix replaces a HEAD request per file
+    existing_blobs: dict[str, tuple[int, Optional[bytes]]] = {}
+    if skip_existing:
+        existing_blobs = list_existing_blobs(container_client)
+        already_there = sum(
+            1 for _, blob_path, _ in files_to_migrate if blob_path in existing_blobs
+        )
+        print(f"⏭️  Already in container (skipped if unchanged): {already_there}")
+        print(f"⬆️  New files to upload: {len(files_to_migrate) - already_there}")
     print()
     
-    for i, (local_path, blob_path) in enumerate(files_to_migrate, 1):
+    if source_url:
+        # Copies move no bytes through this machine, so no large-file pool is needed
+        results = _run_uploads(
+            container_client, interleave_by_app(files_to_migrate), existing_blobs,
+            parallelism, transfer=functools.partial(_copy_one, source_md5s=source_md5s),
+            prefetch=False,
+        )
+    else:
+        # Chunked and staged uploads both open several block connections per file
+        multi_block_size = min(single_put_size, STAGED_UPLOAD_THRESHOLD)
+        small_files: list[tuple[str, str, int]] = []
+        large_files: list[tuple[str, str, int]] = []
+        for file_info in interleave_by_app(files_to_migrate):
+            (large_files if file_info[2] > multi_block_size else small_files).append(file_info)
+        
+        upload = functools.partial(
+            _upload_one,
+            max_concurrency_per_file=max_concurrency_per_file,
+            single_put_size=single_put_size,
+            block_size=block_size,
+        )
+        results = _merge_results(
+            _run_uploads(container_client, small_files, existing_blobs, parallelism, upload),
+            _run_uploads(
+                container_client, large_files, existing_blobs,
+                min(parallelism, LARGE_FILE_WORKERS), upload,
+            ),
+        )
+    completed = 0
+    total = len(files_to_migrate)
+    width = len(str(total))
+    started = time.monotonic()
+    log_lines: list[str] = []
+    
+    def flush_progress() -> None:
+        # One write per batch keeps stdout off the per-file path
+        elapsed = time.monotonic() - started
+        rate = completed / elapsed if elapsed > 0 else 0.0
+        eta = (total - completed) / rate if rate > 0 else 0.0
+        log_lines.append(
+            f"  📈 {completed}/{total} files, {stats.bytes_transferred / (1024*1024):.1f} MB, "
+            f"{rate:.1f} files/s, ETA {eta:.0f}s\n"
+        )
+        sys.stdout.write("".join(log_lines))
+        sys.stdout.flush()
+        log_lines.clear()
+    
+    # Results are only handled on this thread, so stats need no lock
+    for blob_path, status, file_size, error in results:
+        completed += 1
         stats.files_found += 1
-        file_size = local_path.stat().st_size
+        progress = f"[{completed:0{width}d}/{total}]"
         
-        try:
-            blob_client = container_client.get_blob_client(blob_path)
-            
-            # Check if blob already exists
-            if skip_existing and blob_client.exists():
-                print(f"  [{i}/{len(files_to_migrate)}] ⏭️  Skipped (exists): {blob_path}")
-                stats.files_skipped += 1
-                continue
-            
-            # Upload the file
-            with open(local_path, "rb") as file_data:
-                blob_client.upload_blob(file_data, overwrite=True)
-            
+        if status == UPLOAD_SKIPPED:
+            stats.files_skipped += 1
+            log_lines.append(f"  {progress} ⏭️  Skipped (unchanged): {blob_path}\n")
+        elif status == UPLOAD_OK:
             stats.files_uploaded += 1
             stats.bytes_transferred += file_size
-            size_str = f"{file_size:,} bytes" if file_size < 1024 else f"{file_size/1024:.1f} KB"
-            print(f"  [{i}/{len(files_to_migrate)}] ✅ Uploaded: {blob_path} ({size_str})")
-            
-        except AzureError as e:
-            stats.files_failed += 1
-            error_msg = f"Failed to upload {blob_path}: {e}"
-            stats.errors.append(error_msg)
-            print(f"  [{i}/{len(files_to_migrate)}] ❌ Failed: {blob_path} - {e}")
-        except Exception as e:
+            log_lines.append(f"  {progress} ✅ Uploaded: {blob_path} ({_fmt_size(file_size)})\n")
+        else:
             stats.files_failed += 1
-            error_msg = f"Error uploading {blob_path}: {e}"
-            stats.errors.append(error_msg)
-            print(f"  [{i}/{len(files_to_migrate)}] ❌ Error: {blob_path} - {e}")
+            stats.add_error(error)
+            log_lines.append(f"  {progress} ❌ {error}\n")
+        
+        if completed % PROGRESS_FLUSH_EVERY == 0:
+            flush_progress()
+    
+    if completed % PROGRESS_FLUSH_EVERY:
+        flush_progress()
     
     print(stats.summary())
     
     if stats.errors:
         print("\n⚠️  Errors encountered:")
-        for error in stats.errors[:10]:  # Show first 10 errors
+        for error in itertools.islice(stats.errors, 10):  # Show first 10 kept errors
             print(f"    - {error}")
-        if len(stats.errors) > 10:
-            print(f"    ... and {len(stats.errors) - 10} more errors")
+        total_errors = len(stats.errors) + stats.errors_dropped
+        if total_errors > 10:
+            print(f"    ... and {total_errors - 10} more errors")
     
     if stats.files_failed == 0:
         print("\n✅ Migration completed successfully!")
@@ -278,17 +853,24 @@ def migrate(container_client: ContainerClient, data_root: Path, skip_existing: b
 
 
 def verify_migration(container_client: ContainerClient) -> None:
-    """Verify the migration by listing blobs in the container."""
+    """
+    Verify the migration by listing blobs in the container.
+    
+    Each prefix is listed names-only, with the two listings running in parallel.
+    """
     print("\n🔍 Verifying migration - listing blobs in container...")
     
-    applications_count = 0
-    conversations_count = 0
+    def count_prefix(prefix: str) -> int:
+        names = container_client.list_blob_names(
+            name_starts_with=prefix, results_per_page=LIST_PAGE_SIZE,
+        )
+        return sum(1 for _ in names)
     
-    for blob in container_client.list_blobs():
-        if blob.name.startswith("applications/"):
-            applications_count += 1
-        elif blob.name.startswith("conversations/"):
-            conversations_count += 1
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        applications_future = executor.submit(count_prefix, "applications/")
+        conversations_future = executor.submit(count_prefix, "conversations/")
+        applications_count = applications_future.result()
+        conversations_count = conversations_future.result()
     
     print(f"   📁 Applications blobs: {applications_count}")
     print(f"   💬 Conversations blobs: {conversations_count}")
@@ -310,6 +892,10 @@ Examples:
     # Force overwrite existing blobs
     python scripts/migrate_to_blob_storage.py --migrate --overwrite
 
+    # Copy server-side from another container instead of uploading local files
+    python scripts/migrate_to_blob_storage.py --migrate \
+        --source-url "https://<account>.blob.core.windows.net/<container>?<sas>"
+
     # Verify migration after completion
     python scripts/migrate_to_blob_storage.py --verify
         """
@@ -335,7 +921,43 @@ Examples:
     parser.add_argument(
         "--overwrite",
         action="store_true",
-        help="Overwrite existing blobs (default: skip existing)"
+        help="Overwrite existing blobs (default: skip blobs whose content is unchanged)"
+    )
+    parser.add_argument(
+        "--workers", "--parallelism",
+        dest="workers",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help=f"Number of concurrent uploads (default: {DEFAULT_PARALLELISM})"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=MAX_BLOCK_SIZE // _MB,
+        help=f"Block size in MB for chunked uploads (default: {MAX_BLOCK_SIZE // _MB})"
+    )
+    parser.add_argument(
+        "--parallel-threshold",
+        type=int,
+        default=MAX_SINGLE_PUT_SIZE // _MB,
+        help=f"Files larger than this many MB are uploaded in blocks "
+             f"(default: {MAX_SINGLE_PUT_SIZE // _MB})"
+    )
+    parser.add_argument(
+        "--max-concurrency-per-file",
+        type=int,
+        default=PARALLEL_BLOCKS_CONCURRENCY,
+        help=f"Parallel block uploads per chunked file (default: {PARALLEL_BLOCKS_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--source-url",
+        help="Container URL (with SAS if needed) to copy blobs from server-side instead of "
+             "uploading the local data directory (--migrate only)"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show extra connection details (storage account SKU)"
     )
     parser.add_argument(
         "--skip-azure-check",
@@ -349,12 +971,13 @@ Examples:
     print("  Azure Blob Storage Migration Tool")
     print("="*60)
     
-    # Check data directory exists
-    if not DATA_ROOT.exists():
-        print(f"\n❌ Data directory not found: {DATA_ROOT}")
-        sys.exit(1)
-    
-    print(f"\n📁 Data directory: {DATA_ROOT}")
+    # Check data directory exists (not needed when copying from another container)
+    if not (args.source_url and args.migrate):
+        if not DATA_ROOT.exists():
+            print(f"\n❌ Data directory not found: {DATA_ROOT}")
+            sys.exit(1)
+        
+        print(f"\n📁 Data directory: {DATA_ROOT}")
     
     # Check Azure login (unless skipped or dry-run)
     if not args.skip_azure_check and not args.dry_run:
@@ -369,7 +992,13 @@ Examples:
     
     # Test blob connection
     connection_string = get_connection_string()
-    container_client = test_blob_connection(connection_string, CONTAINER_NAME)
+    container_client = test_blob_connection(
+        connection_string, CONTAINER_NAME,
+        pool_size=connection_pool_size(args.workers, args.max_concurrency_per_file),
+        verbose=args.verbose,
+        max_single_put_size=args.parallel_threshold * _MB,
+        max_block_size=args.chunk_size * _MB,
+    )
     if not container_client:
         print("\n❌ Failed to connect to Azure Blob Storage")
         sys.exit(1)
@@ -386,7 +1015,16 @@ Examples:
             print("Migration cancelled.")
             sys.exit(0)
         
-        stats = migrate(container_client, DATA_ROOT, skip_existing=not args.overwrite)
+        migrate(
+            container_client,
+            DATA_ROOT,
+            skip_existing=not args.overwrite,
+            parallelism=args.workers,
+            source_url=args.source_url,
+            max_concurrency_per_file=args.max_concurrency_per_file,
+            single_put_size=args.parallel_threshold * _MB,
+            block_size=args.chunk_size * _MB,
+        )
         
         # Verify after migration
         verify_migration(container_client)
@@ -17,476 +17,310 @@ Options:
 """
 
 import argparse
+import functools
 import json
+import logging
 import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to path (once, even if this module is imported again)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
 
+# Progress output; main() routes it to stdout as bare messages
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Analyzer Schema Definitions
 # =============================================================================
 
+# Shared read-only leaf descriptors for nested properties (one object each)
+_STR = MappingProxyType({"type": "string"})
+_INT = MappingProxyType({"type": "integer"})
+_NUM = MappingProxyType({"type": "number"})
+
+
+def _expand_fields(spec) -> Dict[str, Dict[str, Any]]:
+    """Build a fields mapping from (name, type, method, description[, extra]) rows."""
+    fields = {}
+    for name, field_type, method, description, *extra in spec:
+        fields[name] = {"type": field_type, "method": method, "description": description}
+        if extra:
+            fields[name].update(extra[0])
+    return fields
+
+
+# Field specs are (name, type, method, description[, extra keys]) rows,
+# expanded into the "fields" mapping once at import.
+
 # Document Analyzer Schema - for claims forms, repair estimates, police reports
-AUTO_CLAIMS_DOC_ANALYZER_SCHEMA = {
-    "name": "AutoClaimsDocFields",
-    "description": "Field schema for automotive claims document extraction",
-    "fields": {
-        # Claim Identification
-        "ClaimNumber": {
-            "type": "string",
-            "method": "extract",
-            "description": "Unique claim reference number",
-        },
-        "PolicyNumber": {
-            "type": "string",
-            "method": "extract",
-            "description": "Insurance policy number",
-        },
-        "DateOfLoss": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date the incident occurred",
-        },
-        "DateReported": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date the claim was reported",
-        },
-        
-        # Vehicle Information
-        "VehicleVIN": {
-            "type": "string",
-            "method": "extract",
-            "description": "Vehicle Identification Number (17 characters)",
-        },
-        "VehicleMake": {
-            "type": "string",
-            "method": "extract",
-            "description": "Vehicle manufacturer (Ford, Toyota, etc.)",
-        },
-        "VehicleModel": {
-            "type": "string",
-            "method": "extract",
-            "description": "Vehicle model name",
-        },
-        "VehicleYear": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Vehicle model year",
-        },
-        "VehicleColor": {
-            "type": "string",
-            "method": "extract",
-            "description": "Vehicle exterior color",
-        },
-        "VehicleMileage": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Odometer reading at time of loss",
-        },
-        
-        # Incident Details
-        "IncidentLocation": {
-            "type": "string",
-            "method": "extract",
-            "description": "Address or location where incident occurred",
-        },
-        "IncidentDescription": {
-            "type": "string",
-            "method": "extract",
-            "description": "Narrative description of the incident",
-        },
-        "WeatherConditions": {
-            "type": "string",
-            "method": "extract",
-            "description": "Weather at time of incident (Clear, Rain, Snow, etc.)",
-        },
-        "RoadConditions": {
-            "type": "string",
-            "method": "extract",
-            "description": "Road conditions (Dry, Wet, Icy, etc.)",
-        },
-        "PoliceReportNumber": {
-            "type": "string",
-            "method": "extract",
-            "description": "Police report or case number if applicable",
-        },
-        
-        # Parties Involved
-        "Claimant": {
+_DOC_FIELDS = (
+    # Claim Identification
+    ("ClaimNumber", "string", "extract", "Unique claim reference number"),
+    ("PolicyNumber", "string", "extract", "Insurance policy number"),
+    ("DateOfLoss", "date", "extract", "Date the incident occurred"),
+    ("DateReported", "date", "extract", "Date the claim was reported"),
+
+    # Vehicle Information
+    ("VehicleVIN", "string", "extract", "Vehicle Identification Number (17 characters)"),
+    ("VehicleMake", "string", "extract", "Vehicle manufacturer (Ford, Toyota, etc.)"),
+    ("VehicleModel", "string", "extract", "Vehicle model name"),
+    ("VehicleYear", "integer", "extract", "Vehicle model year"),
+    ("VehicleColor", "string", "extract", "Vehicle exterior color"),
+    ("VehicleMileage", "integer", "extract", "Odometer reading at time of loss"),
+
+    # Incident Details
+    ("IncidentLocation", "string", "extract", "Address or location where incident occurred"),
+    ("IncidentDescription", "string", "extract", "Narrative description of the incident"),
+    ("WeatherConditions", "string", "extract",
+     "Weather at time of incident (Clear, Rain, Snow, etc.)"),
+    ("RoadConditions", "string", "extract", "Road conditions (Dry, Wet, Icy, etc.)"),
+    ("PoliceReportNumber", "string", "extract", "Police report or case number if applicable"),
+
+    # Parties Involved
+    ("Claimant", "object", "extract", "Person filing the claim", {
+        "properties": {
+            "name": _STR,
+            "phone": _STR,
+            "email": _STR,
+            "address": _STR,
+            "driversLicense": _STR,
+        },
+    }),
+    ("OtherParties", "array", "extract", "Other parties involved in the incident", {
+        "items": {
             "type": "object",
-            "method": "extract",
-            "description": "Person filing the claim",
             "properties": {
-                "name": {"type": "string"},
-                "phone": {"type": "string"},
-                "email": {"type": "string"},
-                "address": {"type": "string"},
-                "driversLicense": {"type": "string"},
+                "name": _STR,
+                "phone": _STR,
+                "insuranceCompany": _STR,
+                "policyNumber": _STR,
+                "vehicleInfo": _STR,
             },
         },
-        "OtherParties": {
-            "type": "array",
-            "method": "extract",
-            "description": "Other parties involved in the incident",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "phone": {"type": "string"},
-                    "insuranceCompany": {"type": "string"},
-                    "policyNumber": {"type": "string"},
-                    "vehicleInfo": {"type": "string"},
-                },
-            },
-        },
-        "Witnesses": {
-            "type": "array",
-            "method": "extract",
-            "description": "Witnesses to the incident",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "phone": {"type": "string"},
-                    "statement": {"type": "string"},
-                },
-            },
-        },
-        
-        # Repair Estimate Details
-        "EstimateTotal": {
-            "type": "number",
-            "method": "extract",
-            "description": "Total repair estimate amount in dollars",
-        },
-        "LaborCost": {
-            "type": "number",
-            "method": "extract",
-            "description": "Labor charges for repairs",
-        },
-        "PartsCost": {
-            "type": "number",
-            "method": "extract",
-            "description": "Cost of replacement parts",
-        },
-        "RepairShop": {
+    }),
+    ("Witnesses", "array", "extract", "Witnesses to the incident", {
+        "items": {
             "type": "object",
-            "method": "extract",
-            "description": "Repair facility information",
             "properties": {
-                "name": {"type": "string"},
-                "address": {"type": "string"},
-                "phone": {"type": "string"},
-                "estimateDate": {"type": "date"},
+                "name": _STR,
+                "phone": _STR,
+                "statement": _STR,
             },
         },
-        "RepairLineItems": {
-            "type": "array",
-            "method": "extract",
-            "description": "Individual repair line items",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "description": {"type": "string"},
-                    "partNumber": {"type": "string"},
-                    "quantity": {"type": "integer"},
-                    "unitPrice": {"type": "number"},
-                    "laborHours": {"type": "number"},
-                    "totalPrice": {"type": "number"},
-                },
+    }),
+
+    # Repair Estimate Details
+    ("EstimateTotal", "number", "extract", "Total repair estimate amount in dollars"),
+    ("LaborCost", "number", "extract", "Labor charges for repairs"),
+    ("PartsCost", "number", "extract", "Cost of replacement parts"),
+    ("RepairShop", "object", "extract", "Repair facility information", {
+        "properties": {
+            "name": _STR,
+            "address": _STR,
+            "phone": _STR,
+            "estimateDate": {"type": "date"},
+        },
+    }),
+    ("RepairLineItems", "array", "extract", "Individual repair line items", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "description": _STR,
+                "partNumber": _STR,
+                "quantity": _INT,
+                "unitPrice": _NUM,
+                "laborHours": _NUM,
+                "totalPrice": _NUM,
             },
         },
-        
-        # Coverage Information
-        "CoverageType": {
-            "type": "string",
-            "method": "extract",
-            "description": "Type of coverage: Collision, Comprehensive, Liability, etc.",
-        },
-        "Deductible": {
-            "type": "number",
-            "method": "extract",
-            "description": "Deductible amount",
-        },
-    },
+    }),
+
+    # Coverage Information
+    ("CoverageType", "string", "extract",
+     "Type of coverage: Collision, Comprehensive, Liability, etc."),
+    ("Deductible", "number", "extract", "Deductible amount"),
+)
+AUTO_CLAIMS_DOC_ANALYZER_SCHEMA = {
+    "name": "AutoClaimsDocFields",
+    "description": "Field schema for automotive claims document extraction",
+    "fields": _expand_fields(_DOC_FIELDS),
 }
 
 # Image Analyzer Schema - for damage photos
-AUTO_CLAIMS_IMAGE_ANALYZER_SCHEMA = {
-    "name": "AutoClaimsImageFields",
-    "description": "Field schema for automotive damage image analysis",
-    "fields": {
-        # Vehicle Identification from Image
-        "VehicleIdentified": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether a vehicle is clearly visible in the image",
-        },
-        "VehicleType": {
-            "type": "string",
-            "method": "generate",
-            "description": "Type of vehicle: Sedan, SUV, Truck, Van, Motorcycle, etc.",
-        },
-        "VehicleColor": {
-            "type": "string",
-            "method": "generate",
-            "description": "Visible vehicle color",
-        },
-        "LicensePlateVisible": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether license plate is visible",
-        },
-        "LicensePlateNumber": {
-            "type": "string",
-            "method": "generate",
-            "description": "License plate number if readable",
-        },
-        
-        # Damage Assessment
-        "DamageDetected": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether damage is visible in the image",
-        },
-        "DamageAreas": {
-            "type": "array",
-            "method": "generate",
-            "description": "List of damaged areas detected",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "Location: Front, Rear, Driver Side, Passenger Side, Hood, Roof, etc.",
-                    },
-                    "damageType": {
-                        "type": "string",
-                        "description": "Type: Dent, Scratch, Crack, Crush, Shatter, etc.",
-                    },
-                    "severity": {
-                        "type": "string",
-                        "description": "Severity: Minor, Moderate, Severe",
-                    },
-                    "components": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Affected components: Bumper, Door, Fender, Window, Mirror, etc.",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Detailed description of the damage",
-                    },
+_IMAGE_FIELDS = (
+    # Vehicle Identification from Image
+    ("VehicleIdentified", "boolean", "generate",
+     "Whether a vehicle is clearly visible in the image"),
+    ("VehicleType", "string", "generate",
+     "Type of vehicle: Sedan, SUV, Truck, Van, Motorcycle, etc."),
+    ("VehicleColor", "string", "generate", "Visible vehicle color"),
+    ("LicensePlateVisible", "boolean", "generate", "Whether license plate is visible"),
+    ("LicensePlateNumber", "string", "generate", "License plate number if readable"),
+
+    # Damage Assessment
+    ("DamageDetected", "boolean", "generate", "Whether damage is visible in the image"),
+    ("DamageAreas", "array", "generate", "List of damaged areas detected", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "location": {
+                    "type": "string",
+                    "description": (
+                        "Location: Front, Rear, Driver Side, Passenger Side, Hood, Roof, etc."
+                    ),
+                },
+                "damageType": {
+                    "type": "string",
+                    "description": "Type: Dent, Scratch, Crack, Crush, Shatter, etc.",
+                },
+                "severity": {
+                    "type": "string",
+                    "description": "Severity: Minor, Moderate, Severe",
+                },
+                "components": {
+                    "type": "array",
+                    "items": _STR,
+                    "description": (
+                        "Affected components: Bumper, Door, Fender, Window, Mirror, etc."
+                    ),
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Detailed description of the damage",
                 },
             },
         },
-        "OverallDamageSeverity": {
-            "type": "string",
-            "method": "generate",
-            "description": "Overall severity assessment: Minor, Moderate, Heavy, Total Loss",
-        },
-        "EstimatedRepairCategory": {
-            "type": "string",
-            "method": "generate",
-            "description": "Repair category: Cosmetic, Structural, Mechanical, Total Loss",
-        },
-        
-        # Image Quality
-        "ImageQuality": {
-            "type": "string",
-            "method": "generate",
-            "description": "Image quality for assessment: Good, Fair, Poor",
-        },
-        "LightingConditions": {
-            "type": "string",
-            "method": "generate",
-            "description": "Lighting: Daylight, Indoor, Low Light, Flash",
-        },
-        "AngleCoverage": {
-            "type": "string",
-            "method": "generate",
-            "description": "Camera angle: Front, Side, Rear, Close-up, Wide",
-        },
-        
-        # Context
-        "EnvironmentVisible": {
-            "type": "string",
-            "method": "generate",
-            "description": "Visible environment: Parking Lot, Street, Highway, Garage, etc.",
-        },
-        "OtherVehiclesVisible": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether other vehicles are visible in the image",
-        },
-    },
+    }),
+    ("OverallDamageSeverity", "string", "generate",
+     "Overall severity assessment: Minor, Moderate, Heavy, Total Loss"),
+    ("EstimatedRepairCategory", "string", "generate",
+     "Repair category: Cosmetic, Structural, Mechanical, Total Loss"),
+
+    # Image Quality
+    ("ImageQuality", "string", "generate", "Image quality for assessment: Good, Fair, Poor"),
+    ("LightingConditions", "string", "generate", "Lighting: Daylight, Indoor, Low Light, Flash"),
+    ("AngleCoverage", "string", "generate", "Camera angle: Front, Side, Rear, Close-up, Wide"),
+
+    # Context
+    ("EnvironmentVisible", "string", "generate",
+     "Visible environment: Parking Lot, Street, Highway, Garage, etc."),
+    ("OtherVehiclesVisible", "boolean", "generate",
+     "Whether other vehicles are visible in the image"),
+)
+AUTO_CLAIMS_IMAGE_ANALYZER_SCHEMA = {
+    "name": "AutoClaimsImageFields",
+    "description": "Field schema for automotive damage image analysis",
+    "fields": _expand_fields(_IMAGE_FIELDS),
 }
 
 # Video Analyzer Schema - for dashcam/surveillance footage
-AUTO_CLAIMS_VIDEO_ANALYZER_SCHEMA = {
-    "name": "AutoClaimsVideoFields",
-    "description": "Field schema for automotive incident video analysis",
-    "fields": {
-        # Video Metadata
-        "VideoDuration": {
-            "type": "string",
-            "method": "extract",
-            "description": "Total video duration",
-        },
-        "VideoSource": {
-            "type": "string",
-            "method": "generate",
-            "description": "Source type: Dashcam, Surveillance, Phone, Body Camera",
-        },
-        "VideoQuality": {
-            "type": "string",
-            "method": "generate",
-            "description": "Video quality: HD, SD, Low",
-        },
-        
-        # Incident Detection
-        "IncidentDetected": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether a collision/incident is visible in the video",
-        },
-        "ImpactTimestamp": {
-            "type": "string",
-            "method": "generate",
-            "description": "Timestamp of primary impact if detected",
-        },
-        "IncidentType": {
-            "type": "string",
-            "method": "generate",
-            "description": "Type: Rear-end, T-bone, Sideswipe, Head-on, Single Vehicle, Hit and Run",
-        },
-        
-        # Video Segments
-        "VideoSegments": {
-            "type": "array",
-            "method": "generate",
-            "description": "Logical segments of the video",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "startTime": {"type": "string"},
-                    "endTime": {"type": "string"},
-                    "label": {
-                        "type": "string",
-                        "description": "Segment label: Pre-Incident, Impact, Post-Incident",
-                    },
-                    "description": {"type": "string"},
+_VIDEO_FIELDS = (
+    # Video Metadata
+    ("VideoDuration", "string", "extract", "Total video duration"),
+    ("VideoSource", "string", "generate", "Source type: Dashcam, Surveillance, Phone, Body Camera"),
+    ("VideoQuality", "string", "generate", "Video quality: HD, SD, Low"),
+
+    # Incident Detection
+    ("IncidentDetected", "boolean", "generate",
+     "Whether a collision/incident is visible in the video"),
+    ("ImpactTimestamp", "string", "generate", "Timestamp of primary impact if detected"),
+    ("IncidentType", "string", "generate",
+     "Type: Rear-end, T-bone, Sideswipe, Head-on, Single Vehicle, Hit and Run"),
+
+    # Video Segments
+    ("VideoSegments", "array", "generate", "Logical segments of the video", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "startTime": _STR,
+                "endTime": _STR,
+                "label": {
+                    "type": "string",
+                    "description": "Segment label: Pre-Incident, Impact, Post-Incident",
                 },
+                "description": _STR,
             },
         },
-        
-        # Vehicles in Video
-        "VehiclesIdentified": {
-            "type": "array",
-            "method": "generate",
-            "description": "Vehicles visible in the video",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "vehicleId": {"type": "string"},
-                    "type": {"type": "string"},
-                    "color": {"type": "string"},
-                    "role": {
-                        "type": "string",
-                        "description": "Role: Subject Vehicle, Other Party, Witness, Parked",
-                    },
-                    "licensePlate": {"type": "string"},
+    }),
+
+    # Vehicles in Video
+    ("VehiclesIdentified", "array", "generate", "Vehicles visible in the video", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "vehicleId": _STR,
+                "type": _STR,
+                "color": _STR,
+                "role": {
+                    "type": "string",
+                    "description": "Role: Subject Vehicle, Other Party, Witness, Parked",
                 },
+                "licensePlate": _STR,
             },
         },
-        
-        # Speed and Movement
-        "EstimatedSpeed": {
-            "type": "string",
-            "method": "generate",
-            "description": "Estimated speed at impact if determinable",
-        },
-        "MovementPattern": {
-            "type": "string",
-            "method": "generate",
-            "description": "Movement: Straight, Turning, Lane Change, Reversing, Stopped",
-        },
-        
-        # Audio/Transcript
-        "Transcript": {
-            "type": "string",
-            "method": "extract",
-            "description": "Transcript of any speech in the video",
-        },
-        "SignificantSounds": {
-            "type": "array",
-            "method": "generate",
-            "description": "Notable sounds detected",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "timestamp": {"type": "string"},
-                    "soundType": {
-                        "type": "string",
-                        "description": "Type: Impact, Braking, Horn, Glass Breaking, etc.",
-                    },
+    }),
+
+    # Speed and Movement
+    ("EstimatedSpeed", "string", "generate", "Estimated speed at impact if determinable"),
+    ("MovementPattern", "string", "generate",
+     "Movement: Straight, Turning, Lane Change, Reversing, Stopped"),
+
+    # Audio/Transcript
+    ("Transcript", "string", "extract", "Transcript of any speech in the video"),
+    ("SignificantSounds", "array", "generate", "Notable sounds detected", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "timestamp": _STR,
+                "soundType": {
+                    "type": "string",
+                    "description": "Type: Impact, Braking, Horn, Glass Breaking, etc.",
                 },
             },
         },
-        
-        # Traffic/Environment
-        "TrafficConditions": {
-            "type": "string",
-            "method": "generate",
-            "description": "Traffic: Light, Moderate, Heavy, Stopped",
-        },
-        "WeatherVisible": {
-            "type": "string",
-            "method": "generate",
-            "description": "Visible weather: Clear, Rain, Snow, Fog",
-        },
-        "TimeOfDay": {
-            "type": "string",
-            "method": "generate",
-            "description": "Time of day: Daytime, Dusk, Dawn, Night",
-        },
-        
-        # Liability Indicators
-        "TrafficSignalsVisible": {
-            "type": "array",
-            "method": "generate",
-            "description": "Traffic signals/signs visible",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string"},
-                    "state": {"type": "string"},
-                    "timestamp": {"type": "string"},
-                },
+    }),
+
+    # Traffic/Environment
+    ("TrafficConditions", "string", "generate", "Traffic: Light, Moderate, Heavy, Stopped"),
+    ("WeatherVisible", "string", "generate", "Visible weather: Clear, Rain, Snow, Fog"),
+    ("TimeOfDay", "string", "generate", "Time of day: Daytime, Dusk, Dawn, Night"),
+
+    # Liability Indicators
+    ("TrafficSignalsVisible", "array", "generate", "Traffic signals/signs visible", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "type": _STR,
+                "state": _STR,
+                "timestamp": _STR,
             },
         },
-        "LaneMarkingsVisible": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether lane markings are visible",
-        },
-        "RightOfWayViolation": {
-            "type": "boolean",
-            "method": "generate",
-            "description": "Whether a right-of-way violation is apparent",
-        },
-    },
+    }),
+    ("LaneMarkingsVisible", "boolean", "generate", "Whether lane markings are visible"),
+    ("RightOfWayViolation", "boolean", "generate", "Whether a right-of-way violation is apparent"),
+)
+AUTO_CLAIMS_VIDEO_ANALYZER_SCHEMA = {
+    "name": "AutoClaimsVideoFields",
+    "description": "Field schema for automotive incident video analysis",
+    "fields": _expand_fields(_VIDEO_FIELDS),
 }
 
 
@@ -494,69 +328,215 @@ AUTO_CLAIMS_VIDEO_ANALYZER_SCHEMA = {
 # Analyzer Configuration
 # =============================================================================
 
-def get_analyzer_configs() -> Dict[str, Dict[str, Any]]:
-    """Get configuration for all automotive claims analyzers."""
-    return {
-        "autoClaimsDocAnalyzer": {
-            "description": "Automotive claims document analyzer for claims forms, repair estimates, and police reports",
-            "baseAnalyzerId": "prebuilt-document",
-            "fieldSchema": AUTO_CLAIMS_DOC_ANALYZER_SCHEMA,
-            "config": {
-                "returnDetails": True,
-                "enableOcr": True,
-                "enableLayout": True,
-                "tableFormat": "markdown",
-                "estimateFieldSourceAndConfidence": True,
-            },
-            "models": {
-                "completion": "gpt-4.1",
-            },
+# Built once at import; the deploy/verify/delete paths only read it.
+_ANALYZER_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "autoClaimsDocAnalyzer": {
+        "description": (
+            "Automotive claims document analyzer for claims forms, repair estimates, "
+            "and police reports"
+        ),
+        "baseAnalyzerId": "prebuilt-document",
+        "fieldSchema": AUTO_CLAIMS_DOC_ANALYZER_SCHEMA,
+        "config": {
+            "returnDetails": True,
+            "enableOcr": True,
+            "enableLayout": True,
+            "tableFormat": "markdown",
+            "estimateFieldSourceAndConfidence": True,
+        },
+        "models": {
+            "completion": "gpt-4.1",
         },
-        "autoClaimsImageAnalyzer": {
-            "description": "Automotive claims image analyzer for vehicle damage assessment",
-            "baseAnalyzerId": "prebuilt-image",
-            "fieldSchema": AUTO_CLAIMS_IMAGE_ANALYZER_SCHEMA,
-            "config": {
-                "returnDetails": True,
-                "estimateFieldSourceAndConfidence": True,
-            },
-            "models": {
-                "completion": "gpt-4.1",
-            },
+    },
+    "autoClaimsImageAnalyzer": {
+        "description": "Automotive claims image analyzer for vehicle damage assessment",
+        "baseAnalyzerId": "prebuilt-image",
+        "fieldSchema": AUTO_CLAIMS_IMAGE_ANALYZER_SCHEMA,
+        "config": {
+            "returnDetails": True,
+            "estimateFieldSourceAndConfidence": True,
         },
-        "autoClaimsVideoAnalyzer": {
-            "description": "Automotive claims video analyzer for incident footage analysis",
-            "baseAnalyzerId": "prebuilt-video",
-            "fieldSchema": AUTO_CLAIMS_VIDEO_ANALYZER_SCHEMA,
-            "config": {
-                "returnDetails": True,
-                "enableTranscription": True,
-                "estimateFieldSourceAndConfidence": True,
-            },
-            "models": {
-                "completion": "gpt-4.1",
-            },
+        "models": {
+            "completion": "gpt-4.1",
         },
-    }
+    },
+    "autoClaimsVideoAnalyzer": {
+        "description": "Automotive claims video analyzer for incident footage analysis",
+        "baseAnalyzerId": "prebuilt-video",
+        "fieldSchema": AUTO_CLAIMS_VIDEO_ANALYZER_SCHEMA,
+        "config": {
+            "returnDetails": True,
+            "enableTranscription": True,
+            "estimateFieldSourceAndConfidence": True,
+        },
+        "models": {
+            "completion": "gpt-4.1",
+        },
+    },
+})
+
+
+def get_analyzer_configs() -> Mapping[str, Mapping[str, Any]]:
+    """Get configuration for all automotive claims analyzers (read-only)."""
+    return _ANALYZER_CONFIGS
+
+
+# Field types and generation methods accepted by Content Understanding
+FIELD_TYPES = frozenset(
+    {"string", "date", "time", "number", "integer", "boolean", "array", "object"}
+)
+FIELD_METHODS = frozenset({"extract", "generate", "classify"})
+
+
+def validate_field_schema(field_schema: Mapping[str, Any]) -> List[str]:
+    """
+    Check a field schema's structure locally. Returns a list of problems.
+    
+    Catches malformed definitions (unknown types or methods, arrays without
+    items, objects without properties) before they cost an API round trip.
+    """
+    problems = []
+    
+    def check(path: str, field: Mapping[str, Any], top_level: bool) -> None:
+        field_type = field.get("type")
+        if field_type not in FIELD_TYPES:
+            problems.append(f"{path}: unknown type {field_type!r}")
+        if top_level and field.get("method") not in FIELD_METHODS:
+            problems.append(f"{path}: unknown method {field.get('method')!r}")
+        if field_type == "array":
+            if "items" not in field:
+                problems.append(f"{path}: array without items")
+            else:
+                check(f"{path}[]", field["items"], False)
+        elif field_type == "object":
+            if not field.get("properties"):
+                problems.append(f"{path}: object without properties")
+            for name, prop in field.get("properties", {}).items():
+                check(f"{path}.{name}", prop, False)
+    
+    if not field_schema.get("name"):
+        problems.append("schema has no name")
+    for name, field in field_schema.get("fields", {}).items():
+        check(name, field, True)
+    return problems
+
+
+def _serialize_body(analyzer_id: str, config: Mapping[str, Any]) -> bytes:
+    """Encode the PUT body for an analyzer as compact JSON."""
+    body = {"analyzerId": analyzer_id, **config}
+    return json.dumps(
+        body, separators=(",", ":"), allow_nan=False, default=dict
+    ).encode("utf-8")
+
+
+# The shipped analyzers' PUT bodies never change, so they are encoded once
+_PAYLOAD_CACHE: Mapping[str, bytes] = MappingProxyType({
+    analyzer_id: _serialize_body(analyzer_id, config)
+    for analyzer_id, config in _ANALYZER_CONFIGS.items()
+})
+
+# Validated once at import; create_analyzer refuses to send a schema with problems
+_SCHEMA_PROBLEMS: Mapping[str, List[str]] = MappingProxyType({
+    analyzer_id: validate_field_schema(config["fieldSchema"])
+    for analyzer_id, config in _ANALYZER_CONFIGS.items()
+})
 
 
 # =============================================================================
 # Azure Content Understanding API Functions
 # =============================================================================
 
+# Shared HTTP session: keeps connections to the CU endpoint alive across calls
+# and retries throttled / transient gateway errors with backoff, waiting as
+# long as the service's Retry-After header asks. Every verb is retried: a
+# throttled or unavailable response means the request was not acted on, and
+# streamed sample files are rewound by urllib3 before each resend.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "PUT", "POST", "DELETE"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+
+# Operation polling: check immediately, then back off exponentially with jitter
+POLL_INITIAL_DELAY = 0.25  # seconds before the second status check
+POLL_BACKOFF_FACTOR = 1.6
+POLL_MAX_DELAY = 5.0  # cap on the delay between status checks
+POLL_JITTER = 0.1  # up to this many seconds added to each delay
+
+TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry at which a cached token is renewed
+
+# One credential and token are shared by every API call in the process
+_CREDENTIAL = None
+_TOKEN_CACHE: Dict[str, Any] = {"token": None, "expires_on": 0}
+_TOKEN_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_endpoint() -> str:
+    """Content Understanding endpoint, without a trailing slash."""
+    return os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api_version() -> str:
+    """Content Understanding API version."""
+    return os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
+
+
+@functools.lru_cache(maxsize=None)
+def _analyzer_url(analyzer_id: str) -> str:
+    """Resource URL for an analyzer, built (and the id percent-encoded) once per id."""
+    return f"{_get_endpoint()}/contentunderstanding/analyzers/{quote(analyzer_id, safe='')}"
+
+
+def _get_azure_ad_token() -> str:
+    """Return a cached Azure AD token, fetching a new one when it is close to expiry."""
+    global _CREDENTIAL
+    
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE["expires_on"] - time.time() > TOKEN_REFRESH_MARGIN:
+            return _TOKEN_CACHE["token"]
+        
+        if _CREDENTIAL is None:
+            from azure.identity import DefaultAzureCredential
+            _CREDENTIAL = DefaultAzureCredential()
+        
+        access_token = _CREDENTIAL.get_token(TOKEN_SCOPE)
+        _TOKEN_CACHE["token"] = access_token.token
+        _TOKEN_CACHE["expires_on"] = access_token.expires_on
+        return access_token.token
+
+
 def get_auth_headers() -> Dict[str, str]:
-    """Get authentication headers for Azure CU API."""
-    use_azure_ad = os.getenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD", "true").lower() == "true"
+    """
+    Get authentication headers for Azure CU API.
+    
+    An API key is used as soon as it is set, so azure.identity is never
+    imported, unless AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD=true explicitly
+    asks for Azure AD.
+    """
     api_key = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_KEY")
+    use_azure_ad_setting = os.getenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD")
     
     headers = {"x-ms-useragent": "automotive-claims-setup"}
     
+    if api_key and (use_azure_ad_setting or "").lower() != "true":
+        headers["Ocp-Apim-Subscription-Key"] = api_key
+        return headers
+    
+    use_azure_ad = (use_azure_ad_setting or "true").lower() == "true"
     if use_azure_ad:
         try:
-            from azure.identity import DefaultAzureCredential
-            credential = DefaultAzureCredential()
-            token = credential.get_token("https://cognitiveservices.azure.com/.default").token
-            headers["Authorization"] = f"Bearer {token}"
+            headers["Authorization"] = f"Bearer {_get_azure_ad_token()}"
         except ImportError:
             raise RuntimeError("azure-identity not installed. Run: uv add azure-identity")
         except Exception as e:
@@ -564,107 +544,157 @@ def get_auth_headers() -> Dict[str, str]:
     elif api_key:
         headers["Ocp-Apim-Subscription-Key"] = api_key
     else:
-        raise RuntimeError("No authentication configured. Set AZURE_CONTENT_UNDERSTANDING_API_KEY or use Azure AD.")
+        raise RuntimeError(
+            "No authentication configured. "
+            "Set AZURE_CONTENT_UNDERSTANDING_API_KEY or use Azure AD."
+        )
     
     return headers
 
 
+def _json_body(response) -> Dict[str, Any]:
+    """Parse a JSON response body straight from its bytes; {} when empty."""
+    return json.loads(response.content) if response.content else {}
+
+
 def get_analyzer(analyzer_id: str) -> Optional[Dict[str, Any]]:
     """Check if an analyzer exists and get its configuration."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
-    if not endpoint:
+    if not _get_endpoint():
         raise RuntimeError("AZURE_CONTENT_UNDERSTANDING_ENDPOINT not set")
     
     headers = get_auth_headers()
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=30)
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.json()
+        return _json_body(response)
     except requests.exceptions.HTTPError as e:
         if "404" in str(e):
             return None
         raise
 
 
-def create_analyzer(analyzer_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new custom analyzer."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
+def create_analyzer(
+    analyzer_id: str,
+    config: Mapping[str, Any],
+    only_if_absent: bool = False,
+) -> Dict[str, Any]:
+    """
+    Create a new custom analyzer.
+    
+    With only_if_absent the PUT carries If-None-Match: *, so the service
+    refuses to replace an existing analyzer (412 Precondition Failed, or
+    409 Conflict) instead of overwriting it.
+    """
+    problems = _SCHEMA_PROBLEMS.get(analyzer_id)
+    if problems is None:
+        problems = validate_field_schema(config["fieldSchema"])
+    if problems:
+        raise ValueError(f"Invalid field schema for {analyzer_id}: {'; '.join(problems)}")
     
     headers = get_auth_headers()
     headers["Content-Type"] = "application/json"
+    if only_if_absent:
+        headers["If-None-Match"] = "*"
     
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
-    body = {
-        "analyzerId": analyzer_id,
-        **config,
-    }
+    if config is _ANALYZER_CONFIGS.get(analyzer_id):
+        payload = _PAYLOAD_CACHE[analyzer_id]
+    else:
+        payload = _serialize_body(analyzer_id, config)
     
-    response = requests.put(url, headers=headers, params=params, json=body, timeout=60)
+    response = _SESSION.put(url, headers=headers, params=params, data=payload, timeout=60)
     response.raise_for_status()
     
     # Handle async operation
     if response.status_code == 202:
         return poll_operation(response, headers)
     
-    return response.json() if response.text else {"analyzerId": analyzer_id, "status": "succeeded"}
+    return _json_body(response) or {"analyzerId": analyzer_id, "status": "succeeded"}
 
 
-def update_analyzer(analyzer_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Update an existing analyzer (delete and recreate)."""
+def update_analyzer(analyzer_id: str, config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Update an existing analyzer.
+    
+    PUT is an upsert, so the analyzer is replaced in place. Only if the
+    service refuses that with 409 Conflict is it deleted, and recreated once
+    the deletion is visible.
+    """
+    try:
+        return create_analyzer(analyzer_id, config)
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code != 409:
+            raise
+    
     delete_analyzer(analyzer_id)
-    time.sleep(2)  # Wait for deletion to propagate
+    wait_for_deletion(analyzer_id)
     return create_analyzer(analyzer_id, config)
 
 
+def wait_for_deletion(analyzer_id: str, timeout_seconds: int = 60) -> None:
+    """Wait until get_analyzer() no longer finds the analyzer."""
+    start_time = time.time()
+    attempt = 0
+    while get_analyzer(analyzer_id) is not None:
+        if time.time() - start_time > timeout_seconds:
+            raise TimeoutError(f"Deletion of {analyzer_id} not visible after {timeout_seconds}s")
+        time.sleep(_poll_delay(attempt))
+        attempt += 1
+
+
 def delete_analyzer(analyzer_id: str) -> bool:
     """Delete an analyzer."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
     headers = get_auth_headers()
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
-    response = requests.delete(url, headers=headers, params=params, timeout=30)
+    response = _SESSION.delete(url, headers=headers, params=params, timeout=30)
     if response.status_code == 404:
         return False
     response.raise_for_status()
     return True
 
 
+def _poll_delay(attempt: int) -> float:
+    """
+    Seconds to wait after the given (0-based) unsuccessful status check.
+    
+    Short operations finish within the first few checks; long ones settle
+    at POLL_MAX_DELAY.
+    """
+    delay = min(POLL_MAX_DELAY, POLL_INITIAL_DELAY * (POLL_BACKOFF_FACTOR ** attempt))
+    return delay + random.uniform(0, POLL_JITTER)
+
+
 def poll_operation(response, headers: Dict[str, str], timeout_seconds: int = 120) -> Dict[str, Any]:
-    """Poll an async operation until completion."""
-    import requests
+    """
+    Poll an async operation until completion.
     
+    Only the operation's running/succeeded/failed state is handled here;
+    throttling and transient errors on the status requests are retried by
+    the session's adapter.
+    """
     operation_location = response.headers.get("operation-location", "")
     if not operation_location:
         raise ValueError("No operation-location header in response")
     
     start_time = time.time()
+    attempt = 0
     while True:
         if time.time() - start_time > timeout_seconds:
             raise TimeoutError(f"Operation timed out after {timeout_seconds}s")
         
-        poll_response = requests.get(operation_location, headers=headers, timeout=30)
+        poll_response = _SESSION.get(operation_location, headers=headers, timeout=30)
         poll_response.raise_for_status()
         
-        result = poll_response.json()
+        result = _json_body(poll_response)
         status = result.get("status", "").lower()
         
         if status == "succeeded":
@@ -672,31 +702,44 @@ def poll_operation(response, headers: Dict[str, str], timeout_seconds: int = 120
         elif status == "failed":
             raise RuntimeError(f"Operation failed: {result}")
         
-        time.sleep(2)
-
-
-def verify_analyzer(analyzer_id: str, sample_content: bytes, content_type: str) -> bool:
-    """Verify an analyzer works with sample content."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
+        time.sleep(_poll_delay(attempt))
+        attempt += 1
+
+
+def verify_analyzer(
+    analyzer_id: str,
+    sample: Union[bytes, BinaryIO, str, Path],
+    content_type: str,
+) -> bool:
+    """
+    Verify an analyzer works with sample content.
+    
+    sample may be raw bytes, an open binary file, or a path. Files and paths
+    are streamed from disk rather than loaded into memory, which matters for
+    large video samples.
+    """
     headers = get_auth_headers()
     headers["Content-Type"] = "application/octet-stream"
     
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}:analyzeBinary"
-    params = {"api-version": api_version}
+    url = f"{_analyzer_url(analyzer_id)}:analyzeBinary"
+    params = {"api-version": _get_api_version()}
     
     try:
-        response = requests.post(url, headers=headers, params=params, data=sample_content, timeout=60)
+        if isinstance(sample, (str, Path)):
+            # requests sends the file size as Content-Length and reads it in chunks
+            with open(sample, "rb") as sample_file:
+                response = _SESSION.post(
+                    url, headers=headers, params=params, data=sample_file, timeout=60,
+                )
+        else:
+            response = _SESSION.post(url, headers=headers, params=params, data=sample, timeout=60)
         response.raise_for_status()
         
         # Poll for result
         result = poll_operation(response, headers, timeout_seconds=180)
         return result.get("status", "").lower() == "succeeded"
     except Exception as e:
-        print(f"  ⚠️  Verification failed: {e}")
+        logger.warning(f"  ⚠️  Verification failed: {e}")
         return False
 
 
@@ -704,88 +747,109 @@ def verify_analyzer(analyzer_id: str, sample_content: bytes, content_type: str)
 # Deployment Functions
 # =============================================================================
 
-def deploy_analyzers(force: bool = False) -> bool:
-    """Deploy all automotive claims analyzers."""
-    configs = get_analyzer_configs()
-    success = True
+def _run_per_analyzer(task, configs: Mapping[str, Mapping[str, Any]], *args) -> bool:
+    """
+    Run task(analyzer_id, config, *args) for every analyzer concurrently.
     
-    print("\n" + "="*60)
-    print("Deploying Automotive Claims Analyzers")
-    print("="*60)
+    Each task returns (ok, lines). Output is logged in config order once all
+    tasks finish, one record per analyzer, so it reads the same as a
+    sequential run.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(configs))) as executor:
+        futures = {
+            analyzer_id: executor.submit(task, analyzer_id, config, *args)
+            for analyzer_id, config in configs.items()
+        }
+    
+    success = True
+    for future in futures.values():
+        ok, lines = future.result()
+        logger.info("\n" + "\n".join(lines))
+        success = success and ok
+    return success
+
+
+def _deploy_one(analyzer_id: str, config: Mapping[str, Any], force: bool) -> Tuple[bool, List[str]]:
+    """Create or update one analyzer. Returns (ok, output lines)."""
+    lines = [f"📦 {analyzer_id}", f"   Base: {config['baseAnalyzerId']}"]
     
-    for analyzer_id, config in configs.items():
-        print(f"\n📦 {analyzer_id}")
-        print(f"   Base: {config['baseAnalyzerId']}")
+    try:
+        # One conditional PUT per analyzer; no GET probe beforehand
+        if force:
+            lines.append("   🔄 Creating or replacing analyzer...")
+            update_analyzer(analyzer_id, config)
+        else:
+            try:
+                create_analyzer(analyzer_id, config, only_if_absent=True)
+            except requests.exceptions.HTTPError as e:
+                # 412 answers the precondition; 409 is how a conflicting create is refused
+                if e.response is None or e.response.status_code not in (409, 412):
+                    raise
+                lines.append("   ✅ Already exists (use --force to recreate)")
+                return True, lines
+            lines.append("   ➕ Created new analyzer")
         
-        try:
-            existing = get_analyzer(analyzer_id)
-            
-            if existing and not force:
-                print("   ✅ Already exists (use --force to recreate)")
-                continue
-            
-            if existing:
-                print("   🔄 Updating existing analyzer...")
-                result = update_analyzer(analyzer_id, config)
-            else:
-                print("   ➕ Creating new analyzer...")
-                result = create_analyzer(analyzer_id, config)
-            
-            print("   ✅ Deployed successfully")
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
-            success = False
+        lines.append("   ✅ Deployed successfully")
+        return True, lines
+        
+    except Exception as e:
+        lines.append(f"   ❌ Failed: {e}")
+        return False, lines
+
+
+def _verify_one(analyzer_id: str, config: Mapping[str, Any]) -> Tuple[bool, List[str]]:
+    """Check one analyzer exists. Returns (ok, output lines)."""
+    lines = [f"🔍 {analyzer_id}"]
     
-    return success
+    try:
+        if get_analyzer(analyzer_id):
+            lines.append("   ✅ Exists")
+            return True, lines
+        lines.append("   ❌ Not found")
+        return False, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, lines
 
 
-def verify_all_analyzers() -> bool:
-    """Verify all analyzers are deployed and working."""
-    configs = get_analyzer_configs()
+def _delete_one(analyzer_id: str, config: Mapping[str, Any]) -> Tuple[bool, List[str]]:
+    """Delete one analyzer. Returns (ok, output lines); errors are reported, not fatal."""
+    lines = [f"🗑️  {analyzer_id}"]
     
-    print("\n" + "="*60)
-    print("Verifying Automotive Claims Analyzers")
-    print("="*60)
+    try:
+        if delete_analyzer(analyzer_id):
+            lines.append("   ✅ Deleted")
+        else:
+            lines.append("   ⏭️  Not found (already deleted)")
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+    return True, lines
+
+
+def _log_header(title: str) -> None:
+    """Log a section banner as a single record."""
+    logger.info("\n" + "="*60 + f"\n{title}\n" + "="*60)
+
+
+def deploy_analyzers(force: bool = False) -> bool:
+    """Deploy all automotive claims analyzers (concurrently)."""
+    _log_header("Deploying Automotive Claims Analyzers")
     
-    all_exist = True
-    for analyzer_id in configs:
-        print(f"\n🔍 {analyzer_id}")
-        
-        try:
-            existing = get_analyzer(analyzer_id)
-            if existing:
-                print("   ✅ Exists")
-            else:
-                print("   ❌ Not found")
-                all_exist = False
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            all_exist = False
+    return _run_per_analyzer(_deploy_one, get_analyzer_configs(), force)
+
+
+def verify_all_analyzers() -> bool:
+    """Verify all analyzers are deployed and working."""
+    _log_header("Verifying Automotive Claims Analyzers")
     
-    return all_exist
+    return _run_per_analyzer(_verify_one, get_analyzer_configs())
 
 
 def delete_all_analyzers() -> bool:
     """Delete all automotive claims analyzers."""
-    configs = get_analyzer_configs()
-    
-    print("\n" + "="*60)
-    print("Deleting Automotive Claims Analyzers")
-    print("="*60)
+    _log_header("Deleting Automotive Claims Analyzers")
     
-    for analyzer_id in configs:
-        print(f"\n🗑️  {analyzer_id}")
-        
-        try:
-            if delete_analyzer(analyzer_id):
-                print("   ✅ Deleted")
-            else:
-                print("   ⏭️  Not found (already deleted)")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-    
-    return True
+    return _run_per_analyzer(_delete_one, get_analyzer_configs())
 
 
 # =============================================================================
@@ -815,14 +879,16 @@ def main():
     
     args = parser.parse_args()
     
+    logging.basicConfig(format="%(message)s", level=logging.INFO, stream=sys.stdout)
+    
     # Check environment
     endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT")
     if not endpoint:
-        print("❌ AZURE_CONTENT_UNDERSTANDING_ENDPOINT not set")
-        print("   Set this environment variable to your Azure AI Services endpoint")
+        logger.error("❌ AZURE_CONTENT_UNDERSTANDING_ENDPOINT not set\n"
+                     "   Set this environment variable to your Azure AI Services endpoint")
         sys.exit(1)
     
-    print(f"🔗 Endpoint: {endpoint}")
+    logger.info(f"🔗 Endpoint: {endpoint}")
     
     try:
         if args.delete:
@@ -833,13 +899,13 @@ def main():
             success = deploy_analyzers(force=args.force)
         
         if success:
-            print("\n✅ Operation completed successfully")
+            logger.info("\n✅ Operation completed successfully")
         else:
-            print("\n⚠️  Operation completed with errors")
+            logger.warning("\n⚠️  Operation completed with errors")
             sys.exit(1)
             
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error(f"\n❌ Error: {e}")
         sys.exit(1)
 
 
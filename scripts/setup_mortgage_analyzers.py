@@ -12,20 +12,27 @@ Usage:
 Options:
     --verify    Only verify analyzer exists, don't create/update
     --delete    Delete the mortgage analyzer
-    --force     Force recreate even if analyzer exists
+    --force     Update the analyzer even if it exists (skipped when already up to date)
+    --verbose   With --verify, also show analyzer details (full GET)
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import requests
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -35,467 +42,177 @@ load_dotenv()
 # Analyzer Schema Definitions
 # =============================================================================
 
+def _expand_fields(spec) -> Dict[str, Dict[str, Any]]:
+    """Build a fields mapping from (name, type, method, description[, extra]) rows."""
+    fields = {}
+    for name, field_type, method, description, *extra in spec:
+        fields[name] = {"type": field_type, "method": method, "description": description}
+        if extra:
+            fields[name].update(extra[0])
+    return fields
+
+
+# Field specs are (name, type, method, description[, extra keys]) rows,
+# expanded into the "fields" mapping once at import.
+
 # Mortgage Document Analyzer Schema - for all mortgage document types
-MORTGAGE_DOC_FIELD_SCHEMA = {
-    "name": "MortgageDocFields",
-    "description": "Field schema for Canadian mortgage document extraction",
-    "fields": {
-        # ===== Borrower Identity =====
-        "BorrowerFullName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Full legal name of the primary mortgage borrower",
-        },
-        "BorrowerDateOfBirth": {
-            "type": "date",
-            "method": "extract",
-            "description": "Borrower's date of birth",
-        },
-        "BorrowerSIN": {
-            "type": "string",
-            "method": "extract",
-            "description": "Social Insurance Number (Canadian: XXX-XXX-XXX format)",
-        },
-        "BorrowerAddress": {
-            "type": "string",
-            "method": "extract",
-            "description": "Current residential address of borrower",
-        },
-        "CoBorrowerName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Full name of co-borrower/co-applicant if present",
-        },
-        
-        # ===== Employment Information =====
-        "EmployerName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Name of employer or business",
-        },
-        "EmployerAddress": {
-            "type": "string",
-            "method": "extract",
-            "description": "Employer's business address",
-        },
-        "PositionTitle": {
-            "type": "string",
-            "method": "extract",
-            "description": "Job title or position",
-        },
-        "EmploymentStartDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date employment commenced",
-        },
-        "EmploymentType": {
-            "type": "string",
-            "method": "extract",
-            "description": "Employment type: Full-time, Part-time, Contract, Self-employed",
-        },
-        "EmploymentStatus": {
-            "type": "string",
-            "method": "extract",
-            "description": "Status: Permanent, Probationary, Temporary, Contract",
-        },
-        
-        # ===== Income - Pay Stub Fields =====
-        "PayPeriod": {
-            "type": "string",
-            "method": "extract",
-            "description": "Pay period dates (e.g., Jan 1 - Jan 15, 2026)",
-        },
-        "PayDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date of payment on pay stub",
-        },
-        "GrossPayPeriodAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Gross earnings for the pay period in CAD",
-        },
-        "NetPayPeriodAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Net (take-home) pay for the period in CAD",
-        },
-        "YTDEarnings": {
-            "type": "number",
-            "method": "extract",
-            "description": "Year-to-date gross earnings in CAD",
-        },
-        "YTDGrossEarnings": {
-            "type": "number",
-            "method": "extract",
-            "description": "Year-to-date gross earnings in CAD (alias for YTDEarnings)",
-        },
-        "YTDNetEarnings": {
-            "type": "number",
-            "method": "extract",
-            "description": "Year-to-date net earnings in CAD",
-        },
-        "RegularHours": {
-            "type": "number",
-            "method": "extract",
-            "description": "Regular hours worked in pay period",
-        },
-        "OvertimeHours": {
-            "type": "number",
-            "method": "extract",
-            "description": "Overtime hours worked in pay period",
-        },
-        "HourlyRate": {
-            "type": "number",
-            "method": "extract",
-            "description": "Hourly wage rate if applicable",
-        },
-        
-        # ===== Income - Annual/Salary Fields =====
-        "GrossAnnualSalary": {
-            "type": "number",
-            "method": "extract",
-            "description": "Gross annual salary or wages in CAD",
-        },
-        "BonusAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Annual bonus amount in CAD",
-        },
-        "CommissionAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Annual commission income in CAD",
-        },
-        "OvertimeAnnual": {
-            "type": "number",
-            "method": "extract",
-            "description": "Annual overtime earnings in CAD",
-        },
-        
-        # ===== T4 Specific Fields =====
-        "TaxYear": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Tax year for T4 or NOA document",
-        },
-        "TotalIncomeFromT4": {
-            "type": "number",
-            "method": "extract",
-            "description": "Box 14 - Total employment income from T4",
-        },
-        "IncomeTaxDeducted": {
-            "type": "number",
-            "method": "extract",
-            "description": "Box 22 - Income tax deducted on T4",
-        },
-        "CPPContributions": {
-            "type": "number",
-            "method": "extract",
-            "description": "Box 16 - CPP contributions on T4",
-        },
-        "EIInsurablePremiums": {
-            "type": "number",
-            "method": "extract",
-            "description": "Box 18 - EI premiums on T4",
-        },
-        "RPPContributions": {
-            "type": "number",
-            "method": "extract",
-            "description": "Box 20 - RPP contributions on T4",
-        },
-        
-        # ===== NOA Specific Fields =====
-        "TotalIncomeFromNOA": {
-            "type": "number",
-            "method": "extract",
-            "description": "Line 15000 - Total income from Notice of Assessment",
-        },
-        "NetIncomeFromNOA": {
-            "type": "number",
-            "method": "extract",
-            "description": "Line 23600 - Net income from NOA",
-        },
-        "TaxableIncomeFromNOA": {
-            "type": "number",
-            "method": "extract",
-            "description": "Line 26000 - Taxable income from NOA",
-        },
-        "TaxOwedOrRefund": {
-            "type": "number",
-            "method": "extract",
-            "description": "Balance owing or refund amount from NOA",
-        },
-        "RRSPDeductionLimit": {
-            "type": "number",
-            "method": "extract",
-            "description": "RRSP deduction limit for next year from NOA",
-        },
-        
-        # ===== Credit Report Fields =====
-        "CreditScore": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Credit score (Equifax or TransUnion, range 300-900)",
-        },
-        "CreditBureau": {
-            "type": "string",
-            "method": "extract",
-            "description": "Credit bureau: Equifax or TransUnion",
-        },
-        "CreditReportDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date the credit report was pulled",
-        },
-        
-        # ===== Property Information =====
-        "PropertyAddress": {
-            "type": "string",
-            "method": "extract",
-            "description": "Full civic address of subject property",
-        },
-        "PropertyType": {
-            "type": "string",
-            "method": "extract",
-            "description": "Property type: Detached, Semi, Townhouse, Condo, etc.",
-        },
-        "PurchasePrice": {
-            "type": "number",
-            "method": "extract",
-            "description": "Purchase price from agreement of purchase and sale",
-        },
-        "AppraisedValue": {
-            "type": "number",
-            "method": "extract",
-            "description": "Appraised market value from appraisal report",
-        },
-        "PropertyTaxesAnnual": {
-            "type": "number",
-            "method": "extract",
-            "description": "Annual property taxes in CAD",
-        },
-        "CondoFeesMonthly": {
-            "type": "number",
-            "method": "extract",
-            "description": "Monthly condominium fees if applicable",
-        },
-        "HeatingCostMonthly": {
-            "type": "number",
-            "method": "extract",
-            "description": "Estimated monthly heating costs",
-        },
-        "LotSize": {
-            "type": "string",
-            "method": "extract",
-            "description": "Lot dimensions or area",
-        },
-        "YearBuilt": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Year the property was built",
-        },
-        "LivingArea": {
-            "type": "number",
-            "method": "extract",
-            "description": "Living area in square feet",
-        },
-        
-        # ===== Appraisal Specific Fields =====
-        "AppraisalDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date of property appraisal",
-        },
-        "AppraiserName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Name of the certified appraiser",
-        },
-        "AppraiserLicense": {
-            "type": "string",
-            "method": "extract",
-            "description": "Appraiser license/designation number",
-        },
-        "ComparableSales": {
-            "type": "array",
-            "method": "extract",
-            "description": "Comparable property sales used for valuation",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "address": {"type": "string"},
-                    "salePrice": {"type": "number"},
-                    "saleDate": {"type": "date"},
-                    "adjustment": {"type": "number"},
-                },
+# (fields are read-only; the PUT body below is encoded from them once)
+_MORTGAGE_DOC_FIELDS = (
+    # ===== Borrower Identity =====
+    ("BorrowerFullName", "string", "extract", "Full legal name of the primary mortgage borrower"),
+    ("BorrowerDateOfBirth", "date", "extract", "Borrower's date of birth"),
+    ("BorrowerSIN", "string", "extract", "Social Insurance Number (Canadian: XXX-XXX-XXX format)"),
+    ("BorrowerAddress", "string", "extract", "Current residential address of borrower"),
+    ("CoBorrowerName", "string", "extract", "Full name of co-borrower/co-applicant if present"),
+
+    # ===== Employment Information =====
+    ("EmployerName", "string", "extract", "Name of employer or business"),
+    ("EmployerAddress", "string", "extract", "Employer's business address"),
+    ("PositionTitle", "string", "extract", "Job title or position"),
+    ("EmploymentStartDate", "date", "extract", "Date employment commenced"),
+    ("EmploymentType", "string", "extract",
+     "Employment type: Full-time, Part-time, Contract, Self-employed"),
+    ("EmploymentStatus", "string", "extract",
+     "Status: Permanent, Probationary, Temporary, Contract"),
+
+    # ===== Income - Pay Stub Fields =====
+    ("PayPeriod", "string", "extract", "Pay period dates (e.g., Jan 1 - Jan 15, 2026)"),
+    ("PayDate", "date", "extract", "Date of payment on pay stub"),
+    ("GrossPayPeriodAmount", "number", "extract", "Gross earnings for the pay period in CAD"),
+    ("NetPayPeriodAmount", "number", "extract", "Net (take-home) pay for the period in CAD"),
+    ("YTDEarnings", "number", "extract", "Year-to-date gross earnings in CAD"),
+    ("YTDNetEarnings", "number", "extract", "Year-to-date net earnings in CAD"),
+    ("RegularHours", "number", "extract", "Regular hours worked in pay period"),
+    ("OvertimeHours", "number", "extract", "Overtime hours worked in pay period"),
+    ("HourlyRate", "number", "extract", "Hourly wage rate if applicable"),
+
+    # ===== Income - Annual/Salary Fields =====
+    ("GrossAnnualSalary", "number", "extract", "Gross annual salary or wages in CAD"),
+    ("BonusAmount", "number", "extract", "Annual bonus amount in CAD"),
+    ("CommissionAmount", "number", "extract", "Annual commission income in CAD"),
+    ("OvertimeAnnual", "number", "extract", "Annual overtime earnings in CAD"),
+
+    # ===== T4 Specific Fields =====
+    ("TaxYear", "integer", "extract", "Tax year for T4 or NOA document"),
+    ("TotalIncomeFromT4", "number", "extract", "Box 14 - Total employment income from T4"),
+    ("IncomeTaxDeducted", "number", "extract", "Box 22 - Income tax deducted on T4"),
+    ("CPPContributions", "number", "extract", "Box 16 - CPP contributions on T4"),
+    ("EIInsurablePremiums", "number", "extract", "Box 18 - EI premiums on T4"),
+    ("RPPContributions", "number", "extract", "Box 20 - RPP contributions on T4"),
+
+    # ===== NOA Specific Fields =====
+    ("TotalIncomeFromNOA", "number", "extract",
+     "Line 15000 - Total income from Notice of Assessment"),
+    ("NetIncomeFromNOA", "number", "extract", "Line 23600 - Net income from NOA"),
+    ("TaxableIncomeFromNOA", "number", "extract", "Line 26000 - Taxable income from NOA"),
+    ("TaxOwedOrRefund", "number", "extract", "Balance owing or refund amount from NOA"),
+    ("RRSPDeductionLimit", "number", "extract", "RRSP deduction limit for next year from NOA"),
+
+    # ===== Credit Report Fields =====
+    ("CreditScore", "integer", "extract", "Credit score (Equifax or TransUnion, range 300-900)"),
+    ("CreditBureau", "string", "extract", "Credit bureau: Equifax or TransUnion"),
+    ("CreditReportDate", "date", "extract", "Date the credit report was pulled"),
+
+    # ===== Property Information =====
+    ("PropertyAddress", "string", "extract", "Full civic address of subject property"),
+    ("PropertyType", "string", "extract", "Property type: Detached, Semi, Townhouse, Condo, etc."),
+    ("PurchasePrice", "number", "extract", "Purchase price from agreement of purchase and sale"),
+    ("AppraisedValue", "number", "extract", "Appraised market value from appraisal report"),
+    ("PropertyTaxesAnnual", "number", "extract", "Annual property taxes in CAD"),
+    ("CondoFeesMonthly", "number", "extract", "Monthly condominium fees if applicable"),
+    ("HeatingCostMonthly", "number", "extract", "Estimated monthly heating costs"),
+    ("LotSize", "string", "extract", "Lot dimensions or area"),
+    ("YearBuilt", "integer", "extract", "Year the property was built"),
+    ("LivingArea", "number", "extract", "Living area in square feet"),
+
+    # ===== Appraisal Specific Fields =====
+    ("AppraisalDate", "date", "extract", "Date of property appraisal"),
+    ("AppraiserName", "string", "extract", "Name of the certified appraiser"),
+    ("AppraiserLicense", "string", "extract", "Appraiser license/designation number"),
+    ("ComparableSales", "array", "extract", "Comparable property sales used for valuation", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "address": {"type": "string"},
+                "salePrice": {"type": "number"},
+                "saleDate": {"type": "date"},
+                "adjustment": {"type": "number"},
             },
         },
-        
-        # ===== Loan Details =====
-        "RequestedLoanAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Requested mortgage principal amount in CAD",
-        },
-        "DownPaymentAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Down payment amount in CAD",
-        },
-        "DownPaymentPercentage": {
-            "type": "number",
-            "method": "extract",
-            "description": "Down payment as percentage of purchase price",
-        },
-        "RequestedAmortization": {
-            "type": "integer",
-            "method": "extract",
-            "description": "Requested amortization period in years",
-        },
-        "InterestRate": {
-            "type": "number",
-            "method": "extract",
-            "description": "Mortgage interest rate as percentage",
-        },
-        "RateTerm": {
-            "type": "string",
-            "method": "extract",
-            "description": "Interest rate term: Variable, 1-year, 5-year fixed, etc.",
-        },
-        "PaymentFrequency": {
-            "type": "string",
-            "method": "extract",
-            "description": "Payment frequency: Monthly, Bi-weekly, Accelerated bi-weekly",
-        },
-        "MortgagePaymentAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Regular mortgage payment amount",
-        },
-        
-        # ===== Gift Letter Fields =====
-        "GiftDonorName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Name of the gift donor",
-        },
-        "GiftAmount": {
-            "type": "number",
-            "method": "extract",
-            "description": "Amount of the gift in CAD",
-        },
-        "GiftRelationship": {
-            "type": "string",
-            "method": "extract",
-            "description": "Relationship of donor to borrower: Parent, Sibling, etc.",
-        },
-        "GiftRepaymentRequired": {
-            "type": "boolean",
-            "method": "extract",
-            "description": "Whether repayment is required (should be false for true gift)",
-        },
-        "GiftLetterDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date of the signed gift letter",
-        },
-        
-        # ===== Bank Statement Fields =====
-        "BankName": {
-            "type": "string",
-            "method": "extract",
-            "description": "Name of financial institution",
-        },
-        "AccountNumber": {
-            "type": "string",
-            "method": "extract",
-            "description": "Bank account number (may be partially masked)",
-        },
-        "AccountType": {
-            "type": "string",
-            "method": "extract",
-            "description": "Account type: Chequing, Savings, TFSA, RRSP",
-        },
-        "StatementPeriod": {
-            "type": "string",
-            "method": "extract",
-            "description": "Statement period dates",
-        },
-        "OpeningBalance": {
-            "type": "number",
-            "method": "extract",
-            "description": "Opening balance for statement period",
-        },
-        "ClosingBalance": {
-            "type": "number",
-            "method": "extract",
-            "description": "Closing balance for statement period",
-        },
-        "LargeDeposits": {
-            "type": "array",
-            "method": "extract",
-            "description": "Large deposits requiring source verification",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "date": {"type": "date"},
-                    "amount": {"type": "number"},
-                    "description": {"type": "string"},
-                },
+    }),
+
+    # ===== Loan Details =====
+    ("RequestedLoanAmount", "number", "extract", "Requested mortgage principal amount in CAD"),
+    ("DownPaymentAmount", "number", "extract", "Down payment amount in CAD"),
+    ("DownPaymentPercentage", "number", "extract", "Down payment as percentage of purchase price"),
+    ("RequestedAmortization", "integer", "extract", "Requested amortization period in years"),
+    ("InterestRate", "number", "extract", "Mortgage interest rate as percentage"),
+    ("RateTerm", "string", "extract", "Interest rate term: Variable, 1-year, 5-year fixed, etc."),
+    ("PaymentFrequency", "string", "extract",
+     "Payment frequency: Monthly, Bi-weekly, Accelerated bi-weekly"),
+    ("MortgagePaymentAmount", "number", "extract", "Regular mortgage payment amount"),
+
+    # ===== Gift Letter Fields =====
+    ("GiftDonorName", "string", "extract", "Name of the gift donor"),
+    ("GiftAmount", "number", "extract", "Amount of the gift in CAD"),
+    ("GiftRelationship", "string", "extract",
+     "Relationship of donor to borrower: Parent, Sibling, etc."),
+    ("GiftRepaymentRequired", "boolean", "extract",
+     "Whether repayment is required (should be false for true gift)"),
+    ("GiftLetterDate", "date", "extract", "Date of the signed gift letter"),
+
+    # ===== Bank Statement Fields =====
+    ("BankName", "string", "extract", "Name of financial institution"),
+    ("AccountNumber", "string", "extract", "Bank account number (may be partially masked)"),
+    ("AccountType", "string", "extract", "Account type: Chequing, Savings, TFSA, RRSP"),
+    ("StatementPeriod", "string", "extract", "Statement period dates"),
+    ("OpeningBalance", "number", "extract", "Opening balance for statement period"),
+    ("ClosingBalance", "number", "extract", "Closing balance for statement period"),
+    ("LargeDeposits", "array", "extract", "Large deposits requiring source verification", {
+        "items": {
+            "type": "object",
+            "properties": {
+                "date": {"type": "date"},
+                "amount": {"type": "number"},
+                "description": {"type": "string"},
             },
         },
-        
-        # ===== Liabilities =====
-        "MonthlyDebtPayments": {
-            "type": "number",
-            "method": "extract",
-            "description": "Total monthly debt obligations (car, credit cards, etc.)",
-        },
-        "CreditCardBalances": {
-            "type": "number",
-            "method": "extract",
-            "description": "Total outstanding credit card balances",
-        },
-        "AutoLoanBalance": {
-            "type": "number",
-            "method": "extract",
-            "description": "Outstanding auto loan balance",
-        },
-        "AutoLoanPayment": {
-            "type": "number",
-            "method": "extract",
-            "description": "Monthly auto loan payment",
-        },
-        "StudentLoanBalance": {
-            "type": "number",
-            "method": "extract",
-            "description": "Outstanding student loan balance",
-        },
-        "OtherMortgages": {
-            "type": "number",
-            "method": "extract",
-            "description": "Monthly payments on other mortgages",
-        },
-        
-        # ===== Document Metadata =====
-        "DocumentDate": {
-            "type": "date",
-            "method": "extract",
-            "description": "Date on the document",
-        },
-        "DocumentType": {
-            "type": "string",
-            "method": "generate",
-            "description": "Detected document type: T4, PayStub, EmploymentLetter, NOA, Appraisal, BankStatement, GiftLetter, PurchaseAgreement, CreditReport",
-        },
-    },
+    }),
+
+    # ===== Liabilities =====
+    ("MonthlyDebtPayments", "number", "extract",
+     "Total monthly debt obligations (car, credit cards, etc.)"),
+    ("CreditCardBalances", "number", "extract", "Total outstanding credit card balances"),
+    ("AutoLoanBalance", "number", "extract", "Outstanding auto loan balance"),
+    ("AutoLoanPayment", "number", "extract", "Monthly auto loan payment"),
+    ("StudentLoanBalance", "number", "extract", "Outstanding student loan balance"),
+    ("OtherMortgages", "number", "extract", "Monthly payments on other mortgages"),
+
+    # ===== Document Metadata =====
+    ("DocumentDate", "date", "extract", "Date on the document"),
+    ("DocumentType", "string", "generate",
+     "Detected document type: T4, PayStub, EmploymentLetter, NOA, Appraisal, BankStatement, "
+     "GiftLetter, PurchaseAgreement, CreditReport"),
+)
+MORTGAGE_DOC_FIELD_SCHEMA = {
+    "name": "MortgageDocFields",
+    "description": "Field schema for Canadian mortgage document extraction",
+    "fields": MappingProxyType(_expand_fields(_MORTGAGE_DOC_FIELDS)),
+}
+
+# Output-side aliases: names older consumers may look for, mapped to the field
+# the analyzer actually extracts (so each value is only extracted once)
+FIELD_ALIASES = {
+    "YTDGrossEarnings": "YTDEarnings",
 }
 
 # Full analyzer definition with configuration
 MORTGAGE_DOC_ANALYZER_SCHEMA = {
     "analyzerId": "mortgageDocAnalyzer",
-    "description": "Canadian mortgage document analyzer for T4s, pay stubs, employment letters, NOAs, appraisals, bank statements, gift letters, and credit reports",
+    "description": (
+        "Canadian mortgage document analyzer for T4s, pay stubs, employment letters, NOAs, "
+        "appraisals, bank statements, gift letters, and credit reports"
+    ),
     "baseAnalyzerId": "prebuilt-document",
     "fieldSchema": MORTGAGE_DOC_FIELD_SCHEMA,
     "config": {
@@ -510,15 +227,27 @@ MORTGAGE_DOC_ANALYZER_SCHEMA = {
     },
 }
 
-# Analyzer configurations dict (matches automotive pattern)
+# Analyzer configurations dict (matches automotive pattern); the full
+# definition is the single source of truth and is sent as the PUT body as-is
 ANALYZER_CONFIGS = {
-    "mortgageDocAnalyzer": {
-        "description": MORTGAGE_DOC_ANALYZER_SCHEMA["description"],
-        "baseAnalyzerId": MORTGAGE_DOC_ANALYZER_SCHEMA["baseAnalyzerId"],
-        "fieldSchema": MORTGAGE_DOC_ANALYZER_SCHEMA["fieldSchema"],
-        "config": MORTGAGE_DOC_ANALYZER_SCHEMA["config"],
-        "models": MORTGAGE_DOC_ANALYZER_SCHEMA["models"],
-    },
+    "mortgageDocAnalyzer": MORTGAGE_DOC_ANALYZER_SCHEMA,
+}
+
+MORTGAGE_DOC_FIELD_COUNT = len(MORTGAGE_DOC_FIELD_SCHEMA["fields"])
+
+
+def _serialize_body(analyzer_id: str, config: Mapping[str, Any]) -> bytes:
+    """Encode the PUT body for an analyzer as compact JSON."""
+    body = {"analyzerId": analyzer_id, **config}
+    return json.dumps(
+        body, separators=(",", ":"), allow_nan=False, default=dict
+    ).encode("utf-8")
+
+
+# Encoded once at import; create_analyzer sends these bytes as-is
+_CREATE_BODY_CACHE: Dict[str, bytes] = {
+    analyzer_id: _serialize_body(analyzer_id, config)
+    for analyzer_id, config in ANALYZER_CONFIGS.items()
 }
 
 
@@ -526,6 +255,59 @@ ANALYZER_CONFIGS = {
 # Azure Content Understanding API Functions
 # =============================================================================
 
+# Shared HTTP session: keeps the TCP/TLS connection to the CU endpoint alive
+# across the delete -> create -> poll sequence
+_SESSION = requests.Session()
+
+# Operation polling: exponential backoff, unless the service sends Retry-After
+POLL_INITIAL_DELAY = 0.5  # seconds before the second status check
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_DELAY = 10.0  # cap on the delay between status checks
+
+TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry at which a cached token is renewed
+
+_TOKEN_CACHE: Dict[str, Any] = {"token": None, "expires_on": 0}
+_TOKEN_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_endpoint() -> str:
+    """Content Understanding endpoint, without a trailing slash."""
+    return os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api_version() -> str:
+    """Content Understanding API version."""
+    return os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
+
+
+@functools.lru_cache(maxsize=None)
+def _analyzer_url(analyzer_id: str) -> str:
+    """Resource URL for an analyzer, built (and the id percent-encoded) once per id."""
+    return f"{_get_endpoint()}/contentunderstanding/analyzers/{quote(analyzer_id, safe='')}"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credential():
+    """Create the Azure AD credential once per process."""
+    from azure.identity import DefaultAzureCredential
+    return DefaultAzureCredential()
+
+
+def _get_azure_ad_token() -> str:
+    """Return a cached Azure AD token, fetching a new one when it is close to expiry."""
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE["expires_on"] - time.time() > TOKEN_REFRESH_MARGIN:
+            return _TOKEN_CACHE["token"]
+        
+        access_token = _get_credential().get_token(TOKEN_SCOPE)
+        _TOKEN_CACHE["token"] = access_token.token
+        _TOKEN_CACHE["expires_on"] = access_token.expires_on
+        return access_token.token
+
+
 def get_auth_headers() -> Dict[str, str]:
     """Get authentication headers for Azure CU API."""
     use_azure_ad = os.getenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD", "true").lower() == "true"
@@ -535,10 +317,7 @@ def get_auth_headers() -> Dict[str, str]:
     
     if use_azure_ad:
         try:
-            from azure.identity import DefaultAzureCredential
-            credential = DefaultAzureCredential()
-            token = credential.get_token("https://cognitiveservices.azure.com/.default").token
-            headers["Authorization"] = f"Bearer {token}"
+            headers["Authorization"] = f"Bearer {_get_azure_ad_token()}"
         except ImportError:
             raise RuntimeError("azure-identity not installed. Run: uv add azure-identity")
         except Exception as e:
@@ -546,50 +325,90 @@ def get_auth_headers() -> Dict[str, str]:
     elif api_key:
         headers["Ocp-Apim-Subscription-Key"] = api_key
     else:
-        raise RuntimeError("No authentication configured. Set AZURE_CONTENT_UNDERSTANDING_API_KEY or use Azure AD.")
+        raise RuntimeError(
+            "No authentication configured. "
+            "Set AZURE_CONTENT_UNDERSTANDING_API_KEY or use Azure AD."
+        )
     
     return headers
 
 
+def _json_body(response) -> Dict[str, Any]:
+    """Parse a JSON response body straight from its bytes; {} when empty."""
+    return json.loads(response.content) if response.content else {}
+
+
 def get_analyzer(analyzer_id: str) -> Optional[Dict[str, Any]]:
     """Check if an analyzer exists and get its configuration."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
-    if not endpoint:
+    if not _get_endpoint():
         raise RuntimeError("AZURE_CONTENT_UNDERSTANDING_ENDPOINT not set")
     
     headers = get_auth_headers()
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=30)
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.json()
+        return _json_body(response)
     except requests.exceptions.HTTPError as e:
         if "404" in str(e):
             return None
         raise
 
 
+def _poll_delay(attempt: int, response=None) -> float:
+    """Seconds to wait after the given (0-based) unsuccessful check; honours Retry-After."""
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            retry_after = 0
+        if retry_after > 0:
+            return retry_after
+    return min(POLL_MAX_DELAY, POLL_INITIAL_DELAY * (POLL_BACKOFF_FACTOR ** attempt))
+
+
+def head_analyzer(analyzer_id: str) -> bool:
+    """
+    Check whether an analyzer exists without downloading its definition.
+    
+    Falls back to a full GET if the service does not accept HEAD.
+    """
+    if not _get_endpoint():
+        raise RuntimeError("AZURE_CONTENT_UNDERSTANDING_ENDPOINT not set")
+    
+    headers = get_auth_headers()
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
+    
+    response = _SESSION.head(url, headers=headers, params=params, timeout=10)
+    if response.status_code == 404:
+        return False
+    if response.status_code == 405:
+        return get_analyzer(analyzer_id) is not None
+    response.raise_for_status()
+    return True
+
+
 def poll_operation(response, headers: Dict[str, str], timeout: int = 120) -> Dict[str, Any]:
     """Poll an async operation until completion."""
-    import requests
-    
     operation_url = response.headers.get("Operation-Location")
     if not operation_url:
         return {"status": "succeeded"}
     
+    # Prepared once: each poll re-sends the same request without re-merging
+    # URL, headers and environment settings
+    prepared = _SESSION.prepare_request(requests.Request("GET", operation_url, headers=headers))
+    send_kwargs = _SESSION.merge_environment_settings(prepared.url, {}, None, None, None)
     start_time = time.time()
+    attempt = 0
     while time.time() - start_time < timeout:
-        result = requests.get(operation_url, headers=headers, timeout=30)
+        result = _SESSION.send(prepared, timeout=30, **send_kwargs)
         result.raise_for_status()
-        data = result.json()
+        data = _json_body(result)
         
         status = data.get("status", "").lower()
         if status == "succeeded":
@@ -597,58 +416,96 @@ def poll_operation(response, headers: Dict[str, str], timeout: int = 120) -> Dic
         elif status == "failed":
             raise RuntimeError(f"Operation failed: {data.get('error', 'Unknown error')}")
         
-        time.sleep(2)
+        time.sleep(_poll_delay(attempt, result))
+        attempt += 1
     
     raise RuntimeError(f"Operation timed out after {timeout} seconds")
 
 
-def create_analyzer(analyzer_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
+def create_analyzer(analyzer_id: str, config: Mapping[str, Any]) -> Dict[str, Any]:
     """Create a new custom analyzer."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
     headers = get_auth_headers()
     headers["Content-Type"] = "application/json"
     
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
-    body = {
-        "analyzerId": analyzer_id,
-        **config,
-    }
+    if config is ANALYZER_CONFIGS.get(analyzer_id):
+        payload = _CREATE_BODY_CACHE[analyzer_id]
+    else:
+        payload = _serialize_body(analyzer_id, config)
     
-    response = requests.put(url, headers=headers, params=params, json=body, timeout=60)
+    response = _SESSION.put(url, headers=headers, params=params, data=payload, timeout=60)
     response.raise_for_status()
     
     # Handle async operation
     if response.status_code == 202:
         return poll_operation(response, headers)
     
-    return response.json() if response.text else {"analyzerId": analyzer_id, "status": "succeeded"}
+    return _json_body(response) or {"analyzerId": analyzer_id, "status": "succeeded"}
 
 
-def update_analyzer(analyzer_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Update an existing analyzer (delete and recreate)."""
+def update_analyzer(analyzer_id: str, config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Update an existing analyzer.
+    
+    PUT is an upsert, so the analyzer is replaced in place. Only if the
+    service refuses that with 409 Conflict is it deleted, and recreated once
+    the deletion is visible.
+    """
+    try:
+        return create_analyzer(analyzer_id, config)
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code != 409:
+            raise
+    
     delete_analyzer(analyzer_id)
-    time.sleep(2)  # Wait for deletion to propagate
+    wait_for_deletion(analyzer_id)
     return create_analyzer(analyzer_id, config)
 
 
+def _contains(expected: Any, actual: Any) -> bool:
+    """True if every key/value in expected is present in actual (recursively for dicts)."""
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _contains(value, actual[key]) for key, value in expected.items()
+        )
+    return expected == actual
+
+
+def is_up_to_date(analyzer_id: str, deployed: Mapping[str, Any], config: Mapping[str, Any]) -> bool:
+    """
+    Check whether a deployed analyzer already matches config.
+    
+    The field set must match exactly (so removed fields count as a change);
+    elsewhere the service may add its own defaults, so only the values we
+    send are compared.
+    """
+    expected = json.loads(_serialize_body(analyzer_id, config))
+    deployed_fields = deployed.get("fieldSchema", {}).get("fields", {})
+    if set(deployed_fields) != set(expected["fieldSchema"]["fields"]):
+        return False
+    return _contains(expected, dict(deployed))
+
+
+def wait_for_deletion(analyzer_id: str, timeout: int = 60) -> None:
+    """Wait until get_analyzer() no longer finds the analyzer."""
+    start_time = time.time()
+    attempt = 0
+    while get_analyzer(analyzer_id) is not None:
+        if time.time() - start_time > timeout:
+            raise RuntimeError(f"Deletion of {analyzer_id} not visible after {timeout} seconds")
+        time.sleep(_poll_delay(attempt))
+        attempt += 1
+
+
 def delete_analyzer(analyzer_id: str) -> bool:
     """Delete an analyzer."""
-    import requests
-    
-    endpoint = os.getenv("AZURE_CONTENT_UNDERSTANDING_ENDPOINT", "").rstrip("/")
-    api_version = os.getenv("AZURE_CONTENT_UNDERSTANDING_API_VERSION", "2025-11-01")
-    
     headers = get_auth_headers()
-    url = f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}"
-    params = {"api-version": api_version}
+    url = _analyzer_url(analyzer_id)
+    params = {"api-version": _get_api_version()}
     
-    response = requests.delete(url, headers=headers, params=params, timeout=30)
+    response = _SESSION.delete(url, headers=headers, params=params, timeout=30)
     if response.status_code == 404:
         return False
     response.raise_for_status()
@@ -657,16 +514,95 @@ def delete_analyzer(analyzer_id: str) -> bool:
 
 def verify_analyzer(analyzer_id: str) -> bool:
     """Verify an analyzer exists and is ready."""
+    ok, lines = _verify_one(analyzer_id)
+    print("\n".join(lines))
+    return ok
+
+
+# =============================================================================
+# Per-Analyzer Operations
+# =============================================================================
+
+MAX_PARALLEL_ANALYZERS = 8  # cap on analyzers handled concurrently
+
+
+def _run_per_analyzer(task, *args) -> bool:
+    """
+    Run task(analyzer_id, config, *args) for every analyzer concurrently.
+    
+    Each task returns (ok, lines); the calls are I/O-bound, so threads overlap
+    their HTTP round trips. Output is printed in config order, in one write,
+    once all tasks finish, so it reads the same as a sequential run.
+    """
+    workers = max(1, min(MAX_PARALLEL_ANALYZERS, len(ANALYZER_CONFIGS)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(task, analyzer_id, config, *args)
+            for analyzer_id, config in ANALYZER_CONFIGS.items()
+        ]
+    
+    success = True
+    output = []
+    for future in futures:
+        ok, lines = future.result()
+        output.extend(lines)
+        success = success and ok
+    print("\n".join(output))
+    return success
+
+
+def _verify_one(
+    analyzer_id: str, config: Optional[Mapping[str, Any]] = None,
+) -> Tuple[bool, List[str]]:
+    """Check one analyzer exists. Returns (ok, output lines)."""
     analyzer = get_analyzer(analyzer_id)
-    if analyzer:
-        print(f"  ✓ {analyzer_id}: Ready")
-        print(f"    Base: {analyzer.get('baseAnalyzerId', 'unknown')}")
-        fields = analyzer.get("fieldSchema", {}).get("fields", {})
-        print(f"    Fields: {len(fields)} defined")
-        return True
+    if not analyzer:
+        return False, [f"  ✗ {analyzer_id}: Not found"]
+    
+    fields = analyzer.get("fieldSchema", {}).get("fields", {})
+    return True, [
+        f"  ✓ {analyzer_id}: Ready",
+        f"    Base: {analyzer.get('baseAnalyzerId', 'unknown')}",
+        f"    Fields: {len(fields)} defined",
+    ]
+
+
+def _check_one(analyzer_id: str, config: Mapping[str, Any]) -> Tuple[bool, List[str]]:
+    """Check one analyzer exists with a HEAD request. Returns (ok, output lines)."""
+    if head_analyzer(analyzer_id):
+        return True, [f"  ✓ {analyzer_id}: Ready"]
+    return False, [f"  ✗ {analyzer_id}: Not found"]
+
+
+def _delete_one(analyzer_id: str, config: Mapping[str, Any]) -> Tuple[bool, List[str]]:
+    """Delete one analyzer. Returns (ok, output lines)."""
+    if delete_analyzer(analyzer_id):
+        return True, [f"  ✓ {analyzer_id} deleted"]
+    return True, [f"  - {analyzer_id} not found (already deleted)"]
+
+
+def _setup_one(analyzer_id: str, config: Mapping[str, Any], force: bool) -> Tuple[bool, List[str]]:
+    """Create or update one analyzer. Returns (ok, output lines)."""
+    existing = get_analyzer(analyzer_id)
+    
+    if existing and not force:
+        ok, verify_lines = _verify_one(analyzer_id)
+        lines = [f"  ℹ {analyzer_id} already exists", "    Use --force to recreate"]
+        return ok, lines + verify_lines
+    
+    if existing and is_up_to_date(analyzer_id, existing, config):
+        return True, [f"  ✓ {analyzer_id} already up to date (nothing to update)"]
+    
+    if existing:
+        lines = [f"  Updating {analyzer_id}..."]
+        update_analyzer(analyzer_id, config)
     else:
-        print(f"  ✗ {analyzer_id}: Not found")
-        return False
+        lines = [f"  Creating {analyzer_id}..."]
+        create_analyzer(analyzer_id, config)
+    
+    lines.append(f"  ✓ {analyzer_id} ready")
+    lines.append(f"    Fields: {len(config['fieldSchema']['fields'])}")
+    return True, lines
 
 
 # =============================================================================
@@ -690,7 +626,12 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force recreate even if analyzer exists",
+        help="Update the analyzer even if it exists (skipped when already up to date)",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="With --verify, also fetch and show each analyzer's details",
     )
     parser.add_argument(
         "--json",
@@ -702,55 +643,35 @@ def main():
     
     # Output JSON schema if requested
     if args.json:
-        print(json.dumps(MORTGAGE_DOC_ANALYZER_SCHEMA, indent=2))
+        print(json.dumps(MORTGAGE_DOC_ANALYZER_SCHEMA, indent=2, default=dict))
         return
     
-    print("\n" + "=" * 60)
-    print("  Mortgage Underwriting Analyzer Setup")
-    print("  Feature: 008-mortgage-underwriting")
-    print("=" * 60 + "\n")
+    print("\n".join([
+        "",
+        "=" * 60,
+        "  Mortgage Underwriting Analyzer Setup",
+        "  Feature: 008-mortgage-underwriting",
+        "=" * 60 + "\n",
+    ]))
     
     # Verify mode
     if args.verify:
         print("Verifying mortgage analyzer...\n")
-        success = verify_analyzer("mortgageDocAnalyzer")
+        success = _run_per_analyzer(_verify_one if args.verbose else _check_one)
         sys.exit(0 if success else 1)
     
     # Delete mode
     if args.delete:
         print("Deleting mortgage analyzer...\n")
-        if delete_analyzer("mortgageDocAnalyzer"):
-            print("  ✓ mortgageDocAnalyzer deleted")
-        else:
-            print("  - mortgageDocAnalyzer not found (already deleted)")
+        _run_per_analyzer(_delete_one)
         return
     
     # Create/Update mode
     print("Setting up mortgage document analyzer...\n")
     
-    analyzer_id = "mortgageDocAnalyzer"
-    config = ANALYZER_CONFIGS[analyzer_id]
-    
-    existing = get_analyzer(analyzer_id)
-    
-    if existing and not args.force:
-        print(f"  ℹ {analyzer_id} already exists")
-        print(f"    Use --force to recreate")
-        verify_analyzer(analyzer_id)
-    else:
-        if existing:
-            print(f"  Updating {analyzer_id}...")
-            result = update_analyzer(analyzer_id, config)
-        else:
-            print(f"  Creating {analyzer_id}...")
-            result = create_analyzer(analyzer_id, config)
-        
-        print(f"  ✓ {analyzer_id} ready")
-        print(f"    Fields: {len(config['fieldSchema']['fields'])}")
+    _run_per_analyzer(_setup_one, args.force)
     
-    print("\n" + "=" * 60)
-    print("  Setup complete!")
-    print("=" * 60 + "\n")
+    print("\n".join(["", "=" * 60, "  Setup complete!", "=" * 60 + "\n"]))
 
 
 if __name__ == "__main__":
@@ -16,21 +16,55 @@ from __future__ import annotations
 import argparse
 import ast
 import csv
+import functools
 import json
 import os
 import re
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Output columns, in order; flatten_* helpers yield rows as tuples in this order
+ROW_SCHEMA = (
+    "category",
+    "field",
+    "subfield",
+    "value",
+    "confidence",
+    "source_page",
+    "source_file",
+    "accuracy_rating",
+    "issues_found",
+    "corrections",
+    "reviewer_notes",
+)
+
+# The trailing reviewer columns start out blank on every row
+EMPTY_REVIEW_COLUMNS = ("", "", "", "")
+
+ReviewRow = Tuple[str, ...]
+
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"  # log() timestamps (local time)
+
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB read/write buffers for the CSV files
 
 
 def log(message: str, level: str = "INFO") -> None:
     """Print a timestamped log message."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime(LOG_TIME_FORMAT)
     print(f"[{timestamp}] [{level}] {message}")
 
 
+# First characters a JSON document / Python literal can start with. Plain text
+# cells (the common case) match neither and skip both parsers and their
+# exception handling.
+JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+PYTHON_LITERAL_START_CHARS = frozenset('{[("\'-+.0123456789TFNbBrRuUs')  # s: set()
+
+
 def safe_parse_json_or_python(value: str) -> Any:
     """Try to parse a value as JSON or Python literal, return original if fails."""
     if not value or not isinstance(value, str):
@@ -40,35 +74,57 @@ def safe_parse_json_or_python(value: str) -> Any:
     if not value:
         return value
     
+    return _parse_stripped(value)
+
+
+def _parse_stripped(value: str) -> Any:
+    """Parse a non-empty stripped cell."""
+    first = value[0]
+    
     # Try JSON first
-    try:
-        return json.loads(value)
-    except (json.JSONDecodeError, ValueError):
-        pass
+    if first in JSON_START_CHARS:
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, ValueError):
+            pass
     
     # Try Python literal (for dict/list representations)
-    try:
-        return ast.literal_eval(value)
-    except (ValueError, SyntaxError):
-        pass
+    if first in PYTHON_LITERAL_START_CHARS:
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
     
     return value
 
 
+# Keys holding a field's value in Content Understanding output, in preference order
+VALUE_KEYS = ('valueString', 'value', 'valueNumber', 'valueBoolean', 'valueDate')
+
+# Metadata keys left out when formatting a dict for display (list items keep confidence)
+META_KEYS = frozenset({'type', 'spans', 'source', 'confidence', 'offset', 'length'})
+ITEM_META_KEYS = frozenset({'type', 'spans', 'source', 'offset', 'length'})
+
+
+def _cap(s: str, n: int) -> str:
+    """Truncate s to at most n characters, returning it unchanged when it already fits."""
+    return s if len(s) <= n else s[:n]
+
+
 def extract_simple_value(obj: Any, max_length: int = 500) -> str:
     """Extract a simple string value from a potentially complex object."""
     if obj is None:
         return ""
     
     if isinstance(obj, str):
-        return obj[:max_length] if len(obj) > max_length else obj
+        return _cap(obj, max_length)
     
     if isinstance(obj, (int, float, bool)):
         return str(obj)
     
     if isinstance(obj, dict):
         # Look for common value keys
-        for key in ['valueString', 'value', 'valueNumber', 'valueBoolean', 'valueDate']:
+        for key in VALUE_KEYS:
             if key in obj:
                 return extract_simple_value(obj[key], max_length)
         
@@ -76,11 +132,11 @@ def extract_simple_value(obj: Any, max_length: int = 500) -> str:
         if len(obj) <= 3:
             parts = []
             for k, v in obj.items():
-                if k not in ['type', 'spans', 'source', 'confidence', 'offset', 'length']:
+                if k not in META_KEYS:
                     parts.append(f"{k}: {extract_simple_value(v, 100)}")
             if parts:
                 result = "; ".join(parts)
-                return result[:max_length] if len(result) > max_length else result
+                return _cap(result, max_length)
     
     if isinstance(obj, list):
         if len(obj) == 0:
@@ -92,200 +148,222 @@ def extract_simple_value(obj: Any, max_length: int = 500) -> str:
             if val:
                 values.append(val)
         result = " | ".join(values)
-        return result[:max_length] if len(result) > max_length else result
+        return _cap(result, max_length)
     
     # Fallback: convert to string
-    result = str(obj)
-    return result[:max_length] if len(result) > max_length else result
+    return _cap(str(obj), max_length)
+
+
+def _extracted_scalar_rows(
+    parsed: Any,
+    field_name: str,
+    confidence: str,
+    source_page: str,
+    source_file: str,
+) -> Iterator[ReviewRow]:
+    """Rows for a simple value (str, number, bool or None)."""
+    yield (
+        "Extracted Field",
+        field_name,
+        "",
+        str(parsed) if parsed else "",
+        confidence,
+        source_page,
+        source_file,
+    ) + EMPTY_REVIEW_COLUMNS
+
+
+def _extracted_dict_rows(
+    parsed: Dict[str, Any],
+    field_name: str,
+    confidence: str,
+    source_page: str,
+    source_file: str,
+) -> Iterator[ReviewRow]:
+    """Rows for a dict value, one per key when it holds nested fields."""
+    # Check if it's a nested field structure (like LipidPanelResults)
+    has_nested = any(isinstance(v, dict) for v in parsed.values())
+    
+    if has_nested:
+        for subfield, subvalue in parsed.items():
+            if isinstance(subvalue, dict):
+                extracted_val = extract_simple_value(subvalue)
+                sub_conf = subvalue.get('confidence', '')
+                yield (
+                    "Extracted Field",
+                    field_name,
+                    subfield,
+                    extracted_val,
+                    str(sub_conf) if sub_conf else confidence,
+                    source_page,
+                    source_file,
+                ) + EMPTY_REVIEW_COLUMNS
+            else:
+                yield (
+                    "Extracted Field",
+                    field_name,
+                    subfield,
+                    extract_simple_value(subvalue),
+                    confidence,
+                    source_page,
+                    source_file,
+                ) + EMPTY_REVIEW_COLUMNS
+    else:
+        # Simple dict - show as single value
+        yield (
+            "Extracted Field",
+            field_name,
+            "",
+            extract_simple_value(parsed),
+            confidence,
+            source_page,
+            source_file,
+        ) + EMPTY_REVIEW_COLUMNS
+
+
+def _extracted_list_rows(
+    parsed: List[Any],
+    field_name: str,
+    confidence: str,
+    source_page: str,
+    source_file: str,
+) -> Iterator[ReviewRow]:
+    """Rows for a list value, one per item."""
+    for i, item in enumerate(parsed[:20]):  # Limit to 20 items
+        if isinstance(item, dict):
+            # Look for valueObject pattern
+            if 'valueObject' in item:
+                item = item['valueObject']
+            
+            # Extract key fields from the item
+            item_parts = []
+            for k, v in item.items():
+                if k not in ITEM_META_KEYS:
+                    val = extract_simple_value(v, 100)
+                    if val:
+                        item_parts.append(f"{k}: {val}")
+            
+            if item_parts:
+                yield (
+                    "Extracted Field",
+                    field_name,
+                    f"[{i+1}]",
+                    "; ".join(item_parts),
+                    confidence,
+                    source_page,
+                    source_file,
+                ) + EMPTY_REVIEW_COLUMNS
+        else:
+            yield (
+                "Extracted Field",
+                field_name,
+                f"[{i+1}]",
+                extract_simple_value(item),
+                confidence,
+                source_page,
+                source_file,
+            ) + EMPTY_REVIEW_COLUMNS
+
 
+def _extracted_fallback_rows(
+    parsed: Any,
+    field_name: str,
+    confidence: str,
+    source_page: str,
+    source_file: str,
+) -> Iterator[ReviewRow]:
+    """Rows for any other parsed value (tuple, set, ...)."""
+    yield (
+        "Extracted Field",
+        field_name,
+        "",
+        extract_simple_value(parsed),
+        confidence,
+        source_page,
+        source_file,
+    ) + EMPTY_REVIEW_COLUMNS
 
-def flatten_extracted_field(field_name: str, raw_value: str, confidence: str, source_page: str, source_file: str) -> List[Dict[str, str]]:
+
+# Row builders keyed by the exact type of a parsed field value. JSON and
+# ast.literal_eval only produce these builtin types, never subclasses.
+EXTRACTED_FIELD_HANDLERS = {
+    dict: _extracted_dict_rows,
+    list: _extracted_list_rows,
+    str: _extracted_scalar_rows,
+    int: _extracted_scalar_rows,
+    float: _extracted_scalar_rows,
+    bool: _extracted_scalar_rows,
+    type(None): _extracted_scalar_rows,
+}
+
+
+def flatten_extracted_field(
+    field_name: str,
+    raw_value: str,
+    confidence: str,
+    source_page: str,
+    source_file: str,
+) -> Iterator[ReviewRow]:
     """Flatten an extracted field into one or more human-readable rows."""
-    rows = []
-    
     parsed = safe_parse_json_or_python(raw_value)
-    
-    # Simple value case
-    if isinstance(parsed, (str, int, float, bool)) or parsed is None:
-        rows.append({
-            "category": "Extracted Field",
-            "field": field_name,
-            "subfield": "",
-            "value": str(parsed) if parsed else "",
-            "confidence": confidence,
-            "source_page": source_page,
-            "source_file": source_file,
-            "accuracy_rating": "",
-            "issues_found": "",
-            "corrections": "",
-            "reviewer_notes": "",
-        })
-        return rows
-    
-    # Dict case - flatten each key
-    if isinstance(parsed, dict):
-        # Check if it's a nested field structure (like LipidPanelResults)
-        has_nested = any(isinstance(v, dict) for v in parsed.values())
-        
-        if has_nested:
-            for subfield, subvalue in parsed.items():
-                if isinstance(subvalue, dict):
-                    extracted_val = extract_simple_value(subvalue)
-                    sub_conf = subvalue.get('confidence', '') if isinstance(subvalue, dict) else ''
-                    rows.append({
-                        "category": "Extracted Field",
-                        "field": field_name,
-                        "subfield": subfield,
-                        "value": extracted_val,
-                        "confidence": str(sub_conf) if sub_conf else confidence,
-                        "source_page": source_page,
-                        "source_file": source_file,
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
-                else:
-                    rows.append({
-                        "category": "Extracted Field",
-                        "field": field_name,
-                        "subfield": subfield,
-                        "value": extract_simple_value(subvalue),
-                        "confidence": confidence,
-                        "source_page": source_page,
-                        "source_file": source_file,
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
-        else:
-            # Simple dict - show as single value
-            rows.append({
-                "category": "Extracted Field",
-                "field": field_name,
-                "subfield": "",
-                "value": extract_simple_value(parsed),
-                "confidence": confidence,
-                "source_page": source_page,
-                "source_file": source_file,
-                "accuracy_rating": "",
-                "issues_found": "",
-                "corrections": "",
-                "reviewer_notes": "",
-            })
-        return rows
-    
-    # List case - flatten each item
-    if isinstance(parsed, list):
-        for i, item in enumerate(parsed[:20]):  # Limit to 20 items
-            if isinstance(item, dict):
-                # Look for valueObject pattern
-                if 'valueObject' in item:
-                    item = item['valueObject']
-                
-                # Extract key fields from the item
-                item_parts = []
-                for k, v in item.items():
-                    if k not in ['type', 'spans', 'source', 'offset', 'length']:
-                        val = extract_simple_value(v, 100)
-                        if val:
-                            item_parts.append(f"{k}: {val}")
-                
-                if item_parts:
-                    rows.append({
-                        "category": "Extracted Field",
-                        "field": field_name,
-                        "subfield": f"[{i+1}]",
-                        "value": "; ".join(item_parts),
-                        "confidence": confidence,
-                        "source_page": source_page,
-                        "source_file": source_file,
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
-            else:
-                rows.append({
-                    "category": "Extracted Field",
-                    "field": field_name,
-                    "subfield": f"[{i+1}]",
-                    "value": extract_simple_value(item),
-                    "confidence": confidence,
-                    "source_page": source_page,
-                    "source_file": source_file,
-                    "accuracy_rating": "",
-                    "issues_found": "",
-                    "corrections": "",
-                    "reviewer_notes": "",
-                })
-        return rows
-    
-    # Fallback
-    rows.append({
-        "category": "Extracted Field",
-        "field": field_name,
-        "subfield": "",
-        "value": extract_simple_value(parsed),
-        "confidence": confidence,
-        "source_page": source_page,
-        "source_file": source_file,
-        "accuracy_rating": "",
-        "issues_found": "",
-        "corrections": "",
-        "reviewer_notes": "",
-    })
-    return rows
-
-
-def flatten_llm_output(section: str, subsection: str, value: str, risk_level: str, underwriting_action: str) -> List[Dict[str, str]]:
+    handler = EXTRACTED_FIELD_HANDLERS.get(type(parsed), _extracted_fallback_rows)
+    return handler(parsed, field_name, confidence, source_page, source_file)
+
+
+@functools.lru_cache(maxsize=512)
+def _display_name(name: str) -> str:
+    """Turn a snake_case section or key name into a title-cased display label."""
+    return name.replace("_", " ").title() if name else ""
+
+
+def flatten_llm_output(
+    section: str,
+    subsection: str,
+    value: str,
+    risk_level: str,
+    underwriting_action: str,
+) -> Iterator[ReviewRow]:
     """Flatten an LLM output into human-readable rows."""
-    rows = []
     
     # Clean up section/subsection names for display
-    display_section = section.replace("_", " ").title() if section else ""
-    display_subsection = subsection.replace("_", " ").title() if subsection else ""
+    display_section = _display_name(section)
+    display_subsection = _display_name(subsection)
     
     # Truncate long values but keep them readable
     display_value = value[:2000] if value else ""
     
-    rows.append({
-        "category": "LLM Analysis",
-        "field": display_section,
-        "subfield": display_subsection,
-        "value": display_value,
-        "confidence": risk_level,  # Use risk_level as confidence for LLM outputs
-        "source_page": "",
-        "source_file": "",
-        "accuracy_rating": "",
-        "issues_found": "",
-        "corrections": "",
-        "reviewer_notes": "",
-    })
+    yield (
+        "LLM Analysis",
+        display_section,
+        display_subsection,
+        display_value,
+        risk_level,  # Use risk_level as confidence for LLM outputs
+        "",
+        "",
+    ) + EMPTY_REVIEW_COLUMNS
     
     # Add underwriting action as separate row if present
     if underwriting_action:
-        rows.append({
-            "category": "LLM Analysis",
-            "field": display_section,
-            "subfield": f"{display_subsection} - Action",
-            "value": underwriting_action[:1000],
-            "confidence": "",
-            "source_page": "",
-            "source_file": "",
-            "accuracy_rating": "",
-            "issues_found": "",
-            "corrections": "",
-            "reviewer_notes": "",
-        })
-    
-    return rows
-
-
-def flatten_risk_analysis(section: str, value: str, risk_level: str, underwriting_action: str, policy_citations: str) -> List[Dict[str, str]]:
+        yield (
+            "LLM Analysis",
+            display_section,
+            f"{display_subsection} - Action",
+            underwriting_action[:1000],
+            "",
+            "",
+            "",
+        ) + EMPTY_REVIEW_COLUMNS
+    
+
+
+def flatten_risk_analysis(
+    section: str,
+    value: str,
+    risk_level: str,
+    underwriting_action: str,
+    policy_citations: str,
+) -> Iterator[ReviewRow]:
     """Flatten risk analysis into human-readable rows."""
-    rows = []
     
     # Parse the value if it's JSON (like the raw risk analysis)
     parsed = safe_parse_json_or_python(value)
@@ -297,37 +375,29 @@ def flatten_risk_analysis(section: str, value: str, risk_level: str, underwritin
             overall_risk = parsed.get('overall_risk_level', '')
             overall_rationale = parsed.get('overall_rationale', '')
             
-            rows.append({
-                "category": "Risk Analysis",
-                "field": "Overall Assessment",
-                "subfield": "Risk Level",
-                "value": overall_risk,
-                "confidence": "",
-                "source_page": "",
-                "source_file": "",
-                "accuracy_rating": "",
-                "issues_found": "",
-                "corrections": "",
-                "reviewer_notes": "",
-            })
+            yield (
+                "Risk Analysis",
+                "Overall Assessment",
+                "Risk Level",
+                overall_risk,
+                "",
+                "",
+                "",
+            ) + EMPTY_REVIEW_COLUMNS
             
-            rows.append({
-                "category": "Risk Analysis",
-                "field": "Overall Assessment",
-                "subfield": "Rationale",
-                "value": overall_rationale[:2000],
-                "confidence": "",
-                "source_page": "",
-                "source_file": "",
-                "accuracy_rating": "",
-                "issues_found": "",
-                "corrections": "",
-                "reviewer_notes": "",
-            })
+            yield (
+                "Risk Analysis",
+                "Overall Assessment",
+                "Rationale",
+                overall_rationale[:2000],
+                "",
+                "",
+                "",
+            ) + EMPTY_REVIEW_COLUMNS
             
             # Individual findings
             for i, finding in enumerate(parsed.get('findings', []), 1):
-                category = finding.get('category', '').replace('_', ' ').title()
+                category = _display_name(finding.get('category', ''))
                 finding_text = finding.get('finding', '')
                 policy_id = finding.get('policy_id', '')
                 policy_name = finding.get('policy_name', '')
@@ -336,167 +406,136 @@ def flatten_risk_analysis(section: str, value: str, risk_level: str, underwritin
                 rationale = finding.get('rationale', '')
                 
                 # Main finding
-                rows.append({
-                    "category": "Risk Analysis",
-                    "field": f"Finding {i}: {category}",
-                    "subfield": "Description",
-                    "value": finding_text,
-                    "confidence": finding_risk,
-                    "source_page": "",
-                    "source_file": policy_id,
-                    "accuracy_rating": "",
-                    "issues_found": "",
-                    "corrections": "",
-                    "reviewer_notes": "",
-                })
+                yield (
+                    "Risk Analysis",
+                    f"Finding {i}: {category}",
+                    "Description",
+                    finding_text,
+                    finding_risk,
+                    "",
+                    policy_id,
+                ) + EMPTY_REVIEW_COLUMNS
                 
                 if action:
-                    rows.append({
-                        "category": "Risk Analysis",
-                        "field": f"Finding {i}: {category}",
-                        "subfield": "Recommended Action",
-                        "value": action,
-                        "confidence": "",
-                        "source_page": "",
-                        "source_file": policy_name,
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
+                    yield (
+                        "Risk Analysis",
+                        f"Finding {i}: {category}",
+                        "Recommended Action",
+                        action,
+                        "",
+                        "",
+                        policy_name,
+                    ) + EMPTY_REVIEW_COLUMNS
                 
                 if rationale:
-                    rows.append({
-                        "category": "Risk Analysis",
-                        "field": f"Finding {i}: {category}",
-                        "subfield": "Rationale",
-                        "value": rationale[:1000],
-                        "confidence": "",
-                        "source_page": "",
-                        "source_file": "",
-                        "accuracy_rating": "",
-                        "issues_found": "",
-                        "corrections": "",
-                        "reviewer_notes": "",
-                    })
+                    yield (
+                        "Risk Analysis",
+                        f"Finding {i}: {category}",
+                        "Rationale",
+                        rationale[:1000],
+                        "",
+                        "",
+                        "",
+                    ) + EMPTY_REVIEW_COLUMNS
         else:
             # Simple dict structure
             for key, val in parsed.items():
-                rows.append({
-                    "category": "Risk Analysis",
-                    "field": section.replace('_', ' ').title() if section else key.replace('_', ' ').title(),
-                    "subfield": key.replace('_', ' ').title(),
-                    "value": extract_simple_value(val),
-                    "confidence": risk_level,
-                    "source_page": "",
-                    "source_file": policy_citations,
-                    "accuracy_rating": "",
-                    "issues_found": "",
-                    "corrections": "",
-                    "reviewer_notes": "",
-                })
+                yield (
+                    "Risk Analysis",
+                    _display_name(section or key),
+                    _display_name(key),
+                    extract_simple_value(val),
+                    risk_level,
+                    "",
+                    policy_citations,
+                ) + EMPTY_REVIEW_COLUMNS
     else:
         # Simple value
-        display_section = section.replace("_", " ").title() if section else "Risk Analysis"
+        display_section = _display_name(section) if section else "Risk Analysis"
         
-        rows.append({
-            "category": "Risk Analysis",
-            "field": display_section,
-            "subfield": "",
-            "value": str(parsed)[:2000] if parsed else "",
-            "confidence": risk_level,
-            "source_page": "",
-            "source_file": policy_citations,
-            "accuracy_rating": "",
-            "issues_found": "",
-            "corrections": "",
-            "reviewer_notes": "",
-        })
+        yield (
+            "Risk Analysis",
+            display_section,
+            "",
+            str(parsed)[:2000] if parsed else "",
+            risk_level,
+            "",
+            policy_citations,
+        ) + EMPTY_REVIEW_COLUMNS
         
         if underwriting_action:
-            rows.append({
-                "category": "Risk Analysis",
-                "field": display_section,
-                "subfield": "Action",
-                "value": underwriting_action,
-                "confidence": "",
-                "source_page": "",
-                "source_file": "",
-                "accuracy_rating": "",
-                "issues_found": "",
-                "corrections": "",
-                "reviewer_notes": "",
-            })
-    
-    return rows
+            yield (
+                "Risk Analysis",
+                display_section,
+                "Action",
+                underwriting_action,
+                "",
+                "",
+                "",
+            ) + EMPTY_REVIEW_COLUMNS
+    
+
+
+def review_rows(reader: Iterable[Dict[str, str]]) -> Iterator[ReviewRow]:
+    """Yield the human-readable rows for each review_output.csv row, in order."""
+    for row in reader:
+        category = row.get('category', '')
+        section = row.get('section', '')
+        subsection = row.get('subsection', '')
+        value = row.get('value', '')
+        confidence = row.get('confidence', '')
+        source_page = row.get('source_page', '')
+        source_file = row.get('source_file', '')
+        risk_level = row.get('risk_level', '')
+        underwriting_action = row.get('underwriting_action', '')
+        policy_citations = row.get('policy_citations', '')
+        
+        if category == 'extracted_field':
+            yield from flatten_extracted_field(
+                subsection, value, confidence, source_page, source_file
+            )
+        elif category == 'llm_output':
+            # Skip metadata rows
+            if section == 'metadata':
+                continue
+            yield from flatten_llm_output(
+                section, subsection, value, risk_level, underwriting_action
+            )
+        elif category == 'risk_analysis':
+            # Handle the raw JSON case specially
+            if section == 'raw':
+                yield from flatten_risk_analysis(
+                    section, value, risk_level, underwriting_action, policy_citations
+                )
+            elif section != 'timestamp':  # Skip timestamp
+                yield from flatten_risk_analysis(
+                    section, value, risk_level, underwriting_action, policy_citations
+                )
 
 
 def transform_csv(input_path: Path, output_path: Path) -> int:
     """Transform a single review_output.csv to human-readable format.
     
+    Rows are streamed from input to output one at a time, so memory use does
+    not grow with the size of the file.
+    
     Returns the number of rows written.
     """
-    rows = []
+    row_count = 0
     
-    # Read input CSV
-    with open(input_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            category = row.get('category', '')
-            section = row.get('section', '')
-            subsection = row.get('subsection', '')
-            value = row.get('value', '')
-            confidence = row.get('confidence', '')
-            source_page = row.get('source_page', '')
-            source_file = row.get('source_file', '')
-            risk_level = row.get('risk_level', '')
-            underwriting_action = row.get('underwriting_action', '')
-            policy_citations = row.get('policy_citations', '')
-            
-            if category == 'extracted_field':
-                rows.extend(flatten_extracted_field(
-                    subsection, value, confidence, source_page, source_file
-                ))
-            elif category == 'llm_output':
-                # Skip metadata rows
-                if section == 'metadata':
-                    continue
-                rows.extend(flatten_llm_output(
-                    section, subsection, value, risk_level, underwriting_action
-                ))
-            elif category == 'risk_analysis':
-                # Handle the raw JSON case specially
-                if section == 'raw':
-                    rows.extend(flatten_risk_analysis(
-                        section, value, risk_level, underwriting_action, policy_citations
-                    ))
-                elif section != 'timestamp':  # Skip timestamp
-                    rows.extend(flatten_risk_analysis(
-                        section, value, risk_level, underwriting_action, policy_citations
-                    ))
-    
-    # Write output CSV
-    fieldnames = [
-        "category",
-        "field",
-        "subfield",
-        "value",
-        "confidence",
-        "source_page",
-        "source_file",
-        "accuracy_rating",
-        "issues_found",
-        "corrections",
-        "reviewer_notes",
-    ]
-    
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
-    return len(rows)
+    def counted(rows: Iterator[ReviewRow]) -> Iterator[ReviewRow]:
+        nonlocal row_count
+        for row in rows:
+            row_count += 1
+            yield row
+    
+    with open(input_path, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as src, \
+            open(output_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as dst:
+        writer = csv.writer(dst)
+        writer.writerow(ROW_SCHEMA)
+        writer.writerows(counted(review_rows(csv.DictReader(src))))
+    
+    return row_count
 
 
 def main():
@@ -513,6 +552,12 @@ def main():
         action="store_true",
         help="List files without transforming",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to transform in parallel (default: CPU count)",
+    )
     
     args = parser.parse_args()
     
@@ -540,18 +585,28 @@ def main():
             print(f"  {csv_file.parent.name}/review_output.csv -> human_review.csv")
         return 0
     
-    # Transform each file
+    # Transform the files in parallel: parsing is CPU-bound and each file
+    # has its own output, so they are spread across processes
     success_count = 0
-    for csv_file in csv_files:
-        app_name = csv_file.parent.name
-        output_file = csv_file.parent / "human_review.csv"
+    workers = max(1, min(args.workers, len(csv_files)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (
+                csv_file,
+                executor.submit(transform_csv, csv_file, csv_file.parent / "human_review.csv"),
+            )
+            for csv_file in csv_files
+        ]
         
-        try:
-            row_count = transform_csv(csv_file, output_file)
-            log(f"Transformed {app_name}: {row_count} rows -> {output_file.name}")
-            success_count += 1
-        except Exception as e:
-            log(f"Failed to transform {app_name}: {e}", "ERROR")
+        # Report in file order
+        for csv_file, future in futures:
+            app_name = csv_file.parent.name
+            try:
+                row_count = future.result()
+                log(f"Transformed {app_name}: {row_count} rows -> human_review.csv")
+                success_count += 1
+            except Exception as e:
+                log(f"Failed to transform {app_name}: {e}", "ERROR")
     
     log(f"Successfully transformed {success_count}/{len(csv_files)} files")
     return 0 if success_count == len(csv_files) else 1
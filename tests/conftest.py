@@ -0,0 +1,16 @@
+"""Shared pytest configuration."""
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_storage_root(tmp_path_factory):
+    """Keep local storage written by tests out of the repository's data/ folder."""
+    previous = os.environ.get("UW_APP_STORAGE_ROOT")
+    os.environ["UW_APP_STORAGE_ROOT"] = str(tmp_path_factory.mktemp("storage"))
+    yield
+    if previous is None:
+        os.environ.pop("UW_APP_STORAGE_ROOT", None)
+    else:
+        os.environ["UW_APP_STORAGE_ROOT"] = previous
@@ -191,6 +191,22 @@ class TestAnalyzerRouter:
         
         assert "exceeds limit" in str(exc_info.value)
 
+    def test_size_check_ignores_unrecognised_media_type(self, settings):
+        """validate_file_size() should apply no limit to an unrecognised media type."""
+        router = AnalyzerRouter(settings)
+        
+        router.validate_file_size(b"\x00" * (25 * 1024 * 1024), "unknown")
+        router.validate_file_size(b"\x00", "spreadsheet")
+
+    def test_get_analyzer_id_rejects_unrecognised_media_type(self, settings):
+        """get_analyzer_id() should raise for a media type string it does not route."""
+        router = AnalyzerRouter(settings)
+        
+        with pytest.raises(UnsupportedMediaTypeError) as exc_info:
+            router.get_analyzer_id("spreadsheet")
+        
+        assert "Unsupported media type: spreadsheet" in str(exc_info.value)
+
     def test_raises_for_unsupported_type(self, settings):
         """Should raise UnsupportedMediaTypeError for unknown files."""
         router = AnalyzerRouter(settings)
@@ -239,8 +255,16 @@ class TestContentUnderstandingExtensions:
                     "segments": [{
                         "id": 1,
                         "keyframes": [
-                            {"timestamp": "0:00:05", "url": "https://example.com/kf1.jpg", "description": "Impact"},
-                            {"timestamp": "0:00:10", "url": "https://example.com/kf2.jpg", "description": "Aftermath"},
+                            {
+                                "timestamp": "0:00:05",
+                                "url": "https://example.com/kf1.jpg",
+                                "description": "Impact",
+                            },
+                            {
+                                "timestamp": "0:00:10",
+                                "url": "https://example.com/kf2.jpg",
+                                "description": "Aftermath",
+                            },
                         ]
                     }]
                 }]
@@ -283,9 +307,15 @@ class TestContentUnderstandingExtensions:
                 "contents": [{
                     "kind": "audioVisual",
                     "segments": [
-                        {"id": 1, "startTime": "0:00:00", "endTime": "0:00:10", "label": "Pre-incident"},
+                        {
+                            "id": 1, "startTime": "0:00:00", "endTime": "0:00:10",
+                            "label": "Pre-incident",
+                        },
                         {"id": 2, "startTime": "0:00:10", "endTime": "0:00:15", "label": "Impact"},
-                        {"id": 3, "startTime": "0:00:15", "endTime": "0:00:30", "label": "Post-incident"},
+                        {
+                            "id": 3, "startTime": "0:00:15", "endTime": "0:00:30",
+                            "label": "Post-incident",
+                        },
                     ]
                 }]
             }
@@ -8,6 +8,7 @@ Tests cover:
 - Analyzer verification and testing
 - Idempotent deployment
 """
+import logging
 import pytest
 import sys
 from pathlib import Path
@@ -150,6 +151,16 @@ class TestAnalyzerDeployment:
         assert "autoClaimsImageAnalyzer" in configs
         assert "autoClaimsVideoAnalyzer" in configs
 
+    def test_get_analyzer_configs_is_cached_and_read_only(self):
+        """get_analyzer_configs() should return the same read-only mapping each call."""
+        from setup_automotive_analyzers import get_analyzer_configs
+        
+        configs = get_analyzer_configs()
+        
+        assert get_analyzer_configs() is configs
+        with pytest.raises(TypeError):
+            configs["newAnalyzer"] = {}
+
     def test_analyzer_configs_have_required_fields(self):
         """Each analyzer config should have required fields."""
         from setup_automotive_analyzers import get_analyzer_configs
@@ -197,3 +208,253 @@ class TestAnalyzerDeployment:
         """Verification should test each analyzer with sample content."""
         # This test requires Azure connection - skip in unit tests
         pytest.skip("Integration test - requires Azure connection (T035)")
+
+
+class TestAuthHeaders:
+    """Tests for Azure AD token caching."""
+
+    def test_token_reused_until_near_expiry(self, monkeypatch):
+        """get_auth_headers() should only fetch a new token when the cached one is expiring."""
+        import time
+        from types import SimpleNamespace
+        import setup_automotive_analyzers as setup
+
+        calls = []
+
+        class FakeCredential:
+            def get_token(self, scope):
+                calls.append(scope)
+                return SimpleNamespace(token=f"token-{len(calls)}", expires_on=time.time() + 3600)
+
+        monkeypatch.setenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD", "true")
+        monkeypatch.setattr(setup, "_CREDENTIAL", FakeCredential())
+        monkeypatch.setattr(setup, "_TOKEN_CACHE", {"token": None, "expires_on": 0})
+
+        first = setup.get_auth_headers()
+        second = setup.get_auth_headers()
+
+        assert first["Authorization"] == second["Authorization"] == "Bearer token-1"
+        assert len(calls) == 1
+
+        setup._TOKEN_CACHE["expires_on"] = time.time() + 10
+        assert setup.get_auth_headers()["Authorization"] == "Bearer token-2"
+
+    def test_api_key_skips_azure_ad(self, monkeypatch):
+        """get_auth_headers() should use an API key and leave Azure AD alone unless forced."""
+        import setup_automotive_analyzers as setup
+
+        def no_token():
+            raise AssertionError("Azure AD token requested")
+
+        monkeypatch.setenv("AZURE_CONTENT_UNDERSTANDING_API_KEY", "secret")
+        monkeypatch.delenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD", raising=False)
+        monkeypatch.setattr(setup, "_get_azure_ad_token", no_token)
+
+        headers = setup.get_auth_headers()
+
+        assert headers["Ocp-Apim-Subscription-Key"] == "secret"
+        assert "Authorization" not in headers
+
+
+class TestParallelOperations:
+    """Tests for the per-analyzer fan-out in deploy/verify."""
+
+    def test_verify_reports_missing_analyzer(self, monkeypatch, caplog):
+        """verify_all_analyzers() should fail on a missing analyzer and print in config order."""
+        import setup_automotive_analyzers as setup
+
+        def fake_get(analyzer_id):
+            if analyzer_id == "autoClaimsImageAnalyzer":
+                return None
+            return {"analyzerId": analyzer_id}
+
+        monkeypatch.setattr(setup, "get_analyzer", fake_get)
+
+        with caplog.at_level(logging.INFO, logger=setup.logger.name):
+            assert setup.verify_all_analyzers() is False
+
+        output = caplog.text
+        assert output.index("autoClaimsDocAnalyzer") < output.index("autoClaimsImageAnalyzer") \
+            < output.index("autoClaimsVideoAnalyzer")
+        assert "❌ Not found" in output
+
+    def test_deploy_creates_only_missing_analyzers(self, monkeypatch):
+        """deploy_analyzers() should create missing analyzers and skip the rest without a GET."""
+        from types import SimpleNamespace
+        import requests
+        import setup_automotive_analyzers as setup
+
+        created = []
+
+        def fake_create(analyzer_id, config, only_if_absent=False):
+            assert only_if_absent
+            if analyzer_id == "autoClaimsDocAnalyzer":
+                raise requests.exceptions.HTTPError(response=SimpleNamespace(status_code=412))
+            if analyzer_id == "autoClaimsImageAnalyzer":
+                raise requests.exceptions.HTTPError(response=SimpleNamespace(status_code=409))
+            created.append(analyzer_id)
+
+        def no_get(analyzer_id):
+            raise AssertionError("deploy should not probe with GET")
+
+        monkeypatch.setattr(setup, "get_analyzer", no_get)
+        monkeypatch.setattr(setup, "create_analyzer", fake_create)
+
+        assert setup.deploy_analyzers() is True
+        assert created == ["autoClaimsVideoAnalyzer"]
+
+    def test_create_only_if_absent_sends_precondition(self, monkeypatch):
+        """create_analyzer(only_if_absent=True) should send If-None-Match: *."""
+        from types import SimpleNamespace
+        import setup_automotive_analyzers as setup
+
+        sent = {}
+
+        def fake_put(url, headers=None, params=None, data=None, timeout=None):
+            sent.update(headers)
+            return SimpleNamespace(raise_for_status=lambda: None, status_code=201, content=b"")
+
+        monkeypatch.setattr(setup, "get_auth_headers", lambda: {})
+        monkeypatch.setattr(setup._SESSION, "put", fake_put)
+
+        config = setup.get_analyzer_configs()["autoClaimsDocAnalyzer"]
+        setup.create_analyzer("autoClaimsDocAnalyzer", config, only_if_absent=True)
+
+        assert sent["If-None-Match"] == "*"
+
+
+class TestPollOperation:
+    """Tests for operation polling."""
+
+    def test_polls_immediately_then_backs_off(self, monkeypatch):
+        """poll_operation() should check right away and grow the delay between checks."""
+        import json
+        from types import SimpleNamespace
+        import setup_automotive_analyzers as setup
+
+        statuses = iter(["running", "running", "running", "succeeded"])
+        sleeps = []
+
+        def fake_get(url, headers=None, timeout=None):
+            return SimpleNamespace(
+                raise_for_status=lambda: None,
+                content=json.dumps({"status": next(statuses)}).encode(),
+            )
+
+        monkeypatch.setattr(setup._SESSION, "get", fake_get)
+        monkeypatch.setattr(setup.time, "sleep", sleeps.append)
+
+        response = SimpleNamespace(headers={"operation-location": "https://cu/operations/1"})
+        result = setup.poll_operation(response, headers={})
+
+        assert result["status"] == "succeeded"
+        assert len(sleeps) == 3
+        assert sleeps[0] < sleeps[1] < sleeps[2]
+        assert sleeps[0] < 0.5
+
+
+class TestUpdateAnalyzer:
+    """Tests for in-place analyzer updates."""
+
+    def test_update_uses_put_without_delete(self, monkeypatch):
+        """update_analyzer() should replace the analyzer with a single PUT when allowed."""
+        import setup_automotive_analyzers as setup
+
+        calls = []
+
+        def fake_create(analyzer_id, config):
+            calls.append(("put", analyzer_id))
+            return {"status": "succeeded"}
+
+        monkeypatch.setattr(setup, "create_analyzer", fake_create)
+        monkeypatch.setattr(setup, "delete_analyzer", lambda a: calls.append(("delete", a)))
+
+        setup.update_analyzer("autoClaimsDocAnalyzer", {})
+
+        assert calls == [("put", "autoClaimsDocAnalyzer")]
+
+    def test_update_falls_back_to_delete_on_conflict(self, monkeypatch):
+        """update_analyzer() should delete, wait, and recreate when PUT returns 409."""
+        import requests
+        from types import SimpleNamespace
+        import setup_automotive_analyzers as setup
+
+        calls = []
+        lookups = iter([{"analyzerId": "x"}, None])
+
+        def fake_create(analyzer_id, config):
+            calls.append("put")
+            if calls.count("put") == 1:
+                raise requests.exceptions.HTTPError(response=SimpleNamespace(status_code=409))
+            return {"status": "succeeded"}
+
+        monkeypatch.setattr(setup, "create_analyzer", fake_create)
+        monkeypatch.setattr(setup, "delete_analyzer", lambda a: calls.append("delete"))
+        monkeypatch.setattr(setup, "get_analyzer", lambda a: next(lookups))
+        monkeypatch.setattr(setup.time, "sleep", lambda s: None)
+
+        assert setup.update_analyzer("x", {}) == {"status": "succeeded"}
+        assert calls == ["put", "delete", "put"]
+
+
+class TestSchemaValidation:
+    """Tests for local field schema validation."""
+
+    def test_shipped_schemas_are_valid(self):
+        """All analyzer schemas should pass local validation."""
+        from setup_automotive_analyzers import get_analyzer_configs, validate_field_schema
+
+        for analyzer_id, config in get_analyzer_configs().items():
+            assert validate_field_schema(config["fieldSchema"]) == [], analyzer_id
+
+    def test_malformed_schema_is_reported(self):
+        """validate_field_schema() should flag bad types, methods and missing items."""
+        from setup_automotive_analyzers import validate_field_schema
+
+        problems = validate_field_schema({
+            "name": "Bad",
+            "fields": {
+                "A": {"type": "text", "method": "extract"},
+                "B": {"type": "string", "method": "guess"},
+                "C": {"type": "array", "method": "extract"},
+            },
+        })
+
+        assert len(problems) == 3
+
+
+class TestAnalyzerUrl:
+    """Tests for analyzer resource URLs."""
+
+    def test_known_ids_need_no_quoting(self):
+        """The shipped analyzer ids should be URL-safe as they are."""
+        import re
+        from setup_automotive_analyzers import get_analyzer_configs
+
+        for analyzer_id in get_analyzer_configs():
+            assert re.fullmatch(r"[A-Za-z0-9_-]+", analyzer_id)
+
+    def test_id_is_percent_encoded(self, monkeypatch):
+        """_analyzer_url() should encode characters that would change the path."""
+        import setup_automotive_analyzers as setup
+
+        monkeypatch.setattr(setup, "_get_endpoint", lambda: "https://cu.example.com")
+        setup._analyzer_url.cache_clear()
+        try:
+            url = setup._analyzer_url("bad/id?x")
+        finally:
+            setup._analyzer_url.cache_clear()
+
+        assert url == "https://cu.example.com/contentunderstanding/analyzers/bad%2Fid%3Fx"
+
+
+class TestRequestBody:
+    """Tests for the cached PUT bodies."""
+
+    def test_cached_payload_matches_config(self):
+        """Each cached payload should decode to the analyzer config plus its id."""
+        import json
+        from setup_automotive_analyzers import _PAYLOAD_CACHE, get_analyzer_configs
+
+        for analyzer_id, config in get_analyzer_configs().items():
+            assert json.loads(_PAYLOAD_CACHE[analyzer_id]) == {"analyzerId": analyzer_id, **config}
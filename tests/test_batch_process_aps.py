@@ -0,0 +1,168 @@
+"""
+Tests for scripts/batch_process_aps.py
+
+Tests cover:
+- ProgressTracker deferred saves and flush()
+- Sequential and concurrent document processing in run_batch_processing()
+- Ctrl-C during concurrent processing drops documents that have not started
+- Review output folder naming
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for importing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+
+class FakeClient:
+    """Stand-in for WorkbenchAPIClient that reports the backend as online."""
+
+    def __init__(self, base_url, pool_size=10):
+        self.base_url = base_url
+
+    def health_check(self):
+        return True
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    """Import the script with the API client faked and INFO logging silenced."""
+    import batch_process_aps
+
+    monkeypatch.setattr(batch_process_aps, "WorkbenchAPIClient", FakeClient)
+    batch_process_aps.set_quiet(True)
+    yield batch_process_aps
+    batch_process_aps.set_quiet(False)
+
+
+def _make_documents(folder: Path, count: int) -> None:
+    folder.mkdir()
+    for i in range(count):
+        (folder / f"doc{i}.pdf").write_bytes(b"%PDF-1.4")
+
+
+class TestProgressTracker:
+    """Tests for the progress tracking CSV."""
+
+    def test_deferred_updates_persist_on_flush(self, batch, tmp_path):
+        """update(save=False) should only reach disk on flush()."""
+        tracker = batch.ProgressTracker(tmp_path)
+        tracker.update("a.pdf", batch.STATUS_PENDING, save=False)
+        tracker.update("b.pdf", batch.STATUS_ERROR, error_message="boom", save=False)
+
+        assert not tracker.filepath.exists()
+
+        tracker.flush()
+
+        reloaded = batch.ProgressTracker(tmp_path)
+        assert reloaded.get_status("a.pdf") == batch.STATUS_PENDING
+        assert reloaded.get_status("b.pdf") == batch.STATUS_ERROR
+        assert reloaded.get_summary()[batch.STATUS_PENDING] == 1
+        assert reloaded.get_summary()[batch.STATUS_ERROR] == 1
+
+    def test_flush_skips_write_when_clean(self, batch, tmp_path, monkeypatch):
+        """flush() should not rewrite the file when nothing changed since the last save."""
+        tracker = batch.ProgressTracker(tmp_path)
+        tracker.update("a.pdf", batch.STATUS_COMPLETED)
+
+        monkeypatch.setattr(tracker, "_save", lambda: pytest.fail("clean tracker was saved"))
+        tracker.flush()
+
+    def test_summary_follows_status_changes(self, batch, tmp_path):
+        """get_summary() counts should move with each status change."""
+        tracker = batch.ProgressTracker(tmp_path)
+        tracker.update("a.pdf", batch.STATUS_PENDING, save=False)
+        tracker.update("a.pdf", batch.STATUS_COMPLETED, save=False)
+
+        summary = tracker.get_summary()
+        assert summary[batch.STATUS_PENDING] == 0
+        assert summary[batch.STATUS_COMPLETED] == 1
+
+
+class TestRunBatchProcessing:
+    """Tests for the document processing loop."""
+
+    def test_single_worker_processes_in_order_without_pool(self, batch, tmp_path, monkeypatch):
+        """max_workers=1 should process documents one by one on the calling thread."""
+        source = tmp_path / "docs"
+        _make_documents(source, 3)
+        processed = []
+
+        def fake_process(client, doc, tracker, *args):
+            processed.append((doc.name, threading.current_thread() is threading.main_thread()))
+            tracker.update(doc.name, batch.STATUS_COMPLETED)
+            return True
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("max_workers=1 should not create a thread pool")
+
+        monkeypatch.setattr(batch, "process_single_document", fake_process)
+        monkeypatch.setattr(batch, "ThreadPoolExecutor", no_pool)
+
+        exit_code = batch.run_batch_processing(
+            "http://api", source, tmp_path / "out", poll_interval=1, timeout=1, max_workers=1,
+        )
+
+        assert exit_code == 0
+        assert processed == [("doc0.pdf", True), ("doc1.pdf", True), ("doc2.pdf", True)]
+
+    def test_workers_process_every_document(self, batch, tmp_path, monkeypatch):
+        """max_workers > 1 should process every pending document and count failures."""
+        source = tmp_path / "docs"
+        _make_documents(source, 5)
+
+        def fake_process(client, doc, tracker, *args):
+            if doc.name == "doc3.pdf":
+                raise RuntimeError("boom")
+            tracker.update(doc.name, batch.STATUS_COMPLETED)
+            return True
+
+        monkeypatch.setattr(batch, "process_single_document", fake_process)
+
+        exit_code = batch.run_batch_processing(
+            "http://api", source, tmp_path / "out", poll_interval=1, timeout=1, max_workers=3,
+        )
+
+        tracker = batch.ProgressTracker(tmp_path / "out")
+        assert exit_code == 1
+        assert tracker.get_status("doc3.pdf") == batch.STATUS_ERROR
+        assert tracker.get_summary()[batch.STATUS_COMPLETED] == 4
+
+    def test_interrupt_drops_unstarted_documents(self, batch, tmp_path, monkeypatch):
+        """Ctrl-C with workers should cancel queued documents and leave them pending."""
+        source = tmp_path / "docs"
+        _make_documents(source, 8)
+        started = []
+
+        def fake_process(client, doc, tracker, *args):
+            started.append(doc.name)
+            if doc.name == "doc0.pdf":
+                raise KeyboardInterrupt
+            time.sleep(0.2)
+            tracker.update(doc.name, batch.STATUS_COMPLETED)
+            return True
+
+        monkeypatch.setattr(batch, "process_single_document", fake_process)
+
+        with pytest.raises(KeyboardInterrupt):
+            batch.run_batch_processing(
+                "http://api", source, tmp_path / "out", poll_interval=1, timeout=1, max_workers=2,
+            )
+
+        time.sleep(0.5)  # let documents already running finish
+        assert len(started) < 8
+        tracker = batch.ProgressTracker(tmp_path / "out")
+        assert tracker.get_status("doc7.pdf") == batch.STATUS_PENDING
+
+
+class TestReviewOutputFolder:
+    """Tests for the per-document review folder name."""
+
+    @pytest.mark.parametrize("name", ["a.pdf", ".pdf", ".hidden.pdf", "x.tar.pdf", "noext", "a."])
+    def test_document_stem_matches_path_stem(self, batch, name):
+        """_document_stem() should agree with Path.stem for bare file names."""
+        assert batch._document_stem(name) == Path(name).stem
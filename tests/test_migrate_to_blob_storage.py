@@ -0,0 +1,298 @@
+"""
+Tests for scripts/migrate_to_blob_storage.py
+
+Tests cover:
+- _upload_one() skip logic (size + MD5) and error classification
+- _copy_one() skip logic
+- _run_uploads() requeue of files failing with retryable server errors
+- _merge_results() and the small/large upload pool routing in migrate()
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for importing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+pytest.importorskip("azure.storage.blob")
+
+from azure.core.exceptions import HttpResponseError
+
+import migrate_to_blob_storage as migration
+
+
+class FakeBlobClient:
+    """Records upload_blob calls instead of sending them."""
+
+    def __init__(self, uploads, error=None):
+        self.uploads = uploads
+        self.error = error
+
+    def upload_blob(self, data, length=None, overwrite=False, max_concurrency=1,
+                    content_settings=None):
+        if self.error is not None:
+            raise self.error
+        self.uploads.append({
+            "data": data.read(),
+            "max_concurrency": max_concurrency,
+            "content_md5": bytes(content_settings.content_md5),
+        })
+
+
+class FakeContainerClient:
+    """Hands out FakeBlobClients that share one upload log."""
+
+    def __init__(self, error=None):
+        self.uploads = []
+        self.error = error
+
+    def get_blob_client(self, blob_path):
+        return FakeBlobClient(self.uploads, self.error)
+
+
+def _http_error(status_code: int) -> HttpResponseError:
+    error = HttpResponseError(message=f"status {status_code}")
+    error.status_code = status_code
+    return error
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_bytes(b'{"status": "completed"}')
+    return path
+
+
+class TestUploadOne:
+    """Tests for uploading a single file."""
+
+    def test_skips_blob_with_same_size_and_md5(self, local_file):
+        """An unchanged blob (size and MD5 match) should not be uploaded."""
+        container = FakeContainerClient()
+        content = local_file.read_bytes()
+        existing = {"applications/a/metadata.json": (len(content), hashlib.md5(content).digest())}
+
+        result = migration._upload_one(
+            container, str(local_file), "applications/a/metadata.json", len(content), existing,
+        )
+
+        assert result[1] == migration.UPLOAD_SKIPPED
+        assert container.uploads == []
+
+    def test_uploads_blob_without_stored_md5(self, local_file):
+        """A same-size blob with no MD5 should be uploaded again and get its MD5 stored."""
+        container = FakeContainerClient()
+        content = local_file.read_bytes()
+        existing = {"applications/a/metadata.json": (len(content), None)}
+
+        result = migration._upload_one(
+            container, str(local_file), "applications/a/metadata.json", len(content), existing,
+        )
+
+        assert result[1] == migration.UPLOAD_OK
+        assert container.uploads[0]["data"] == content
+        assert container.uploads[0]["content_md5"] == hashlib.md5(content).digest()
+
+    def test_uploads_same_size_blob_with_different_md5(self, local_file):
+        """An edited file of the same length should be uploaded."""
+        container = FakeContainerClient()
+        content = local_file.read_bytes()
+        stale_md5 = hashlib.md5(b"other").digest()
+        existing = {"applications/a/metadata.json": (len(content), stale_md5)}
+
+        result = migration._upload_one(
+            container, str(local_file), "applications/a/metadata.json", len(content), existing,
+        )
+
+        assert result[1] == migration.UPLOAD_OK
+        assert len(container.uploads) == 1
+
+    def test_small_file_is_sent_as_single_put(self, local_file):
+        """Files up to single_put_size should upload on one connection."""
+        container = FakeContainerClient()
+        size = local_file.stat().st_size
+
+        migration._upload_one(container, str(local_file), "applications/a/metadata.json", size, {})
+
+        assert container.uploads[0]["max_concurrency"] == 1
+
+    @pytest.mark.parametrize("status_code, expected", [
+        (500, migration.UPLOAD_RETRY),
+        (503, migration.UPLOAD_RETRY),
+        (400, migration.UPLOAD_FAILED),
+    ])
+    def test_classifies_server_errors(self, local_file, status_code, expected):
+        """500/503 should be reported as retryable; other HTTP errors as failed."""
+        container = FakeContainerClient(error=_http_error(status_code))
+        size = local_file.stat().st_size
+
+        result = migration._upload_one(
+            container, str(local_file), "applications/a/x.json", size, {},
+        )
+
+        assert result[1] == expected
+        assert result[3]
+
+
+class FakeCopyContainerClient:
+    """Hands out blob clients whose server-side copies finish at once."""
+
+    def __init__(self):
+        self.copies = []
+
+    def get_blob_client(self, blob_path):
+        copies = self.copies
+
+        class CopyClient:
+            def start_copy_from_url(self, source_url):
+                copies.append(blob_path)
+                return {"copy_status": "success"}
+
+        return CopyClient()
+
+
+class TestCopyOne:
+    """Tests for server-side copies."""
+
+    @pytest.mark.parametrize("remote_md5, source_md5, copied", [
+        (b"same", b"same", False),
+        (b"old", b"new", True),
+        (None, b"new", True),
+        (b"old", None, True),
+        (None, None, True),
+    ])
+    def test_skips_only_when_both_md5s_match(self, remote_md5, source_md5, copied):
+        """An existing blob is skipped only when both digests are known and equal."""
+        container = FakeCopyContainerClient()
+        existing = {"applications/a/x.json": (10, remote_md5)}
+
+        result = migration._copy_one(
+            container, "https://src/applications/a/x.json", "applications/a/x.json", 10,
+            existing, source_md5s={"applications/a/x.json": source_md5},
+        )
+
+        assert result[1] == (migration.UPLOAD_OK if copied else migration.UPLOAD_SKIPPED)
+        assert container.copies == (["applications/a/x.json"] if copied else [])
+
+
+class TestRunUploads:
+    """Tests for the upload work queue."""
+
+    def test_requeues_retryable_failures(self):
+        """A file failing with a retryable error should be retried, then reported once."""
+        calls = {}
+
+        def transfer(container_client, local_path, blob_path, file_size, existing_blobs):
+            calls[blob_path] = calls.get(blob_path, 0) + 1
+            if blob_path == "flaky" and calls[blob_path] == 1:
+                return blob_path, migration.UPLOAD_RETRY, file_size, "503"
+            return blob_path, migration.UPLOAD_OK, file_size, None
+
+        files = [("/tmp/flaky", "flaky", 1), ("/tmp/steady", "steady", 2)]
+        results = list(migration._run_uploads(None, files, {}, 2, transfer, prefetch=False))
+
+        assert sorted(results) == [
+            ("flaky", migration.UPLOAD_OK, 1, None),
+            ("steady", migration.UPLOAD_OK, 2, None),
+        ]
+        assert calls == {"flaky": 2, "steady": 1}
+
+    def test_gives_up_after_max_attempts(self):
+        """A file that keeps failing with a retryable error should fail after MAX_FILE_ATTEMPTS."""
+        calls = []
+
+        def transfer(container_client, local_path, blob_path, file_size, existing_blobs):
+            calls.append(blob_path)
+            return blob_path, migration.UPLOAD_RETRY, file_size, "500"
+
+        results = list(migration._run_uploads(
+            None, [("/tmp/bad", "bad", 1)], {}, 1, transfer, prefetch=False,
+        ))
+
+        assert results == [("bad", migration.UPLOAD_FAILED, 1, "500")]
+        assert len(calls) == migration.MAX_FILE_ATTEMPTS
+
+    def test_does_not_requeue_permanent_failures(self):
+        """Non-retryable failures should be reported on the first attempt."""
+        calls = []
+
+        def transfer(container_client, local_path, blob_path, file_size, existing_blobs):
+            calls.append(blob_path)
+            return blob_path, migration.UPLOAD_FAILED, file_size, "400"
+
+        results = list(migration._run_uploads(
+            None, [("/tmp/bad", "bad", 1)], {}, 1, transfer, prefetch=False,
+        ))
+
+        assert results == [("bad", migration.UPLOAD_FAILED, 1, "400")]
+        assert calls == ["bad"]
+
+
+class TestUploadPools:
+    """Tests for running the small- and large-file pools together."""
+
+    def test_merge_results_yields_every_result(self):
+        """_merge_results() should yield all results from every source."""
+        merged = migration._merge_results(
+            iter([("a", migration.UPLOAD_OK, 1, None)]),
+            iter([("b", migration.UPLOAD_OK, 2, None), ("c", migration.UPLOAD_SKIPPED, 3, None)]),
+        )
+
+        assert sorted(result[0] for result in merged) == ["a", "b", "c"]
+
+    def test_merge_results_reraises_source_errors(self):
+        """An exception inside a source should surface to the consumer."""
+        def failing():
+            yield ("a", migration.UPLOAD_OK, 1, None)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(migration._merge_results(failing()))
+
+    def test_only_chunked_files_use_large_pool(self, tmp_path, monkeypatch, capsys):
+        """Files over single_put_size go to the large pool; the rest to the main pool."""
+        app_dir = tmp_path / "applications" / "app1"
+        app_dir.mkdir(parents=True)
+        (app_dir / "small.json").write_bytes(b"x" * 10)
+        (app_dir / "edge.json").write_bytes(b"x" * 64)
+        (app_dir / "big.pdf").write_bytes(b"x" * 65)
+        pools = []
+
+        def fake_run_uploads(container_client, files, existing_blobs, workers, transfer,
+                             prefetch=True):
+            pools.append((sorted(Path(f[0]).name for f in files), workers))
+            return iter([(f[1], migration.UPLOAD_OK, f[2], None) for f in files])
+
+        monkeypatch.setattr(migration, "_run_uploads", fake_run_uploads)
+
+        stats = migration.migrate(
+            None, tmp_path, skip_existing=False, parallelism=16, single_put_size=64,
+        )
+
+        assert pools == [
+            (["edge.json", "small.json"], 16),
+            (["big.pdf"], migration.LARGE_FILE_WORKERS),
+        ]
+        assert stats.files_uploaded == 3
+
+    def test_staged_files_use_large_pool(self, tmp_path, monkeypatch, capsys):
+        """Files over STAGED_UPLOAD_THRESHOLD go to the large pool even under single_put_size."""
+        app_dir = tmp_path / "applications" / "app1"
+        app_dir.mkdir(parents=True)
+        (app_dir / "small.json").write_bytes(b"x" * 10)
+        (app_dir / "staged.pdf").write_bytes(b"x" * 40)
+        pools = []
+
+        def fake_run_uploads(container_client, files, existing_blobs, workers, transfer,
+                             prefetch=True):
+            pools.append(sorted(Path(f[0]).name for f in files))
+            return iter([(f[1], migration.UPLOAD_OK, f[2], None) for f in files])
+
+        monkeypatch.setattr(migration, "_run_uploads", fake_run_uploads)
+        monkeypatch.setattr(migration, "STAGED_UPLOAD_THRESHOLD", 32)
+
+        migration.migrate(None, tmp_path, skip_existing=False, parallelism=16, single_put_size=64)
+
+        assert pools == [["small.json"], ["staged.pdf"]]
@@ -10,7 +10,7 @@ Tests cover:
 """
 import pytest
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 
 class TestMortgageAnalyzerSchema:
@@ -149,10 +149,9 @@ class TestAnalyzerDeployment:
 
     def test_create_analyzer_idempotent(self, mock_cu_client):
         """create_analyzer should be idempotent (no-op if exists)."""
-        try:
-            from scripts.setup_mortgage_analyzers import create_analyzer
-        except ImportError:
-            pytest.skip("setup_mortgage_analyzers.py not yet created")
+        pytest.importorskip(
+            "scripts.setup_mortgage_analyzers", reason="setup_mortgage_analyzers.py not yet created"
+        )
         
         # Mock the client to return existing analyzer
         mock_cu_client.get_analyzer.return_value = {"analyzerId": "mortgageDocAnalyzer"}
@@ -162,17 +161,241 @@ class TestAnalyzerDeployment:
 
     def test_get_analyzer_returns_schema(self, mock_cu_client):
         """get_analyzer should return analyzer definition if exists."""
-        try:
-            from scripts.setup_mortgage_analyzers import get_analyzer
-        except ImportError:
-            pytest.skip("setup_mortgage_analyzers.py not yet created")
+        pytest.importorskip(
+            "scripts.setup_mortgage_analyzers", reason="setup_mortgage_analyzers.py not yet created"
+        )
 
     def test_update_analyzer_updates_schema(self, mock_cu_client):
         """update_analyzer should update existing analyzer schema."""
+        pytest.importorskip(
+            "scripts.setup_mortgage_analyzers", reason="setup_mortgage_analyzers.py not yet created"
+        )
+
+
+class TestFieldAliases:
+    """Tests for output-side field aliases."""
+
+    def test_aliases_point_at_extracted_fields(self):
+        """Aliases should not be extracted themselves and should resolve to real fields."""
+        from scripts.setup_mortgage_analyzers import FIELD_ALIASES, MORTGAGE_DOC_FIELD_SCHEMA
+
+        fields = MORTGAGE_DOC_FIELD_SCHEMA["fields"]
+        for alias, target in FIELD_ALIASES.items():
+            assert alias not in fields
+            assert target in fields
+
+
+class TestRequestBody:
+    """Tests for the cached PUT body."""
+
+    def test_cached_body_matches_definition(self):
+        """The cached body should decode to the analyzer definition and match the field count."""
+        import json
+        from scripts.setup_mortgage_analyzers import (
+            _CREATE_BODY_CACHE,
+            MORTGAGE_DOC_ANALYZER_SCHEMA,
+            MORTGAGE_DOC_FIELD_COUNT,
+        )
+
+        body = json.loads(_CREATE_BODY_CACHE["mortgageDocAnalyzer"])
+
+        assert body == {"analyzerId": "mortgageDocAnalyzer", **MORTGAGE_DOC_ANALYZER_SCHEMA}
+        assert len(body["fieldSchema"]["fields"]) == MORTGAGE_DOC_FIELD_COUNT
+
+    def test_fields_are_read_only(self):
+        """The field schema should not be mutable after import."""
+        from scripts.setup_mortgage_analyzers import MORTGAGE_DOC_FIELD_SCHEMA
+
+        with pytest.raises(TypeError):
+            MORTGAGE_DOC_FIELD_SCHEMA["fields"]["Extra"] = {"type": "string"}
+
+
+class TestAuthHeaders:
+    """Tests for Azure AD token caching."""
+
+    def test_token_reused_until_near_expiry(self, monkeypatch):
+        """get_auth_headers() should only fetch a new token when the cached one is expiring."""
+        import time
+        from types import SimpleNamespace
+        import scripts.setup_mortgage_analyzers as setup
+
+        calls = []
+
+        class FakeCredential:
+            def get_token(self, scope):
+                calls.append(scope)
+                return SimpleNamespace(token=f"token-{len(calls)}", expires_on=time.time() + 3600)
+
+        monkeypatch.setenv("AZURE_CONTENT_UNDERSTANDING_USE_AZURE_AD", "true")
+        monkeypatch.setattr(setup, "_get_credential", lambda: FakeCredential())
+        monkeypatch.setattr(setup, "_TOKEN_CACHE", {"token": None, "expires_on": 0})
+
+        first = setup.get_auth_headers()
+        second = setup.get_auth_headers()
+
+        assert first["Authorization"] == second["Authorization"] == "Bearer token-1"
+        assert len(calls) == 1
+
+        setup._TOKEN_CACHE["expires_on"] = time.time() + 10
+        assert setup.get_auth_headers()["Authorization"] == "Bearer token-2"
+
+    def test_concurrent_callers_fetch_one_token(self, monkeypatch):
+        """Worker threads asking for a token at once should share a single fetch."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from types import SimpleNamespace
+
+        import scripts.setup_mortgage_analyzers as setup
+
+        calls = []
+
+        class SlowCredential:
+            def get_token(self, scope):
+                calls.append(scope)
+                time.sleep(0.05)
+                return SimpleNamespace(token="token", expires_on=time.time() + 3600)
+
+        monkeypatch.setattr(setup, "_get_credential", lambda: SlowCredential())
+        monkeypatch.setattr(setup, "_TOKEN_CACHE", {"token": None, "expires_on": 0})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: setup._get_azure_ad_token(), range(8)))
+
+        assert tokens == ["token"] * 8
+        assert len(calls) == 1
+
+
+class TestPollOperation:
+    """Tests for operation polling."""
+
+    def test_backs_off_and_honours_retry_after(self, monkeypatch):
+        """poll_operation() should grow its delay and use Retry-After when the service sends it."""
+        import json
+        from types import SimpleNamespace
+        import scripts.setup_mortgage_analyzers as setup
+
+        polls = iter([
+            ({"status": "running"}, {}),
+            ({"status": "running"}, {}),
+            ({"status": "running"}, {"Retry-After": "7"}),
+            ({"status": "succeeded", "result": {"ok": True}}, {}),
+        ])
+        sleeps = []
+
+        def fake_send(request, **kwargs):
+            assert request.url == "https://cu/operations/1"
+            data, response_headers = next(polls)
+            return SimpleNamespace(
+                raise_for_status=lambda: None,
+                content=json.dumps(data).encode(),
+                headers=response_headers,
+            )
+
+        monkeypatch.setattr(setup._SESSION, "send", fake_send)
+        monkeypatch.setattr(setup.time, "sleep", sleeps.append)
+
+        response = SimpleNamespace(headers={"Operation-Location": "https://cu/operations/1"})
+        assert setup.poll_operation(response, headers={}) == {"ok": True}
+        assert sleeps[0] < sleeps[1]
+        assert sleeps[2] == 7
+
+
+class TestPerAnalyzerOperations:
+    """Tests for the per-analyzer fan-out used by the CLI."""
+
+    def test_setup_creates_missing_and_reports_in_order(self, monkeypatch, capsys):
+        """_run_per_analyzer(_setup_one) should create missing analyzers and print each block."""
+        import scripts.setup_mortgage_analyzers as setup
+
+        created = []
+        monkeypatch.setattr(setup, "get_analyzer", lambda analyzer_id: None)
+        monkeypatch.setattr(
+            setup, "create_analyzer", lambda analyzer_id, config: created.append(analyzer_id),
+        )
+
+        assert setup._run_per_analyzer(setup._setup_one, False) is True
+        assert created == list(setup.ANALYZER_CONFIGS)
+        assert "✓ mortgageDocAnalyzer ready" in capsys.readouterr().out
+
+    def test_head_analyzer_skips_body(self, monkeypatch):
+        """head_analyzer() should answer from the status code and fall back to GET on 405."""
+        from types import SimpleNamespace
+        import scripts.setup_mortgage_analyzers as setup
+
+        statuses = iter([200, 404, 405])
+        monkeypatch.setattr(setup, "_get_endpoint", lambda: "https://cu.example.com")
+        monkeypatch.setattr(setup, "get_auth_headers", lambda: {})
+        monkeypatch.setattr(
+            setup._SESSION, "head",
+            lambda url, headers=None, params=None, timeout=None: SimpleNamespace(
+                status_code=next(statuses), raise_for_status=lambda: None,
+            ),
+        )
+        monkeypatch.setattr(setup, "get_analyzer", lambda analyzer_id: {"analyzerId": analyzer_id})
+        setup._analyzer_url.cache_clear()
+
         try:
-            from scripts.setup_mortgage_analyzers import update_analyzer
-        except ImportError:
-            pytest.skip("setup_mortgage_analyzers.py not yet created")
+            assert setup.head_analyzer("mortgageDocAnalyzer") is True
+            assert setup.head_analyzer("mortgageDocAnalyzer") is False
+            assert setup.head_analyzer("mortgageDocAnalyzer") is True
+        finally:
+            setup._analyzer_url.cache_clear()
+
+    def test_force_skips_unchanged_analyzer(self, monkeypatch):
+        """_setup_one(force=True) should not rewrite an analyzer that already matches."""
+        import json
+        import scripts.setup_mortgage_analyzers as setup
+
+        config = setup.ANALYZER_CONFIGS["mortgageDocAnalyzer"]
+        deployed = json.loads(setup._CREATE_BODY_CACHE["mortgageDocAnalyzer"])
+        deployed["status"] = "ready"
+        deployed["config"]["disableContentFiltering"] = False
+
+        monkeypatch.setattr(setup, "get_analyzer", lambda analyzer_id: deployed)
+        monkeypatch.setattr(
+            setup, "update_analyzer", lambda *args: pytest.fail("unchanged analyzer was updated"),
+        )
+
+        ok, lines = setup._setup_one("mortgageDocAnalyzer", config, True)
+        assert ok
+        assert "up to date" in lines[0]
+
+        del deployed["fieldSchema"]["fields"]["DocumentType"]
+        assert not setup.is_up_to_date("mortgageDocAnalyzer", deployed, config)
+
+    def test_update_replaces_in_place(self, monkeypatch):
+        """update_analyzer() should PUT over the analyzer instead of deleting it first."""
+        import scripts.setup_mortgage_analyzers as setup
+
+        calls = []
+        monkeypatch.setattr(
+            setup, "create_analyzer", lambda analyzer_id, config: calls.append("put") or {},
+        )
+        monkeypatch.setattr(setup, "delete_analyzer", lambda analyzer_id: calls.append("delete"))
+
+        setup.update_analyzer("mortgageDocAnalyzer", setup.ANALYZER_CONFIGS["mortgageDocAnalyzer"])
+        assert calls == ["put"]
+
+    def test_id_is_percent_encoded(self, monkeypatch):
+        """_analyzer_url() should encode characters that would change the path."""
+        import scripts.setup_mortgage_analyzers as setup
+
+        monkeypatch.setattr(setup, "_get_endpoint", lambda: "https://cu.example.com")
+        setup._analyzer_url.cache_clear()
+        try:
+            url = setup._analyzer_url("bad/id?x")
+        finally:
+            setup._analyzer_url.cache_clear()
+
+        assert url == "https://cu.example.com/contentunderstanding/analyzers/bad%2Fid%3Fx"
+
+    def test_verify_fails_when_missing(self, monkeypatch):
+        """_run_per_analyzer(_verify_one) should fail if an analyzer is missing."""
+        import scripts.setup_mortgage_analyzers as setup
+
+        monkeypatch.setattr(setup, "get_analyzer", lambda analyzer_id: None)
+
+        assert setup._run_per_analyzer(setup._verify_one) is False
 
 
 class TestAnalyzerVerification:
@@ -0,0 +1,99 @@
+"""
+Tests for scripts/transform_review_csv.py
+
+Tests cover:
+- Streaming review_rows() output matches the original transform on a fixture CSV
+- transform_csv() writes the same file the original transform wrote
+- Value flattening edge cases (caps, display names, type dispatch)
+"""
+import csv
+import sys
+from pathlib import Path
+
+# Add scripts to path for importing
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SAMPLE_INPUT = FIXTURES / "review_output_sample.csv"
+# Written by the transform as it was before the streaming/tuple-row rewrite
+EXPECTED_OUTPUT = FIXTURES / "human_review_expected.csv"
+
+
+def _read_rows(path: Path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+class TestReviewRows:
+    """Tests for the streaming row generator."""
+
+    def test_rows_match_original_transform(self):
+        """review_rows() should yield exactly the rows the original transform wrote."""
+        from transform_review_csv import ROW_SCHEMA, review_rows
+
+        expected = _read_rows(EXPECTED_OUTPUT)
+        with open(SAMPLE_INPUT, newline="", encoding="utf-8") as f:
+            rows = [list(row) for row in review_rows(csv.DictReader(f))]
+
+        assert list(ROW_SCHEMA) == expected[0]
+        assert rows == expected[1:]
+
+    def test_rows_have_schema_width(self):
+        """Every row should carry one value per output column."""
+        from transform_review_csv import ROW_SCHEMA, review_rows
+
+        with open(SAMPLE_INPUT, newline="", encoding="utf-8") as f:
+            widths = {len(row) for row in review_rows(csv.DictReader(f))}
+
+        assert widths == {len(ROW_SCHEMA)}
+
+
+class TestTransformCsv:
+    """Tests for the file-to-file transform."""
+
+    def test_output_file_matches_original_transform(self, tmp_path):
+        """transform_csv() should write a byte-identical file and return its row count."""
+        from transform_review_csv import transform_csv
+
+        output_path = tmp_path / "human_review.csv"
+        row_count = transform_csv(SAMPLE_INPUT, output_path)
+
+        assert output_path.read_bytes() == EXPECTED_OUTPUT.read_bytes()
+        assert row_count == len(_read_rows(EXPECTED_OUTPUT)) - 1
+
+
+class TestValueFlattening:
+    """Tests for the value helpers behind the row generators."""
+
+    def test_extract_simple_value_caps_each_level(self):
+        """Nested items keep their own 100-character cap inside the outer cap."""
+        from transform_review_csv import extract_simple_value
+
+        assert extract_simple_value("x" * 600) == "x" * 500
+        assert extract_simple_value(["y" * 150, "z"]) == "y" * 100 + " | z"
+        assert extract_simple_value({"valueString": "abc"}) == "abc"
+
+    def test_display_name_title_cases_snake_case(self):
+        """_display_name() should title-case snake_case names and leave blanks empty."""
+        from transform_review_csv import _display_name
+
+        assert _display_name("medical_summary") == "Medical Summary"
+        assert _display_name("") == ""
+
+    def test_unhandled_types_use_fallback(self):
+        """Types outside the dispatch table (e.g. tuples) should flatten to one row."""
+        from transform_review_csv import flatten_extracted_field
+
+        rows = list(flatten_extracted_field("PyTuple", "(1, 2)", "", "", ""))
+
+        assert len(rows) == 1
+        assert rows[0][3] == "(1, 2)"
+
+    def test_parsed_values_are_not_shared(self):
+        """Parsing the same cell twice should return independent objects."""
+        from transform_review_csv import safe_parse_json_or_python
+
+        first = safe_parse_json_or_python('{"a": [1]}')
+        first["a"].append(2)
+
+        assert safe_parse_json_or_python('{"a": [1]}') == {"a": [1]}